@@ -3,36 +3,43 @@
 # File: alien_bullet.py contains all alien bullet behavior for Alien Invasion.
 
 import pygame
-from pygame.sprite import Sprite
 
-"""This class manages all alien bullet behavior for Alien Invasion."""
-class AlienBullet(Sprite):
+"""This class manages all alien bullet behavior for Alien Invasion.
 
-    """Initialize alien bullet object at an alien's current position."""
-    def __init__(self, game, alien):
+Alien bullets are kept in a Pool and reused, so they use __slots__ instead
+of being sprites."""
+class AlienBullet:
+
+    __slots__ = ("settings", "color", "rect", "y", "previous_position")
+
+    """Initialize an unused alien bullet object."""
+    def __init__(self, game):
 
-        super().__init__()
-        self.screen = game.screen
         self.settings = game.settings
         self.color = self.settings.alien_bullet_color
 
-        # Create alien bullet sprite at top-left of screen (0, 0)
+        # Create alien bullet rect at top-left of screen (0, 0)
         self.rect = pygame.Rect(0, 0, self.settings.bullet_width,
             self.settings.bullet_height)
+        self.y = 0.0
+        self.previous_position = (0, 0)
+
+    """Fire the alien bullet from an alien's current rect."""
+    def fire(self, alien_rect):
 
         # Set alien bullet position to middle-bottom of alien ship
-        self.rect.midtop = alien.rect.midbottom
+        self.rect.midtop = alien_rect.midbottom
 
         # Store alien bullet position as float for more precise control
         self.y = float(self.rect.y)
+        self.previous_position = self.rect.topleft
 
     """Move the alien bullet down the screen."""
-    def update(self):
+    def update(self, dt):
 
-        # Update alien bullet position (increase the y-coordinate)
-        self.y += self.settings.bullet_speed
-        self.rect.y = self.y
+        # Remember last position so the bullet can be drawn between ticks
+        self.previous_position = self.rect.topleft
 
-    """Draw the alien bullet's new position to the screen."""
-    def draw_bullet(self):
-        pygame.draw.rect(self.screen, self.color, self.rect)
\ No newline at end of file
+        # Update alien bullet position (increase the y-coordinate)
+        self.y += self.settings.bullet_speed * dt
+        self.rect.y = self.y
\ No newline at end of file
@@ -2,238 +2,302 @@
 # Date: August 3rd, 2023
 # File: alien_invasion.py contains everything related to running the game.
 
-import sys, pygame
-from pygame import mixer
-from random import choice
+# Time the game was launched, to measure startup time from
+from time import perf_counter
+launch_time = perf_counter()
+
+import argparse, sys, pygame
 
 from settings import Settings
-from game_stats import GameStats
-from scoreboard import Scoreboard
-from button import Button
-from text_box import TextBox
-from ship import Ship
-from bullet import Bullet
-from alien import Alien
-from alien_bullet import AlienBullet
-from explosion import Explosion
-import block
-
-"""This class manages game assets and behavior."""
+from audio import AudioManager
+from assets import AssetLoader, decode_image
+from alien import alien_images
+from explosion import explosion_image, load_frames
+from simulation import Simulation, MOVE_LEFT, MOVE_RIGHT, FIRE
+from renderer import Renderer
+from particles import ParticleSystem
+from profiler import FrameProfiler
+
+"""This class connects the game simulation to the window, keyboard and audio."""
 class AlienInvasion:
 
     """Initialize game and create resources."""
-    def __init__(self):
+    def __init__(self, audio=True, recorder=None, profiler=None,
+            settings=None, show_startup_time=False, spectator_address=None):
 
-        pygame.init()
+        # Store game settings
+        self.settings = settings or Settings()
 
-        # Initialize mixer and load audio files
-        mixer.init()
-        self.load_sounds()
+        # Initialize mixer (if enabled), before pygame.init() starts the
+        # mixer with its default settings
+        self.audio = None
+        if audio:
+            self.audio = AudioManager(self.settings)
 
+        pygame.init()
         self.clock = pygame.time.Clock()
 
-        # Store game settings
-        self.settings = Settings()
+        # Create game window before the simulation loads any sprite images,
+        # so every image gets converted to the window's pixel format
+        self.renderer = Renderer(self.settings)
+
+        # Only queue the events the game handles, so mouse motion and other
+        # unused events don't pile up and get looped over every frame
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+            pygame.MOUSEBUTTONDOWN, pygame.WINDOWEXPOSED])
+
+        # Create game simulation and attach the renderer to it
+        self.sim = Simulation(self.settings)
+        self.renderer.attach(self.sim)
+
+        # Create debris particles for the renderer to draw over the game
+        self.particles = ParticleSystem(self.settings)
+        self.renderer.particles = self.particles
+
+        # Share one frame profiler between the game loop, simulation and
+        # renderer (F3 turns it on and off)
+        self.profiler = profiler or FrameProfiler()
+        self.sim.profiler = self.profiler
+        self.renderer.profiler = self.profiler
+
+        # Stream every tick to spectators (if an address is given)
+        self.server = None
+        if spectator_address:
+            from spectator import SpectatorServer
+            self.server = SpectatorServer(self.sim, spectator_address)
+
+        # Load music, sound effects and gameplay sprites in the background
+        # while the menu is shown
+        self.loader = AssetLoader()
+        if self.audio:
+            self.load_sounds()
+        for path in alien_images + [explosion_image]:
+            self.loader.add(decode_image, path)
+        self.loader.start()
+        self.assets_ready = False
+
+        # Track how long the game took to show the menu
+        self.show_startup_time = show_startup_time
+        self.menu_shown_time = None
+
+        # Create variables to track movement and fire keys being held
+        self.moving_left = False
+        self.moving_right = False
+        self.holding_fire = False
 
-        # Create game window with dimensions from settings.py
-        self.screen = pygame.display.set_mode((
-            self.settings.screen_width, self.settings.screen_height))
-        self.background = pygame.image.load("../images/background/background.png")
-        pygame.display.set_caption("Alien Invasion")
+        # Create variable to catch fire presses released before the next tick
+        self.fire_pressed = False
 
-        # Store game stats and scorekeeping info
-        self.stats = GameStats(self)
-        self.scoreboard = Scoreboard(self)
+        # Recorder to save each round's input to (if recording)
+        self.recorder = recorder
 
-        # Create a sprite group to contain the player ship
-        self.ship = Ship(self)
-        self.ship_group = pygame.sprite.Group()
+        # Recorded rounds still to play back and the input of the one being
+        # played back instead of the keyboard (if replaying), and how many
+        # times faster than real time to play them back
+        self.replay_rounds = None
+        self.replay_actions = None
+        self.speed = 1.0
 
-        # Create sprite groups to contain active bullets and alien bullets
-        self.bullets = pygame.sprite.Group()
-        self.alien_bullets = pygame.sprite.Group()
+    """Run main game loop.
 
-        # Create a sprite group to contain all blocks
-        self.shape = block.shape
-        self.block_size = 8
-        self.blocks = pygame.sprite.Group()
-        self.create_multiple_blocks(0, 680)
+    The simulation advances in fixed ticks while frames are drawn as often as
+    max_fps allows, so dropped frames never slow down the game."""
+    def run_game(self):
 
-        # Create a sprite group to contain active aliens
-        self.aliens = pygame.sprite.Group()
+        # Time (in seconds) the simulation still has to catch up on
+        accumulator = 0.0
 
-        # Create a sprite group to contain explosions
-        self.explosions = pygame.sprite.Group()
+        while True:
 
-        # Create custom event for firing alien bullets
-        self.alien_bullet_event = pygame.USEREVENT + 1
+            # Measure the previous frame, ignoring long hitches so the
+            # simulation doesn't spiral trying to catch up
+            frame_time = self.clock.tick(self.settings.max_fps) / 1000
+            accumulator += (min(frame_time, self.settings.max_frame_time)
+                * self.speed)
+            self.profiler.mark("idle")
+            self.profiler.end_frame()
 
-        # Game starts from inactive state
-        self.game_active = False
+            # Check for player input
+            self.check_events()
+            self.profiler.mark("events")
+
+            # Update game element positions once per elapsed tick
+            while accumulator >= self.sim.dt:
+
+                game_was_active = self.sim.game_active
+                actions = self.get_actions()
+                self.sim.step(actions)
+                self.profiler.mark("sim")
+                if self.server:
+                    self.server.send_tick()
+                self.fire_pressed = False
+                self.queue_sounds()
+                self.update_particles()
+                accumulator -= self.sim.dt
+
+                # Record input for every tick of the round (if recording)
+                if self.recorder and game_was_active:
+                    self.recorder.record(actions)
+
+                # Game over, show mouse cursor for menu options
+                if game_was_active and not self.sim.game_active:
+
+                    pygame.mouse.set_visible(True)
+                    if self.recorder:
+                        self.recorder.save(self.sim.stats)
+
+                    # Go on to the next recorded round (if replaying)
+                    if self.replay_rounds:
+                        self.start_replay_round()
+
+            # Play each sound triggered this frame once
+            if self.audio:
+                self.audio.play_queued()
+            self.profiler.mark("audio")
+
+            # Draw new screen between the last two ticks' positions
+            self.renderer.draw(accumulator / self.sim.dt)
+
+            # Note when the menu first appears, and finish loading once the
+            # background loading is done
+            if self.menu_shown_time is None:
+                self.menu_shown_time = perf_counter()
+            if not self.assets_ready and self.loader.is_done():
+                self.finish_loading()
 
-        # Create variable to track whether fire button is being held
-        self.holding_fire = False
+    """Start new round of Alien Invasion."""
+    def start_round(self, mode, alien_firing_speed, seed=None):
 
-        # Create variable to update time for latest fired bullet
-        self.latest_fired_bullet = 0
-        
-        # Create variable to track delay between auto-fired bullets
-        self.firing_delay = 200
+        # Gameplay assets have to be loaded before the round starts
+        self.finish_loading()
 
-        # Create variable to briefly pause the game after losing a life
-        self.pause_game = False
+        # Hide mouse cursor
+        pygame.mouse.set_visible(False)
 
-        # Create variable to keep rendering the player ship when an alien
-        # reaches the bottom of the screen
-        self.alien_at_bottom = False
+        self.sim.start_round(mode, alien_firing_speed, seed)
+        self.particles.clear()
 
-        # Create all menu buttons and text boxes
-        self.create_menu_ui()
+        # Redraw the whole screen for the new round
+        self.renderer.full_redraw = True
 
-    """Run main game loop."""
-    def run_game(self):
+        # Start recording the new round's input (if recording)
+        if self.recorder:
+            self.recorder.start(mode, alien_firing_speed, self.sim.seed,
+                self.settings.stress_scales)
 
-        while True:
+    """Play back recorded (header, actions) rounds one after another in the
+    game window at the given speed."""
+    def watch_replay(self, rounds, speed=1.0):
 
-            # Check for player input
-            self.check_events()
+        self.replay_rounds = iter(rounds)
+        self.speed = speed
+        self.start_replay_round()
+        self.run_game()
 
-            # Fire bullets at steady rate when fire button is being held
-            if self.holding_fire:
-                self.auto_fire_bullet()
+    """Start playing back the next recorded round, if there's one left."""
+    def start_replay_round(self):
 
-            # If player has ships remaining
-            if self.game_active:
+        header, actions = next(self.replay_rounds, (None, None))
+        if header is None:
+            self.replay_rounds = None
+            return
 
-                # Update game element positions
-                self.ship.update()
-                self.update_bullets()
-                self.update_aliens()
+        self.replay_actions = iter(actions)
+        self.start_round(header["mode"], header["alien_firing_speed"],
+            header["seed"])
 
-            # Draw new screen with current game element positions
-            self.update_screen()
+    """Wait for background loading to finish, then start the music."""
+    def finish_loading(self):
 
-            # Game runs at 60 frames per second
-            self.clock.tick(60)
+        if self.assets_ready:
+            return
 
-    """Start new round of Alien Invasion."""
-    def start_round(self, mode, alien_firing_speed):
+        self.loader.wait()
+        self.assets_ready = True
 
-        # Hide mouse cursor
-        pygame.mouse.set_visible(False)
+        # Make the explosion animation before any explosion needs it
+        load_frames()
+
+        # Loop music indefinitely
+        if self.audio:
+            self.audio.play_music()
+
+        if self.show_startup_time:
+            self.report_startup_time()
 
-        # Reset game statistics and change game state to active
-        self.stats.reset_stats()
-        self.scoreboard.prep_images()
-        self.game_active = True
-
-        # Load dynamic settings for easy, medium or hard difficulty
-        self.settings.initialize_dynamic_settings(mode)
-        pygame.time.set_timer(self.alien_bullet_event, alien_firing_speed)
-
-        # Remove all remaining bullets, aliens and alien bullets
-        # Reset player ship bullet sound level back to full
-        self.bullets.empty()
-        self.aliens.empty()
-        self.alien_bullets.empty()
-        self.bullet_sound.set_volume(0.26)
-
-        # Create new alien fleet, new blocks and center player ship
-        self.create_fleet()
-        self.create_multiple_blocks(0, 680)
-        self.ship_group.add(self.ship)
-        self.ship.center_ship()
-
-    """Remove all remaining bullets, create new game objects and increase speed."""
-    def start_new_level(self):
-
-        self.bullets.empty()
-        self.alien_bullets.empty()
-        self.create_fleet()
-        self.ship_group.add(self.ship)
-        self.settings.increase_speed()
-
-        # Increment level and update display
-        self.stats.level += 1
-        self.scoreboard.prep_level()
-
-    """Briefly pause the game if the player lost a life."""
-    def check_pause(self):
-
-        if self.pause_game:
-
-            # Pause game so player has visual feedback for losing a life
-            pygame.time.delay(500)
-            self.pause_game = False
-            self.alien_at_bottom = False
-
-            # Remove all active bullets and alien bullets
-            self.bullets.empty()
-            self.alien_bullets.empty()
-
-            # Update and draw new player ship and alien fleet
-            self.ship.center_ship()
-            self.ship_group.draw(self.screen)
-            self.aliens.empty()
-            self.create_fleet()
-            self.aliens.draw(self.screen)
-            pygame.display.flip()
-
-    """Load all game music and sound effects."""
+    """Print how long the game took to show the menu and load all assets."""
+    def report_startup_time(self):
+
+        if self.menu_shown_time is not None:
+            print("Menu shown after "
+                f"{(self.menu_shown_time - launch_time) * 1000:.0f} ms")
+        print("Assets loaded after "
+            f"{(self.loader.finish_time - launch_time) * 1000:.0f} ms")
+
+    """Queue all game music and sound effects to load in the background."""
     def load_sounds(self):
 
-        # Load music and loop indefinitely
-        mixer.music.load("../sounds/song.mp3")
-        mixer.music.set_volume(0.75)
-        mixer.music.play(-1)
-
-        # Load all sound effects
-        self.boom_sound = pygame.mixer.Sound("../sounds/boom.wav")
-        self.boom_sound.set_volume(0.27)
-        self.bullet_sound = pygame.mixer.Sound("../sounds/bullet.wav")
-        self.bullet_sound.set_volume(0.26)
-        self.alien_bullet_sound = pygame.mixer.Sound("../sounds/alien_bullet.wav")
-        self.alien_bullet_sound.set_volume(0.25)
-        self.blip_sound = pygame.mixer.Sound("../sounds/blip.wav")
-        self.blip_sound.set_volume(0.45)
-        self.shield_down_sound = pygame.mixer.Sound("../sounds/shield_down.wav")
-        self.shield_down_sound.set_volume(0.35)
-        self.lost_life_sound = pygame.mixer.Sound("../sounds/lost_life.wav")
-        self.lost_life_sound.set_volume(0.5)
-
-    """Create menu buttons and text boxes."""
-    def create_menu_ui(self):
-
-        # Calculate center button coordinates
-        center_button_x = (self.settings.screen_width / 2) - 100
-        center_button_y = (self.settings.screen_height / 2) - 25
-
-        # Create title text box with given attributes
-        self.title_text_box = TextBox(self, "Alien Invasion", (0, 0, 255),
-            (255, 255, 255), 480, 100,
-            pygame.font.Font("../font/8_bit_madness.ttf", 72),
-            center_button_x - 140, center_button_y - 120)
-
-        # Create play buttons with given text, colors and coordinates
-        self.easy_mode_button = Button(self, "Easy", (0, 255, 0),
-            center_button_x - 210, center_button_y)
-        self.medium_mode_button = Button(self, "Medium", (255, 255, 0),
-            center_button_x, center_button_y)
-        self.hard_mode_button = Button(self, "Hard", (255, 0, 0),
-            center_button_x + 210, center_button_y)
-
-        # Load menu controls image
-        self.controls_image = pygame.image.load("../images/menu/controls.png")
+        # Load music
+        self.loader.add(self.audio.load_music, "../sounds/song.mp3", 0.75)
+
+        # Load all sound effects, keyed by the names the simulation uses
+        self.load_sound("boom", 0.27, "explosion")
+        self.load_sound("bullet", 0.26, "player")
+        self.load_sound("alien_bullet", 0.25, "alien")
+        self.load_sound("blip", 0.45, "impact")
+        self.load_sound("shield_down", 0.35, "impact")
+        self.load_sound("lost_life", 0.5, "event")
+
+    """Queue a single sound effect to load with its volume and category."""
+    def load_sound(self, name, volume, category):
+        self.loader.add(self.audio.load_sound, name, f"../sounds/{name}.wav",
+            volume, category)
+
+    """Queue every sound the simulation triggered during the latest step."""
+    def queue_sounds(self):
+
+        if self.audio:
+            self.audio.queue(self.sim.sound_events)
+
+    """Spawn debris for every hit during the latest step, then move every
+    particle by a tick."""
+    def update_particles(self):
+
+        self.particles.emit_events(self.sim.effect_events)
+        self.particles.update()
+        self.profiler.mark("particles")
+
+    """Combine held keys into a single simulation input value."""
+    def get_actions(self):
+
+        # Play back recorded input until the replay runs out
+        if self.replay_actions is not None:
+
+            actions = next(self.replay_actions, None)
+            if actions is not None:
+                return actions
+
+            # Replay is over, hand control back to the player
+            self.replay_actions = None
+            self.speed = 1.0
+
+        actions = 0
+
+        if self.moving_left:
+            actions |= MOVE_LEFT
+        if self.moving_right:
+            actions |= MOVE_RIGHT
+        if self.holding_fire or self.fire_pressed:
+            actions |= FIRE
+
+        return actions
 
     """Listen for keypress and mouse events."""
     def check_events(self):
 
         for event in pygame.event.get():
 
-            # Check if it's time for alien to fire bullet
-            if event.type == self.alien_bullet_event:
-                self.fire_alien_bullet()
-
             # Check if player pressed a key
             if event.type == pygame.KEYDOWN:
                 self.check_keydown_events(event)
@@ -250,28 +314,47 @@ class AlienInvasion:
 
             # Check if player clicked the game window's quit button
             elif event.type == pygame.QUIT:
+                self.quit_game()
+
+            # Redraw the whole window if it was uncovered, since dirty
+            # rendering only redraws what changed
+            elif event.type == pygame.WINDOWEXPOSED:
+                self.renderer.full_redraw = True
+
+    """Save high score and close the game."""
+    def quit_game(self):
 
-                # Write high score to "high_score.txt" file
-                with open("../user_data/high_score.txt", "w") as file:
-                    file.write(f"{self.stats.high_score}")
+        # Save the round in progress (if recording)
+        if self.recorder and self.sim.game_active:
+            self.recorder.save(self.sim.stats)
 
-                pygame.quit()
-                sys.exit()
+        self.sim.stats.save_high_score()
+        self.profiler.save_trace()
+
+        # Report how much spectators were sent (if serving)
+        if self.server:
+            from spectator import print_report
+            print_report("Server", self.server.get_report(),
+                self.server.ticks_sent)
+            self.server.close()
+
+        pygame.quit()
+        sys.exit()
 
     """Start new game when player clicks a play button."""
     def check_play_buttons(self, mouse_pos):
 
         # Check which play button has been clicked when game state inactive
         # Start round on selected difficulty level with given alien firing speed
-        if not self.game_active:
+        if not self.sim.game_active:
 
-            if self.easy_mode_button.rect.collidepoint(mouse_pos):
+            if self.renderer.easy_mode_button.rect.collidepoint(mouse_pos):
                 self.start_round("easy", 1200)
 
-            elif self.medium_mode_button.rect.collidepoint(mouse_pos):
+            elif self.renderer.medium_mode_button.rect.collidepoint(mouse_pos):
                 self.start_round("medium", 1000)
 
-            elif self.hard_mode_button.rect.collidepoint(mouse_pos):
+            elif self.renderer.hard_mode_button.rect.collidepoint(mouse_pos):
                 self.start_round("hard", 800)
 
     """Listen for key presses."""
@@ -279,391 +362,79 @@ class AlienInvasion:
 
         # Check if "q" key or "Escape" key has been pressed to quit game
         if event.key == pygame.K_q or event.key == pygame.K_ESCAPE:
-
-            # Write high score to "high_score.txt" file
-            with open("../user_data/high_score.txt", "w") as file:
-                file.write(f"{self.stats.high_score}")
-
-            pygame.quit()
-            sys.exit()
+            self.quit_game()
 
         # Check if "p" key has been pressed while game state inactive
         # Play round on medium difficulty by default
-        if event.key == pygame.K_p and not self.game_active:
+        if event.key == pygame.K_p and not self.sim.game_active:
             self.start_round("medium", 1000)
 
         # Check if spacebar has been pressed while game state inactive
         # Play round on medium difficulty by default
-        elif event.key == pygame.K_SPACE and not self.game_active:
+        elif event.key == pygame.K_SPACE and not self.sim.game_active:
             self.start_round("medium", 1000)
 
+        # Check if "F3" key has been pressed to toggle the frame profiler
+        elif event.key == pygame.K_F3:
+            self.profiler.set_enabled(not self.profiler.enabled)
+            self.renderer.full_redraw = True
+
         # Check if right arrow key has been pressed
         elif event.key == pygame.K_RIGHT:
-            self.ship.moving_right = True
+            self.moving_right = True
 
         # Check if left arrow key has been pressed
         elif event.key == pygame.K_LEFT:
-            self.ship.moving_left = True
+            self.moving_left = True
 
         # Check if spacebar has been pressed while game state active
-        elif event.key == pygame.K_SPACE and self.game_active:
+        elif event.key == pygame.K_SPACE and self.sim.game_active:
 
             self.holding_fire = True
-            self.fire_bullet()
+            self.fire_pressed = True
 
     """Listen for key releases."""
     def check_keyup_events(self, event):
 
         # Check if right arrow key has been released
         if event.key == pygame.K_RIGHT:
-            self.ship.moving_right = False
+            self.moving_right = False
 
         # Check if left arrow key has been released
         elif event.key == pygame.K_LEFT:
-            self.ship.moving_left = False
-        
+            self.moving_left = False
+
         # Check if space bar has been released
         elif event.key == pygame.K_SPACE:
             self.holding_fire = False
 
-    """Update images on-screen and flip to new screen."""
-    def update_screen(self):
-
-        self.screen.blit(self.background, (0, 0))
-
-        # Re-draw blocks with updated shapes
-        self.blocks.draw(self.screen)
-
-        # Re-draw active bullets with updated positions
-        for bullet in self.bullets.sprites():
-            bullet.draw_bullet()
-
-        # Re-draw active alien bullets with updated positions
-        for alien_bullet in self.alien_bullets.sprites():
-            alien_bullet.draw_bullet()
-
-        # Re-draw player ship if it hasn't been destroyed
-        if self.alien_at_bottom or not self.pause_game:
-            self.ship_group.draw(self.screen)
-
-        # Draw alien fleet, explosions and score information
-        self.aliens.draw(self.screen)
-        self.explosions.draw(self.screen)
-        self.scoreboard.show_score()
-
-        # Draw title box, play buttons and controls image if game state inactive
-        if not self.game_active:
-
-            # Mute bullet sound if player gets a game over while firing bullets
-            self.bullet_sound.set_volume(0)
-
-            self.title_text_box.draw_text_box()
-            self.easy_mode_button.draw_button()
-            self.medium_mode_button.draw_button()
-            self.hard_mode_button.draw_button()
-            self.screen.blit(self.controls_image, (240, 445))
-
-        pygame.display.flip()
-
-        # Briefly pause after updating game objects if player lost a life
-        self.check_pause()
-
-# ------------------------------------------------------------------------------
-# HELPER FUNCTIONS -------------------------------------------------------------
-# ------------------------------------------------------------------------------
-
-    """Create new block between player and alien fleet."""
-    def create_block(self, x_start, y_start, x_offset):
-
-        # Iterate through rows and columns to make a block
-        for row_index, row in enumerate(self.shape):
-            for column_index, column in enumerate(row):
-
-                # Create individual parts of a block
-                if column == "x":
-
-                    x_position = x_start + ((column_index * self.block_size)
-                        + x_offset)
-                    y_position = y_start + (row_index * self.block_size)
-
-                    block_object = block.Block(self.block_size, (0, 255, 255),
-                        x_position, y_position)
-                    self.blocks.add(block_object)
-
-    """Create new blocks between player and alien fleet."""
-    def create_multiple_blocks(self, x_start, y_start):
-
-        # Create row of 4 evenly-spaced blocks on the screen
-        for i in range(1, 5):
-            self.create_block(x_start, y_start, (i * 256) - ((4 - i) * 48))
-
-    """Create new bullet and add to bullet group (if allowed)."""
-    def fire_bullet(self):
-
-        # Allow player a maximum of 8 bullets on-screen at a time
-        if len(self.bullets) < self.settings.bullet_limit:
-
-            new_bullet = Bullet(self)
-            self.bullets.add(new_bullet)
-
-            # Update time for latest fired bullet
-            self.latest_fired_bullet = pygame.time.get_ticks()
-
-            # Play bullet sound when firing bullet
-            mixer.Sound.play(self.bullet_sound)
-
-    """Auto-fire new bullet if enough time has passed."""
-    def auto_fire_bullet(self):
-
-        # Calculate time since latest fired bullet
-        time_since_latest_fired_bullet = (pygame.time.get_ticks() 
-            - self.latest_fired_bullet)
-
-        # Auto-fire new bullet after given delay
-        if time_since_latest_fired_bullet >= self.firing_delay:
-            self.fire_bullet()
-
-    """Fire a bullet from a random alien ship."""
-    def fire_alien_bullet(self):
-
-        # Check to make sure at least one alien ship exists
-        if self.aliens.sprites() and self.game_active:
-
-            random_alien = choice(self.aliens.sprites())
-            alien_bullet = AlienBullet(self, random_alien)
-            self.alien_bullets.add(alien_bullet)
-
-            # Play alien bullet sound when bullet spawns
-            mixer.Sound.play(self.alien_bullet_sound)
-
-    """Update bullet positions and despawn bullets that go off-screen."""
-    def update_bullets(self):
-
-        # Update bullet and alien bullet positions
-        self.bullets.update()
-        self.alien_bullets.update()
-
-        # For loop needs list length to be constant, so loop over copy of list
-        for bullet in self.bullets.copy():
-            if bullet.rect.bottom <= 0:
-                self.bullets.remove(bullet)
-
-        # Repeat procedure for alien bullets
-        for alien_bullet in self.alien_bullets.copy():
-            if alien_bullet.rect.top >= self.settings.screen_height:
-                self.alien_bullets.remove(alien_bullet)
-
-        # Check collisions between bullets and all game objects
-        self.check_bullet_block_collisions()
-        self.check_alien_bullet_block_collisions()
-        self.check_bullet_alien_collisions()
-        self.check_alien_bullet_ship_collisions()
-        self.explosions.update()
-
-    """Respond to bullet-block collisions."""
-    def check_bullet_block_collisions(self):
-
-        # Check for collisions between bullets and blocks
-        # Remove colliding sprites
-        collisions = pygame.sprite.groupcollide(
-            self.bullets, self.blocks, True, True)
-
-        # If block(s) destroyed, play blip sound
-        if collisions:
-            mixer.Sound.play(self.blip_sound)
-
-    """Respond to alien bullet-block collisions."""
-    def check_alien_bullet_block_collisions(self):
-
-        # Check for collisions between alien bullets and blocks
-        # Remove colliding sprites
-        collisions = pygame.sprite.groupcollide(
-            self.alien_bullets, self.blocks, True, True)
-
-        # If block(s) destroyed, play blip sound
-        if collisions:
-            mixer.Sound.play(self.blip_sound)
-
-    """Respond to bullet-alien collisions."""
-    def check_bullet_alien_collisions(self):
-
-        # Check for collisions between bullets/aliens, remove colliding sprites
-        collisions = pygame.sprite.groupcollide(
-            self.bullets, self.aliens, True, True)
-
-        # If alien(s) destroyed, increment points, update score and
-        # create explosion(s)
-        if collisions:
-
-            for aliens in collisions.values():
-
-                # Increment score for every alien hit by single bullet
-                self.stats.score += self.settings.alien_points * len(aliens)
-
-                for alien in aliens:
-
-                    # Replace alien sprite with explosion
-                    explosion = Explosion(alien.rect.center)
-                    self.explosions.add(explosion)
-
-            # Play boom sound for alien hit
-            mixer.Sound.play(self.boom_sound)
-
-            self.scoreboard.prep_score()
-            self.scoreboard.check_high_score()
-
-        if not self.aliens:
-            self.start_new_level()
-
-    """Respond to alien bullet-ship collisions."""
-    def check_alien_bullet_ship_collisions(self):
-
-        # Check for collisions between alien bullets and player ship
-        if pygame.sprite.spritecollideany(self.ship, self.alien_bullets):
-
-            # Replace player ship sprite with explosion
-            self.ship_group.empty()
-            explosion = Explosion(self.ship.rect.center)
-            self.explosions.add(explosion)
-
-            mixer.Sound.play(self.boom_sound)
-            self.ship_hit()
-
-    """Respond when an alien hits the player ship."""
-    def ship_hit(self):
-
-        mixer.Sound.play(self.lost_life_sound)
-
-        # Decrement number of ships remaining and update scoreboard
-        self.stats.ships_left -= 1
-        self.scoreboard.prep_ships()
-
-        if self.stats.ships_left > 0:
-
-            # Add new player ship for rendering
-            self.ship_group.empty()
-            self.ship_group.add(self.ship)
-
-            # Pause the game after losing a life
-            self.pause_game = True
-
-        # Game over, show mouse cursor for menu options
-        else:
-            self.game_active = False
-            pygame.mouse.set_visible(True)
-
-    """Check if alien fleet at edge-of-screen, then update alien positions."""
-    def update_aliens(self):
-
-        self.check_fleet_edges()
-        self.aliens.update()
-
-        # Check for aliens colliding with blocks
-        for alien in self.aliens:
-
-            # Destroy blocks and play shield down sound
-            if pygame.sprite.spritecollide(alien, self.blocks, True):
-                mixer.Sound.play(self.shield_down_sound)
-
-        # Check for aliens colliding with the player ship
-        if pygame.sprite.spritecollideany(self.ship, self.aliens):
-
-            # Replace player ship sprite with explosion
-            self.ship_group.empty()
-            explosion = Explosion(self.ship.rect.center)
-            self.explosions.add(explosion)
-
-            # Play boom sound for ship collision
-            mixer.Sound.play(self.boom_sound)
-
-            self.ship_hit()
-
-        # Check for aliens hitting the bottom of the screen
-        self.check_aliens_bottom()
-
-    """Create a fleet of aliens."""
-    def create_fleet(self):
-
-        # Create space around aliens equal to one alien size
-        alien = Alien(self)
-        alien_width, alien_height = alien.rect.size
-
-        # The x-coordinate and y-coordinate of the next alien to spawn
-        current_x, current_y = alien_width, alien_height + 72
-
-        # Keep generating aliens in rows and columns until running out of room
-        while current_y < self.settings.screen_height - (alien_height * 7):
-            while current_x < (self.settings.screen_width - (alien_width * 2)):
-
-                self.create_alien(current_x, current_y)
-                current_x += alien_width * 2
-
-            # Finished spawning a row of aliens
-            # Reset x-coordinate and increment y-coordinate
-            current_x = alien_width
-            current_y += alien_height * 1.5
-
-    """Create alien and add to row."""
-    def create_alien(self, x_position, y_position):
-
-        new_alien = Alien(self)
-        new_alien.x = x_position
-        new_alien.rect.x = x_position
-        new_alien.rect.y = y_position
-        self.aliens.add(new_alien)
-
-    """Respond properly if an alien reaches left or right edge of screen."""
-    def check_fleet_edges(self):
-
-        for alien in self.aliens.sprites():
-            if alien.check_edges():
-                self.change_fleet_direction()
-                break
-
-    """Drop fleet down the screen and change fleet direction."""
-    def change_fleet_direction(self):
-
-        for alien in self.aliens.sprites():
-            alien.rect.y += self.settings.fleet_drop_speed
-
-        self.settings.fleet_direction *= -1
-
-    """Check if any aliens reach the bottom of the screen."""
-    def check_aliens_bottom(self):
-
-        for alien in self.aliens.sprites():
-            if alien.rect.bottom >= self.settings.screen_height:
-                self.alien_reaches_bottom()
-                break
-
-    """Respond when an alien reaches the bottom of the screen."""
-    def alien_reaches_bottom(self):
-
-        # Keep rendering player ship sprite since it wasn't destroyed
-        self.alien_at_bottom = True
-
-        # Play lost life sound when an alien reaches the bottom the of screen
-        mixer.Sound.play(self.lost_life_sound)
-
-        # Decrement number of ships remaining and update scoreboard
-        self.stats.ships_left -= 1
-        self.scoreboard.prep_ships()
-
-        if self.stats.ships_left > 0:
-
-            # Pause the game after losing a life
-            self.pause_game = True
-
-        # Game over, show mouse cursor for menu options
-        else:
-            self.game_active = False
-            pygame.mouse.set_visible(True)
-
 # ------------------------------------------------------------------------------
 # ------------------------------------------------------------------------------
 # ------------------------------------------------------------------------------
 
 if __name__ == '__main__':
 
-    game = AlienInvasion()
+    parser = argparse.ArgumentParser(description="Play Alien Invasion.")
+    parser.add_argument("--record", metavar="FILE",
+        help="record each round's input to FILE for replay.py")
+    parser.add_argument("--profile", metavar="FILE", nargs="?",
+        const="profile.json", help="start with the frame profiler on and "
+        "save a Chrome trace to FILE (default profile.json) on exit")
+    parser.add_argument("--startup-time", action="store_true",
+        help="print how long the menu and assets took to load")
+    parser.add_argument("--serve", metavar="ADDRESS", nargs="?",
+        const="localhost:5050", help="stream the game to spectators at "
+        "ADDRESS (default localhost:5050), watched with spectator.py")
+    args = parser.parse_args()
+
+    recorder = None
+    if args.record:
+        from replay import Recorder
+        recorder = Recorder(args.record)
+
+    profiler = FrameProfiler(enabled=bool(args.profile),
+        trace_path=args.profile)
+
+    game = AlienInvasion(recorder=recorder, profiler=profiler,
+        show_startup_time=args.startup_time, spectator_address=args.serve)
     game.run_game()
\ No newline at end of file
@@ -0,0 +1,236 @@
+# Author: Dakota Rubin
+# Date: October 18th, 2026
+# File: assets.py contains the shared asset cache for the Alien Invasion game.
+
+import io, json, mmap, os, struct, threading, time
+import pygame
+
+# Asset bundle made by build_assets.py, used instead of separate image,
+# sound and font files when it exists
+bundle_path = "../assets.bundle"
+bundle_magic = b"AIBUNDLE"
+
+# Opened asset bundle (False until looked for, None if there isn't one)
+bundle = False
+
+# Every image loaded so far, keyed by file path
+images = {}
+
+# Images decoded by a background AssetLoader that haven't been converted to
+# the display's pixel format yet, keyed by file path
+decoded_images = {}
+decoded_images_lock = threading.Lock()
+
+# Every font opened so far, keyed by (file path, size)
+fonts = {}
+
+# Collision mask of every image loaded so far, keyed by file path
+masks = {}
+
+"""Load an image from disk once and return the shared surface."""
+def load_image(path, alpha=True):
+
+    # Hand out the cached surface if this image was loaded before
+    if path in images:
+        return images[path]
+
+    # Cut the image out of the bundle's atlas if it's in there (opaque
+    # images get their own copy without alpha, so they blit faster)
+    asset_bundle = get_bundle()
+    if asset_bundle and path in asset_bundle.image_rects:
+        image = asset_bundle.get_image(path)
+        if not alpha and pygame.display.get_surface():
+            image = image.convert()
+        images[path] = image
+        return image
+
+    # Use the image decoded in the background if there is one
+    with decoded_images_lock:
+        image = decoded_images.pop(path, None)
+    if image is None:
+        image = pygame.image.load(path)
+
+    # Convert image to the display's pixel format so blits are fast
+    # (only possible after the game window has been created)
+    if pygame.display.get_surface():
+        image = image.convert_alpha() if alpha else image.convert()
+
+    images[path] = image
+    return image
+
+"""Return the (width, height) of a cached image without reloading it."""
+def image_size(path):
+    return load_image(path).get_size()
+
+"""Return the collision mask of an image (made once per image, not per
+sprite), with a bit set for every pixel that isn't mostly transparent."""
+def get_mask(path):
+
+    if path not in masks:
+        masks[path] = pygame.mask.from_surface(load_image(path))
+
+    return masks[path]
+
+"""Decode an image ahead of time, so load_image() only has to convert it.
+
+Safe to call from a background thread, since converting images (which
+needs the display) is left to load_image() on the main thread."""
+def decode_image(path):
+
+    # Images in the bundle don't need decoding
+    asset_bundle = get_bundle()
+    if path in images or (asset_bundle and path in asset_bundle.image_rects):
+        return
+
+    image = pygame.image.load(path)
+    with decoded_images_lock:
+        if path not in images:
+            decoded_images[path] = image
+
+"""Open a font file at the given size once and return the shared font."""
+def get_font(path, size):
+
+    if (path, size) not in fonts:
+
+        # Fonts can't be used once pygame quits, so drop them when it does
+        # (quit functions only run once, so register again for a new cache)
+        if not fonts:
+            pygame.register_quit(fonts.clear)
+        fonts[(path, size)] = pygame.font.Font(open_file(path), size)
+
+    return fonts[(path, size)]
+
+"""Drop every cached image, mask and font, so they're loaded again (in the
+new display's pixel format) after pygame is shut down and started again."""
+def clear_caches():
+
+    images.clear()
+    masks.clear()
+    fonts.clear()
+    with decoded_images_lock:
+        decoded_images.clear()
+
+    # Bundled images are cut from the atlas, so convert it again too
+    if bundle:
+        bundle.atlas = None
+
+"""Return a sound or font file from the bundle as a file object, or the
+path itself if it isn't bundled."""
+def open_file(path):
+
+    asset_bundle = get_bundle()
+    if asset_bundle and path in asset_bundle.file_ranges:
+        return asset_bundle.open_file(path)
+
+    return path
+
+"""Open the asset bundle the first time it's needed, return None if it
+hasn't been built."""
+def get_bundle():
+
+    global bundle
+    if bundle is False:
+        bundle = AssetBundle(bundle_path) if os.path.exists(bundle_path) else None
+
+    return bundle
+
+"""This class reads images, sounds and fonts from an asset bundle.
+
+The bundle file is memory-mapped instead of read, and every image is a
+subsurface of one atlas surface, so images share the atlas's pixels."""
+class AssetBundle:
+
+    """Map a bundle file into memory and read its index."""
+    def __init__(self, path):
+
+        with open(path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self.data[:len(bundle_magic)] != bundle_magic:
+            raise ValueError(f"{path} isn't an asset bundle")
+
+        # Index (JSON) follows the magic bytes and its own length
+        index_start = len(bundle_magic) + 4
+        index_length, = struct.unpack_from("<I", self.data, len(bundle_magic))
+        index = json.loads(self.data[index_start:index_start + index_length])
+        self.data_start = index_start + index_length
+
+        self.atlas_offset = index["atlas"]["offset"]
+        self.atlas_size = tuple(index["atlas"]["size"])
+        self.image_rects = index["images"]
+        self.file_ranges = index["files"]
+        self.atlas = None
+
+    """Return the atlas surface, creating it the first time."""
+    def get_atlas(self):
+
+        if self.atlas is None:
+
+            # Use the mapped pixels directly, converting them once to the
+            # display's pixel format if there's a display
+            width, height = self.atlas_size
+            start = self.data_start + self.atlas_offset
+            self.atlas = pygame.image.frombuffer(
+                memoryview(self.data)[start:start + (width * height * 4)],
+                self.atlas_size, "RGBA")
+            if pygame.display.get_surface():
+                self.atlas = self.atlas.convert_alpha()
+
+        return self.atlas
+
+    """Return an image as a subsurface of the atlas."""
+    def get_image(self, path):
+        return self.get_atlas().subsurface(self.image_rects[path])
+
+    """Return a bundled file's contents as a file object."""
+    def open_file(self, path):
+
+        offset, length = self.file_ranges[path]
+        start = self.data_start + offset
+        return io.BytesIO(self.data[start:start + length])
+
+"""This class runs slow loading jobs on a background thread, so the game
+window can open before everything is loaded."""
+class AssetLoader:
+
+    """Initialize a loader with no jobs."""
+    def __init__(self):
+
+        self.jobs = []
+        self.thread = None
+        self.error = None
+
+        # perf_counter() time the last job finished
+        self.finish_time = None
+
+    """Add a function to call (with the given arguments) in the background."""
+    def add(self, function, *args):
+        self.jobs.append((function, args))
+
+    """Start running the jobs in the background, in the order they were added."""
+    def start(self):
+
+        self.thread = threading.Thread(target=self.run_jobs, daemon=True)
+        self.thread.start()
+
+    """Run every job, keeping the first error to raise on the main thread."""
+    def run_jobs(self):
+
+        try:
+            for function, args in self.jobs:
+                function(*args)
+        except Exception as error:
+            self.error = error
+
+        self.finish_time = time.perf_counter()
+
+    """Return True once every job has run."""
+    def is_done(self):
+        return self.thread is not None and not self.thread.is_alive()
+
+    """Wait for every job to run, raising any error a job hit."""
+    def wait(self):
+
+        self.thread.join()
+        if self.error:
+            raise self.error
\ No newline at end of file
@@ -0,0 +1,98 @@
+# Author: Dakota Rubin
+# Date: October 18th, 2026
+# File: audio.py contains all music and sound effect playback for the Alien
+# Invasion game.
+
+import os
+from pygame import mixer
+
+from assets import open_file
+
+"""This class plays music and sound effects for Alien Invasion.
+
+Every sound category gets its own reserved mixer channels, so busy categories
+can't take channels from the others, and the total number of channels caps
+how many sounds play at once. Sounds are queued during a frame and played
+once per frame, so a sound requested several times in one frame only plays
+once."""
+class AudioManager:
+
+    """Initialize the mixer with a small buffer for low latency."""
+    def __init__(self, settings):
+
+        # Must run before pygame.init(), which would start the mixer with
+        # its default (larger) buffer
+        mixer.init(frequency=44100, size=-16, channels=2,
+            buffer=settings.audio_buffer)
+
+        # Give every category a range of channels (ordered from the one that
+        # started playing longest ago), and reserve them all so nothing else
+        # can play on them
+        self.channels = {}
+        channel_count = sum(settings.audio_channels.values())
+        mixer.set_num_channels(channel_count)
+        mixer.set_reserved(channel_count)
+
+        first_channel = 0
+        for category, count in settings.audio_channels.items():
+            self.channels[category] = [mixer.Channel(number) for number
+                in range(first_channel, first_channel + count)]
+            first_channel += count
+
+        # Sounds and their categories, keyed by name
+        self.sounds = {}
+
+        # Names of sounds to play at the end of the frame (in a dict to drop
+        # duplicates while keeping the order they were requested in)
+        self.queued_sounds = {}
+
+    """Load music and set its volume."""
+    def load_music(self, path, volume):
+
+        # Name the file type, since bundled music is loaded from memory
+        mixer.music.load(open_file(path), os.path.splitext(path)[1][1:])
+        mixer.music.set_volume(volume)
+
+    """Loop the loaded music indefinitely."""
+    def play_music(self):
+        mixer.music.play(-1)
+
+    """Load a sound effect, set its volume and assign it a category."""
+    def load_sound(self, name, path, volume, category):
+
+        sound = mixer.Sound(open_file(path))
+        sound.set_volume(volume)
+        self.sounds[name] = (sound, category)
+
+    """Queue sounds (by name) to play at the end of the frame."""
+    def queue(self, names):
+
+        for name in names:
+            self.queued_sounds[name] = None
+
+    """Play every sound queued this frame once."""
+    def play_queued(self):
+
+        for name in self.queued_sounds:
+
+            sound, category = self.sounds[name]
+            channel = self.get_channel(category)
+            channel.play(sound)
+
+            # Move channel to the back of the line to be taken over
+            channels = self.channels[category]
+            channels.remove(channel)
+            channels.append(channel)
+
+        self.queued_sounds.clear()
+
+    """Return a free channel from a category, or the one that started
+    playing longest ago if they're all busy."""
+    def get_channel(self, category):
+
+        channels = self.channels[category]
+        for channel in channels:
+            if not channel.get_busy():
+                return channel
+
+        return channels[0]
\ No newline at end of file
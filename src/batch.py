@@ -0,0 +1,756 @@
+# Author: Dakota Rubin
+# Date: October 18th, 2026
+# File: batch.py contains a NumPy engine that plays many Alien Invasion games
+# at once in a single process, for sweeping settings over thousands of rounds.
+
+import argparse, time
+
+import numpy as np
+
+from settings import Settings
+from simulation import Simulation, MOVE_LEFT, MOVE_RIGHT, FIRE
+
+# Game states (a game that's over stays over until the next round)
+PLAYING, LIFE_LOST, LEVEL_TRANSITION, GAME_OVER = range(4)
+
+"""Round positions to whole pixels the way a pygame Rect does (halves round
+away from zero)."""
+def to_pixels(values):
+    return np.trunc(values + np.copysign(0.5, values)).astype(np.int64)
+
+"""Return a boolean array of which rects overlap another rect (all given as
+left, top, width and height, and broadcast against each other)."""
+def overlaps(left, top, width, height, other_left, other_top, other_width,
+        other_height):
+
+    return ((left < other_left + other_width) & (other_left < left + width)
+        & (top < other_top + other_height) & (other_top < top + height))
+
+"""Split the (game, slot) pairs set in a (games, slots) mask into turns that
+hold at most one slot per game (in slot order), return each turn's games and
+slots. Each turn can be handled at once, while each game's slots still take
+turns like Simulation's loops over bullets."""
+def take_turns(mask):
+
+    games, slots = np.nonzero(mask)
+    if not games.size:
+        return []
+
+    # Count each pair's position among its game's pairs
+    starts = np.flatnonzero(np.r_[True, games[1:] != games[:-1]])
+    turns = np.arange(games.size) - np.repeat(starts,
+        np.diff(np.r_[starts, games.size]))
+
+    return [(games[turns == turn], slots[turns == turn])
+        for turn in range(turns.max() + 1)]
+
+"""This class plays many independent games of Alien Invasion in lockstep.
+
+Every game's ship, fleet, bullets, blocks and stats are stored as one row of
+NumPy arrays, so each rule of Simulation.tick() runs once for the whole batch
+instead of once per game. Games start with the same layout as Simulation's
+rounds and follow the same rules, with two differences: collisions compare
+rects (like pixel_collisions = False), and alien fire uses NumPy's random
+numbers, so a batch game doesn't replay a seeded Simulation round exactly.
+
+Speeds, point values, growth rates and alien firing intervals are stored per
+game, so they can be set to different values across the batch after
+start_round() to sweep difficulty curves."""
+class BatchSimulation:
+
+    """Lay out the playing field and create the arrays for count games."""
+    def __init__(self, count, settings=None, seed=None):
+
+        self.count = count
+        self.settings = settings = settings or Settings()
+        self.random = np.random.default_rng(seed)
+
+        # Lay out a round with the regular simulation, so every game here
+        # starts with the same ship, fleet and blocks
+        layout = Simulation(settings)
+        layout.create_fleet()
+
+        self.screen_width = settings.screen_width
+        self.screen_height = settings.screen_height
+        self.dt = layout.dt
+        self.tick_length = layout.tick_length
+
+        # Ship's starting rect (it only ever moves sideways)
+        ship_rect = layout.ship.rect
+        self.ship_start_x = ship_rect.x
+        self.ship_y = ship_rect.y
+        self.ship_width, self.ship_height = ship_rect.size
+
+        # Aliens' starting positions, shared by every game
+        fleet = layout.fleet
+        self.alien_x, self.alien_y = fleet.x.copy(), fleet.y.copy()
+        self.alien_width, self.alien_height = fleet.width, fleet.height
+        self.fleet_size = len(self.alien_x)
+
+        # Grid of the fleet's columns and rows holding each alien's index
+        # (-1 where there's no alien, including an extra row and column past
+        # the edges), so bullets only check the aliens around them
+        self.column_x = np.unique(self.alien_x)
+        self.row_y = np.unique(self.alien_y)
+        self.alien_grid = np.full((len(self.row_y) + 1,
+            len(self.column_x) + 1), -1)
+        self.alien_grid[np.searchsorted(self.row_y, self.alien_y),
+            np.searchsorted(self.column_x, self.alien_x)] = np.arange(
+            self.fleet_size)
+
+        # Most columns and rows of aliens a bullet can overlap, allowing a
+        # pixel of rounding on each side
+        self.nearby_columns = np.arange(self.get_nearby_count(self.column_x,
+            self.alien_width + settings.bullet_width + 2))
+        self.nearby_rows = np.arange(self.get_nearby_count(self.row_y,
+            self.alien_height + settings.bullet_height + 2))
+
+        # Bullet sizes and limits
+        self.bullet_width = settings.bullet_width
+        self.bullet_height = settings.bullet_height
+
+        # Block rects, cell size and starting cells (True while standing)
+        self.block_size = layout.block_size
+        self.block_left = np.array([block_object.rect.x
+            for block_object in layout.blocks])
+        self.block_top = np.array([block_object.rect.y
+            for block_object in layout.blocks])
+        self.block_rows = layout.blocks[0].rows
+        self.block_columns = layout.blocks[0].columns
+        self.start_cells = np.stack([np.frombuffer(block_object.cells,
+            np.uint8).reshape(block_object.rows, block_object.columns)
+            for block_object in layout.blocks]).astype(bool)
+        self.block_area = tuple(layout.block_area)
+
+        # Timers in ticks
+        self.firing_delay_ticks = layout.get_ticks(layout.firing_delay)
+        self.life_lost_ticks = layout.get_ticks(settings.life_lost_time)
+        self.level_transition_ticks = layout.get_ticks(
+            settings.level_transition_time)
+
+        # Ticks since the round started (every game ticks together)
+        self.ticks = 0
+
+        # Game states, and the tick each timed state ends (-1 if untimed)
+        self.state = np.full(count, GAME_OVER, np.int8)
+        self.state_end = np.full(count, -1, np.int64)
+
+        # Stats
+        self.score = np.zeros(count, np.int64)
+        self.level = np.zeros(count, np.int64)
+        self.ships_left = np.zeros(count, np.int64)
+
+        # Dynamic settings and growth rates
+        self.ship_speed = np.zeros(count)
+        self.bullet_speed = np.zeros(count)
+        self.alien_speed = np.zeros(count)
+        self.alien_points = np.zeros(count, np.int64)
+        self.speedup_scale = np.zeros(count)
+        self.score_scale = np.zeros(count)
+        self.fleet_direction = np.ones(count)
+
+        # Ship positions (float, and the whole pixels its rect is at)
+        self.ship_x = np.zeros(count)
+        self.ship_left = np.zeros(count, np.int64)
+
+        # Fire button tracking, the tick of the latest fired bullet and the
+        # tick of the next auto-fired bullet (-1 if fire isn't held)
+        self.holding_fire = np.zeros(count, bool)
+        self.latest_fired_bullet = np.zeros(count, np.int64)
+        self.auto_fire_tick = np.full(count, -1, np.int64)
+
+        # Ticks between alien bullets, and the (fractional) tick the next
+        # alien bullet is due
+        self.alien_firing_interval = np.zeros(count)
+        self.alien_fire_due = np.zeros(count)
+
+        # Bullet pools, one row of slots per game
+        self.bullet_active = np.zeros((count, settings.bullet_limit), bool)
+        self.bullet_x = np.zeros((count, settings.bullet_limit), np.int64)
+        self.bullet_y = np.zeros((count, settings.bullet_limit))
+        self.bullet_top = np.zeros((count, settings.bullet_limit), np.int64)
+        self.alien_bullet_active = np.zeros((count,
+            settings.alien_bullet_limit), bool)
+        self.alien_bullet_x = np.zeros((count, settings.alien_bullet_limit),
+            np.int64)
+        self.alien_bullet_y = np.zeros((count, settings.alien_bullet_limit))
+        self.alien_bullet_top = np.zeros((count, settings.alien_bullet_limit),
+            np.int64)
+
+        # Fleets: living aliens, how far each fleet has moved, and the edges
+        # of the region its living aliens started in
+        self.alive = np.zeros((count, self.fleet_size), bool)
+        self.alien_count = np.zeros(count, np.int64)
+        self.offset_x = np.zeros(count)
+        self.offset_y = np.zeros(count)
+        self.fleet_left = np.zeros(count)
+        self.fleet_right = np.zeros(count)
+        self.fleet_bottom = np.zeros(count)
+
+        # Block cells of every game
+        self.cells = np.zeros((count,) + self.start_cells.shape, bool)
+
+    """Return which games are still in progress."""
+    @property
+    def game_active(self):
+        return self.state != GAME_OVER
+
+    """Start a new round in every game.
+
+    Aliens fire every alien_firing_speed ms, which can be a single value or
+    one value per game."""
+    def start_round(self, mode, alien_firing_speed):
+
+        settings = self.settings
+        self.ticks = 0
+
+        self.state[:] = PLAYING
+        self.state_end[:] = -1
+
+        # Reset game statistics
+        self.score[:] = 0
+        self.level[:] = 1
+        self.ships_left[:] = settings.ship_limit
+
+        # Load dynamic settings for easy, medium or hard difficulty
+        settings.initialize_dynamic_settings(mode)
+        self.ship_speed[:] = settings.ship_speed
+        self.bullet_speed[:] = settings.bullet_speed
+        self.alien_speed[:] = settings.alien_speed
+        self.alien_points[:] = settings.alien_points
+        self.speedup_scale[:] = settings.speedup_scale
+        self.score_scale[:] = settings.score_scale
+        self.fleet_direction[:] = settings.fleet_direction
+
+        # Reset input tracking and alien fire timing (the same as
+        # Simulation.get_ticks())
+        self.holding_fire[:] = False
+        self.latest_fired_bullet[:] = 0
+        self.auto_fire_tick[:] = -1
+        self.alien_firing_interval[:] = (np.maximum(1,
+            np.round(np.asarray(alien_firing_speed) / self.tick_length))
+            / settings.alien_fire_rate)
+        self.alien_fire_due[:] = self.alien_firing_interval
+
+        # Create new fleets and blocks, remove every bullet and center ships
+        everyone = np.ones(self.count, bool)
+        self.clear_bullets(everyone)
+        self.create_fleets(everyone)
+        self.cells[:] = self.start_cells
+        self.center_ships(everyone)
+
+    """Advance every game by the given number of ticks with the given input
+    (a single value, or one value per game)."""
+    def step(self, actions=0, ticks=1):
+
+        actions = np.broadcast_to(np.asarray(actions, np.int64), self.count)
+        for _ in range(ticks):
+            self.tick(actions)
+
+    """Advance every game by a single tick."""
+    def tick(self, actions):
+
+        self.ticks += 1
+
+        # Track fire presses, and stop auto-firing once fire is released
+        fire = (actions & FIRE) != 0
+        fire_pressed = fire & ~self.holding_fire
+        self.holding_fire = fire
+        self.auto_fire_tick[~fire] = -1
+
+        # End lost life pauses and level transitions that are over
+        ending = (self.state_end >= 0) & (self.state_end <= self.ticks)
+        if ending.any():
+            self.end_states(ending)
+
+        # Auto-fire bullets that are due (retrying every tick while paused
+        # or out of bullets)
+        auto_firing = ((self.auto_fire_tick >= 0)
+            & (self.auto_fire_tick <= self.ticks))
+        if auto_firing.any():
+            self.fire_bullets(auto_firing & (self.state == PLAYING))
+            self.schedule_auto_fire(auto_firing)
+
+        self.fire_alien_bullets()
+
+        # Fire immediately on a new press, then at a steady rate when held
+        if fire_pressed.any():
+            self.fire_bullets(fire_pressed & (self.state == PLAYING))
+            self.schedule_auto_fire(fire_pressed)
+
+        # Update the games that are playing (even if they stop partway
+        # through this tick)
+        playing = self.state == PLAYING
+        if playing.any():
+            self.update_ships(playing, actions)
+            self.update_bullets(playing)
+            self.update_aliens(playing)
+
+    """End the timed state of every game in the mask."""
+    def end_states(self, mask):
+
+        # Reset ships and fleets once lost life pauses are over (games whose
+        # fleet was destroyed on the tick their ship was hit still cleared
+        # the level, so they go up a level instead of restarting it)
+        life_lost = mask & (self.state == LIFE_LOST)
+        level_cleared = life_lost & (self.alien_count == 0)
+        if life_lost.any():
+            self.clear_bullets(life_lost)
+            self.center_ships(life_lost)
+            restart = life_lost & ~level_cleared
+            if restart.any():
+                self.create_fleets(restart)
+
+        # Create the next level's fleets once level transitions are over,
+        # and speed the games up
+        level_up = mask & ((self.state == LEVEL_TRANSITION) | level_cleared)
+        if level_up.any():
+            self.clear_bullets(level_up)
+            self.create_fleets(level_up)
+            for speed in (self.ship_speed, self.bullet_speed,
+                    self.alien_speed):
+                speed[level_up] *= self.speedup_scale[level_up]
+            self.alien_points[level_up] = (self.alien_points[level_up]
+                * self.score_scale[level_up]).astype(np.int64)
+            self.level[level_up] += 1
+
+        self.state[mask] = PLAYING
+        self.state_end[mask] = -1
+
+# ------------------------------------------------------------------------------
+# HELPER FUNCTIONS -------------------------------------------------------------
+# ------------------------------------------------------------------------------
+
+    """Remove every bullet and alien bullet from the games in the mask."""
+    def clear_bullets(self, mask):
+
+        self.bullet_active[mask] = False
+        self.alien_bullet_active[mask] = False
+
+    """Move the ships of the games in the mask back to the bottom-center."""
+    def center_ships(self, mask):
+
+        self.ship_x[mask] = self.ship_start_x
+        self.ship_left[mask] = self.ship_start_x
+
+    """Create a full fleet at its starting position for the games in the
+    mask."""
+    def create_fleets(self, mask):
+
+        self.alive[mask] = True
+        self.alien_count[mask] = self.fleet_size
+        self.offset_x[mask] = 0.0
+        self.offset_y[mask] = 0.0
+        self.update_extents(mask)
+
+    """Find the edges of the region the living aliens started in, for the
+    games in the mask."""
+    def update_extents(self, mask):
+
+        alive = self.alive[mask]
+        has_aliens = alive.any(axis=1)
+        self.fleet_left[mask] = np.where(has_aliens,
+            np.where(alive, self.alien_x, np.inf).min(axis=1), 0.0)
+        self.fleet_right[mask] = np.where(has_aliens,
+            np.where(alive, self.alien_x, -np.inf).max(axis=1), 0.0)
+        self.fleet_bottom[mask] = np.where(has_aliens,
+            np.where(alive, self.alien_y, -np.inf).max(axis=1), 0.0)
+
+    """Return the bottom of each game's lowest alien."""
+    def get_fleet_bottoms(self):
+        return ((self.fleet_bottom + self.offset_y).astype(np.int64)
+            + self.alien_height)
+
+    """Return the current (left, top) of every alien in the given games, as
+    (games, aliens) arrays."""
+    def get_alien_positions(self, games):
+
+        # Aliens snap to whole pixels the same way Fleet.get_rect() does
+        left = (self.alien_x + self.offset_x[games, None]).astype(np.int64)
+        top = (self.alien_y + self.offset_y[games, None]).astype(np.int64)
+        return left, top
+
+    """Fire a bullet from each ship in the mask (if its game has one left)."""
+    def fire_bullets(self, mask):
+
+        free = ~self.bullet_active
+        games = np.flatnonzero(mask & free.any(axis=1))
+        if not games.size:
+            return
+
+        # Use each game's first free bullet, fired from the ship's
+        # middle-top
+        slots = free[games].argmax(axis=1)
+        self.bullet_active[games, slots] = True
+        self.bullet_x[games, slots] = (self.ship_left[games]
+            + (self.ship_width // 2) - (self.bullet_width // 2))
+        self.bullet_y[games, slots] = self.ship_y
+        self.bullet_top[games, slots] = self.ship_y
+        self.latest_fired_bullet[games] = self.ticks
+
+    """Schedule the next auto-fired bullet of the games in the mask,
+    firing_delay after the latest fired bullet (or next tick if that's
+    already passed)."""
+    def schedule_auto_fire(self, mask):
+
+        self.auto_fire_tick[mask] = np.maximum(self.ticks + 1,
+            self.latest_fired_bullet[mask] + self.firing_delay_ticks)
+
+    """Fire every alien bullet that's due.
+
+    Aliens firing faster than the tick rate fire several bullets in one tick,
+    and bullets due while a game is paused are fired once it resumes."""
+    def fire_alien_bullets(self):
+
+        while True:
+
+            due = (self.state == PLAYING) & (np.ceil(self.alien_fire_due)
+                <= self.ticks)
+            if not due.any():
+                return
+
+            self.fire_alien_bullet(due)
+            self.alien_fire_due[due] += self.alien_firing_interval[due]
+
+    """Fire a bullet from a random alien in each game in the mask."""
+    def fire_alien_bullet(self, mask):
+
+        games = np.flatnonzero(mask & (self.alien_count > 0))
+        if not games.size:
+            return
+
+        # Pick a random living alien in each game (the alien whose running
+        # count of living aliens passes the random choice)
+        choices = (self.random.random(games.size)
+            * self.alien_count[games]).astype(np.int64)
+        aliens = (np.cumsum(self.alive[games], axis=1)
+            > choices[:, None]).argmax(axis=1)
+
+        # Skip shots in games where every alien bullet is already on-screen
+        free = ~self.alien_bullet_active[games]
+        has_free = free.any(axis=1)
+        games, aliens = games[has_free], aliens[has_free]
+        slots = free[has_free].argmax(axis=1)
+
+        # Fire from the alien's middle-bottom
+        alien_left = (self.alien_x[aliens] + self.offset_x[games]).astype(
+            np.int64)
+        alien_top = (self.alien_y[aliens] + self.offset_y[games]).astype(
+            np.int64)
+        self.alien_bullet_active[games, slots] = True
+        self.alien_bullet_x[games, slots] = (alien_left
+            + (self.alien_width // 2) - (self.bullet_width // 2))
+        self.alien_bullet_y[games, slots] = alien_top + self.alien_height
+        self.alien_bullet_top[games, slots] = alien_top + self.alien_height
+
+    """Move the ships of the games in the mask with their input."""
+    def update_ships(self, mask, actions):
+
+        # Check both directions against the ship's position before moving
+        step = self.ship_speed * self.dt
+        moving_right = (mask & ((actions & MOVE_RIGHT) != 0)
+            & (self.ship_left + self.ship_width < self.screen_width))
+        moving_left = (mask & ((actions & MOVE_LEFT) != 0)
+            & (self.ship_left > 0))
+
+        self.ship_x = np.where(moving_right, self.ship_x + step, self.ship_x)
+        self.ship_x = np.where(moving_left, self.ship_x - step, self.ship_x)
+        self.ship_left = to_pixels(self.ship_x)
+
+    """Move the bullets of the games in the mask, despawn bullets that leave
+    the screen, then check bullet collisions."""
+    def update_bullets(self, mask):
+
+        step = np.where(mask, self.bullet_speed * self.dt, 0.0)[:, None]
+        self.bullet_y -= step
+        self.bullet_top = to_pixels(self.bullet_y)
+        self.alien_bullet_y += step
+        self.alien_bullet_top = to_pixels(self.alien_bullet_y)
+
+        self.bullet_active &= self.bullet_top + self.bullet_height > 0
+        self.alien_bullet_active &= self.alien_bullet_top < self.screen_height
+
+        self.check_block_collisions(mask, self.bullet_active, self.bullet_x,
+            self.bullet_top)
+        self.check_block_collisions(mask, self.alien_bullet_active,
+            self.alien_bullet_x, self.alien_bullet_top)
+        self.check_bullet_alien_collisions(mask)
+        self.check_alien_bullet_ship_collisions(mask)
+
+    """Erode blocks with the bullets of the games in the mask, and remove
+    every bullet that destroyed a cell."""
+    def check_block_collisions(self, mask, active, x, top):
+
+        # Most bullets are nowhere near the blocks
+        near_blocks = active & mask[:, None] & overlaps(x, top,
+            self.bullet_width, self.bullet_height, *self.block_area)
+
+        # A game's bullets take turns, so a bullet only destroys cells the
+        # bullets before it left standing
+        for games, slots in take_turns(near_blocks):
+
+            destroyed = self.erode_blocks(games, x[games, slots],
+                top[games, slots], self.bullet_width, self.bullet_height)
+            active[games[destroyed > 0], slots[destroyed > 0]] = False
+
+    """Destroy the block cells overlapped by one rect in each of the given
+    games (each game at most once), return how many fell in each game."""
+    def erode_blocks(self, games, left, top, width, height):
+
+        destroyed = np.zeros(games.size, np.int64)
+        size = self.block_size
+
+        # Most rows and columns of cells a rect can overlap
+        window_rows = np.arange((height + size - 2) // size + 1)
+        window_columns = np.arange((width + size - 2) // size + 1)
+
+        for index, (block_left, block_top) in enumerate(zip(self.block_left,
+                self.block_top)):
+
+            # Find the region each rect overlaps the block in
+            overlap_left = np.maximum(left, block_left)
+            overlap_right = np.minimum(left + width,
+                block_left + (self.block_columns * size))
+            overlap_top = np.maximum(top, block_top)
+            overlap_bottom = np.minimum(top + height,
+                block_top + (self.block_rows * size))
+            hit = (overlap_left < overlap_right) & (overlap_top
+                < overlap_bottom)
+            if not hit.any():
+                continue
+
+            # Find the cells under each overlapping region
+            first_column = (overlap_left[hit] - block_left) // size
+            last_column = (overlap_right[hit] - 1 - block_left) // size
+            first_row = (overlap_top[hit] - block_top) // size
+            last_row = (overlap_bottom[hit] - 1 - block_top) // size
+            rects, row_steps, column_steps = np.nonzero(
+                (window_rows <= (last_row - first_row)[:, None])[:, :, None]
+                & (window_columns <= (last_column
+                - first_column)[:, None])[:, None, :])
+            rows = first_row[rects] + row_steps
+            columns = first_column[rects] + column_steps
+            rects = np.flatnonzero(hit)[rects]
+
+            # Clear the standing cells among them, counting them by rect
+            standing = self.cells[games[rects], index, rows, columns]
+            destroyed += np.bincount(rects, standing,
+                games.size).astype(np.int64)
+            self.cells[games[rects], index, rows, columns] = False
+
+        return destroyed
+
+    """Destroy aliens hit by bullets in the games in the mask, and start a
+    level transition in games whose fleet is destroyed."""
+    def check_bullet_alien_collisions(self, mask):
+
+        # Only bullets level with the fleet can hit it
+        fleet_top = (self.row_y[0] + self.offset_y).astype(np.int64)
+        near_fleet = (self.bullet_active & mask[:, None]
+            & (self.alien_count > 0)[:, None]
+            & (self.bullet_top < self.get_fleet_bottoms()[:, None])
+            & (self.bullet_top + self.bullet_height > fleet_top[:, None]))
+
+        killed = np.zeros(self.count, bool)
+
+        # A game's bullets take turns, so aliens destroyed by one bullet
+        # can't stop the bullets after it
+        for games, slots in take_turns(near_fleet):
+
+            hits, aliens = self.get_bullet_hits(games,
+                self.bullet_x[games, slots], self.bullet_top[games, slots])
+            hit_counts = hits.sum(axis=1)
+
+            # Remove the aliens and the bullet, and score every alien hit
+            hit_rows, hit_columns = np.nonzero(hits)
+            self.alive[games[hit_rows], aliens[hit_rows, hit_columns]] = False
+            hit = hit_counts > 0
+            hit_games = games[hit]
+            self.bullet_active[hit_games, slots[hit]] = False
+            self.alien_count[games] -= hit_counts
+            self.score[games] += self.alien_points[games] * hit_counts
+            killed[hit_games] = True
+
+        if killed.any():
+            self.update_extents(killed)
+
+        # Start the next level once the fleet is destroyed
+        cleared = mask & (self.alien_count == 0) & (self.state == PLAYING)
+        self.set_states(cleared, LEVEL_TRANSITION, self.level_transition_ticks)
+
+    """Return which living aliens one bullet in each of the given games hits,
+    as a (games, nearby aliens) array, along with those aliens' indexes."""
+    def get_bullet_hits(self, games, bullet_left, bullet_top):
+
+        offset_x, offset_y = self.offset_x[games], self.offset_y[games]
+
+        # Look up the aliens in the columns and rows around each bullet
+        # (aliens snap to whole pixels, so they can be up to a pixel left of
+        # or above their exact position)
+        columns = np.minimum(np.searchsorted(self.column_x, bullet_left
+            - offset_x - self.alien_width - 1, "right")[:, None]
+            + self.nearby_columns, len(self.column_x))
+        rows = np.minimum(np.searchsorted(self.row_y, bullet_top - offset_y
+            - self.alien_height - 1, "right")[:, None] + self.nearby_rows,
+            len(self.row_y))
+        aliens = self.alien_grid[rows[:, :, None],
+            columns[:, None, :]].reshape(games.size, -1)
+
+        # Compare the bullet's rect with every nearby living alien's rect
+        nearby = aliens >= 0
+        aliens = np.where(nearby, aliens, 0)
+        alien_left = (self.alien_x[aliens] + offset_x[:, None]).astype(
+            np.int64)
+        alien_top = (self.alien_y[aliens] + offset_y[:, None]).astype(
+            np.int64)
+        hits = (nearby & self.alive[games[:, None], aliens] & overlaps(
+            bullet_left[:, None], bullet_top[:, None], self.bullet_width,
+            self.bullet_height, alien_left, alien_top, self.alien_width,
+            self.alien_height))
+
+        return hits, aliens
+
+    """Return the most fleet columns (or rows) at the given starting
+    positions that a span of the given length can reach."""
+    @staticmethod
+    def get_nearby_count(positions, length):
+
+        if len(positions) < 2:
+            return len(positions)
+        return min(len(positions),
+            int(length // np.diff(positions).min()) + 1)
+
+    """Lose a life in the games in the mask whose ship an alien bullet hit."""
+    def check_alien_bullet_ship_collisions(self, mask):
+
+        hits = (self.alien_bullet_active & mask[:, None] & overlaps(
+            self.alien_bullet_x, self.alien_bullet_top, self.bullet_width,
+            self.bullet_height, self.ship_left[:, None], self.ship_y,
+            self.ship_width, self.ship_height)).any(axis=1)
+        self.lose_lives(hits)
+
+    """Move the fleets of the games in the mask, then check alien
+    collisions."""
+    def update_aliens(self, mask):
+
+        # Drop fleets at the edge of the screen and change their direction
+        has_aliens = mask & (self.alien_count > 0)
+        left = (self.fleet_left + self.offset_x).astype(np.int64)
+        right = ((self.fleet_right + self.offset_x).astype(np.int64)
+            + self.alien_width)
+        at_edge = has_aliens & ((right >= self.screen_width) | (left <= 0))
+        self.offset_y[at_edge] += self.settings.fleet_drop_speed
+        self.fleet_direction[at_edge] *= -1
+
+        self.offset_x = np.where(mask, self.offset_x
+            + (self.alien_speed * self.fleet_direction * self.dt),
+            self.offset_x)
+
+        fleet_bottoms = self.get_fleet_bottoms()
+
+        # Erode blocks with aliens once a fleet reaches them
+        games = np.flatnonzero(has_aliens & (fleet_bottoms
+            > self.block_area[1]))
+        if games.size:
+
+            alien_left, alien_top = self.get_alien_positions(games)
+            near_blocks = self.alive[games] & overlaps(alien_left, alien_top,
+                self.alien_width, self.alien_height, *self.block_area)
+
+            for alien in np.flatnonzero(near_blocks.any(axis=0)):
+                eroding = near_blocks[:, alien]
+                self.erode_blocks(games[eroding], alien_left[eroding, alien],
+                    alien_top[eroding, alien], self.alien_width,
+                    self.alien_height)
+
+        # Check for aliens colliding with the player ship
+        games = np.flatnonzero(has_aliens & (fleet_bottoms > self.ship_y))
+        if games.size:
+
+            alien_left, alien_top = self.get_alien_positions(games)
+            hits = (self.alive[games] & overlaps(alien_left, alien_top,
+                self.alien_width, self.alien_height,
+                self.ship_left[games, None], self.ship_y, self.ship_width,
+                self.ship_height)).any(axis=1)
+
+            ship_hit = np.zeros(self.count, bool)
+            ship_hit[games[hits]] = True
+            self.lose_lives(ship_hit)
+
+        # Check for aliens hitting the bottom of the screen
+        self.lose_lives(has_aliens & (fleet_bottoms >= self.screen_height))
+
+    """Take a ship from each game in the mask, pausing games with ships left
+    and ending the rest."""
+    def lose_lives(self, mask):
+
+        if not mask.any():
+            return
+
+        self.ships_left[mask] -= 1
+        self.set_states(mask & (self.ships_left > 0), LIFE_LOST,
+            self.life_lost_ticks)
+        self.set_states(mask & (self.ships_left <= 0), GAME_OVER)
+
+    """Switch the games in the mask to a new state, lasting the given number
+    of ticks if it's timed."""
+    def set_states(self, mask, state, duration=None):
+
+        self.state[mask] = state
+        self.state_end[mask] = -1 if duration is None else (self.ticks
+            + duration)
+
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Play many games at once "
+        "with random input and report how they went.")
+    parser.add_argument("--games", type=int, default=4096,
+        help="games to play at once (default 4096)")
+    parser.add_argument("--ticks", type=int, default=3600,
+        help="longest the round can last (default 3600 ticks)")
+    parser.add_argument("--mode", default="medium",
+        choices=["easy", "medium", "hard"], help="difficulty level")
+    parser.add_argument("--alien-firing-speed", type=int, default=1000,
+        help="ms between alien bullets (default 1000)")
+    parser.add_argument("--speedup-scales", type=float, nargs="+",
+        metavar="SCALE", help="speed growth rates to split the games between")
+    parser.add_argument("--seed", type=int, help="random seed")
+    args = parser.parse_args()
+
+    batch = BatchSimulation(args.games, seed=args.seed)
+    batch.start_round(args.mode, args.alien_firing_speed)
+
+    # Split the games evenly between the speed growth rates being swept
+    sweep = np.zeros(args.games, np.int64)
+    if args.speedup_scales:
+        sweep = np.arange(args.games) % len(args.speedup_scales)
+        batch.speedup_scale[:] = np.array(args.speedup_scales)[sweep]
+
+    # Hold fire and move each ship in a random direction, changing every
+    # half second
+    rng = np.random.default_rng(args.seed)
+    directions = np.array([MOVE_LEFT, MOVE_RIGHT, 0])
+
+    start_time = time.perf_counter()
+    for tick in range(0, args.ticks, 30):
+        actions = directions[rng.integers(3, size=args.games)] | FIRE
+        batch.step(actions, min(30, args.ticks - tick))
+        if not batch.game_active.any():
+            break
+    elapsed = time.perf_counter() - start_time
+
+    game_ticks = args.games * batch.ticks
+    print(f"{game_ticks:,} game ticks in {elapsed:.2f} s "
+        f"({game_ticks / elapsed:,.0f} game ticks/s)")
+
+    for index, scale in enumerate(args.speedup_scales or
+            [batch.settings.speedup_scale]):
+        games = sweep == index
+        print(f"speedup scale {scale:<5}  average score "
+            f"{batch.score[games].mean():>9,.0f}  level "
+            f"{batch.level[games].mean():.2f}  "
+            f"{(~batch.game_active[games]).mean():.0%} of games over")
\ No newline at end of file
@@ -0,0 +1,267 @@
+# Author: Dakota Rubin
+# Date: October 18th, 2026
+# File: benchmark.py times the Alien Invasion simulation and renderer under
+# heavy load, without a real window or audio device.
+
+import argparse, json, os, platform, sys, time
+from random import Random
+
+# Use SDL's dummy drivers so benchmarks run anywhere (even without a display)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from settings import Settings
+from alien_invasion import AlienInvasion
+from simulation import FIRE, MOVE_LEFT, MOVE_RIGHT
+
+# Fleet spacing (in alien widths and heights) for each fleet size
+fleet_spacings = {"normal": (2.0, 1.5), "dense": (1.25, 1.25)}
+
+# ------------------------------------------------------------------------------
+# SCENARIOS --------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+
+"""Keep every player bullet in the air, fired from random spots along the
+bottom of the screen, while the fleet fires back."""
+def load_max_bullets(game, rng):
+
+    sim = game.sim
+    while True:
+        bullet = sim.bullets.acquire()
+        if not bullet:
+            break
+        bullet.fire(sim.ship.rect.move(
+            rng.randrange(sim.screen_rect.width) - sim.ship.rect.centerx, 0))
+
+"""Rain alien bullets onto the blocks, rebuilding them once half are gone."""
+def load_shield_erosion(game, rng):
+
+    sim = game.sim
+    block_area = sim.block_area
+
+    while True:
+        alien_bullet = sim.alien_bullets.acquire()
+        if not alien_bullet:
+            break
+        alien_bullet.fire(pygame.Rect(block_area.left
+            + rng.randrange(block_area.width), block_area.top - 40, 1, 1))
+
+    # Keep the blocks from running out of cells to erode
+    full_cells = len(sim.blocks) * sum(row.count("x") for row in sim.shape)
+    if sum(block.cell_count for block in sim.blocks) < full_cells / 2:
+        sim.blocks.clear()
+        sim.block_grid.clear()
+        sim.create_multiple_blocks(0, sim.settings.screen_height - 120)
+        game.renderer.full_redraw = True
+
+"""Keep every explosion playing at random spots on the screen."""
+def load_mass_explosions(game, rng):
+
+    sim = game.sim
+    for _ in range(sim.settings.explosion_limit - len(sim.explosions)):
+        sim.create_explosion((rng.randrange(sim.screen_rect.width),
+            rng.randrange(sim.screen_rect.height)))
+
+"""Keep the screen full of debris, spawning ship explosions' debris at
+random spots until the particle limit is reached."""
+def load_max_particles(game, rng):
+
+    particles = game.particles
+    while particles.count < game.settings.particle_limit:
+        particles.emit("ship", rng.randrange(game.sim.screen_rect.width),
+            rng.randrange(game.sim.screen_rect.height))
+
+"""Leave the menu open without starting a round."""
+def load_menu_idle(game, rng):
+    pass
+
+# Scenario name: (function run before every tick, whether to start a round)
+scenarios = {
+    "max_bullets": (load_max_bullets, True),
+    "shield_erosion": (load_shield_erosion, True),
+    "mass_explosions": (load_mass_explosions, True),
+    "max_particles": (load_max_particles, True),
+    "menu_idle": (load_menu_idle, False),
+}
+
+# ------------------------------------------------------------------------------
+# BENCHMARK RUNNER -------------------------------------------------------------
+# ------------------------------------------------------------------------------
+
+"""Return settings for the given resolution and fleet size."""
+def get_settings(resolution, fleet):
+
+    settings = Settings()
+    settings.screen_width, settings.screen_height = resolution
+    settings.fleet_column_spacing, settings.fleet_row_spacing = (
+        fleet_spacings[fleet])
+
+    return settings
+
+"""Run a scenario with the given settings for the given number of frames,
+return its timings and the average number of game objects on-screen.
+
+Every frame steps the simulation one tick and draws it, so the simulation's
+ticks per second and the full frame time can both be measured."""
+def run_scenario(name, settings, frames, warmup_frames=60):
+
+    load_scenario, start_round = scenarios[name]
+
+    game = AlienInvasion(audio=False, settings=settings)
+    sim = game.sim
+    rng = Random(0)
+
+    if start_round:
+        game.start_round("medium", 1000, seed=0)
+
+    sim_times = []
+    frame_times = []
+    entity_counts = []
+
+    for frame in range(warmup_frames + frames):
+
+        # Start a new round if the scenario's load ended the last one
+        if start_round and not sim.game_active:
+            game.start_round("medium", 1000, seed=0)
+
+        load_scenario(game, rng)
+        actions = FIRE | (MOVE_RIGHT if frame % 120 < 60 else MOVE_LEFT)
+
+        start_time = time.perf_counter()
+        sim.step(actions)
+        sim_time = time.perf_counter()
+        game.update_particles()
+        game.renderer.draw()
+        end_time = time.perf_counter()
+
+        if frame >= warmup_frames:
+            sim_times.append(sim_time - start_time)
+            frame_times.append(end_time - start_time)
+            entity_counts.append((len(sim.aliens), len(sim.bullets),
+                len(sim.alien_bullets), len(sim.explosions),
+                sum(block.cell_count for block in sim.blocks),
+                game.particles.count))
+
+    sim_times = np.array(sim_times)
+    frame_times = np.array(frame_times) * 1000
+    entity_counts = np.mean(entity_counts, axis=0).round(1).tolist()
+
+    return {
+        "scenario": name,
+        "resolution": [settings.screen_width, settings.screen_height],
+        "fleet_size": len(sim.fleet.aliens),
+        "blocks": len(sim.blocks),
+        "entities": dict(zip(("aliens", "bullets", "alien_bullets",
+            "explosions", "block_cells", "particles"), entity_counts)),
+        "frames": frames,
+        "ticks_per_second": round(len(sim_times) / sim_times.sum(), 1),
+        "frame_ms": {
+            "mean": round(frame_times.mean(), 3),
+            "p50": round(np.percentile(frame_times, 50), 3),
+            "p95": round(np.percentile(frame_times, 95), 3),
+            "p99": round(np.percentile(frame_times, 99), 3),
+        },
+    }
+
+"""Return the key a result is stored under in a results file."""
+def get_result_key(result):
+
+    width, height = result["resolution"]
+    return f"{result['scenario']}@{width}x{height}/{result['fleet']}"
+
+"""Print how results changed against a baseline, return the regressions.
+
+A regression is a drop in ticks per second or a rise in p95 frame time
+larger than threshold percent."""
+def compare_results(results, baseline, threshold):
+
+    regressions = []
+
+    for key, result in results.items():
+
+        if key not in baseline:
+            print(f"{key:<40} (no baseline)")
+            continue
+
+        base = baseline[key]
+        tick_change = percent_change(base["ticks_per_second"],
+            result["ticks_per_second"])
+        frame_change = percent_change(base["frame_ms"]["p95"],
+            result["frame_ms"]["p95"])
+
+        regressed = tick_change < -threshold or frame_change > threshold
+        if regressed:
+            regressions.append(key)
+
+        print(f"{key:<40} ticks/s {tick_change:+7.1f}%   "
+            f"p95 frame {frame_change:+7.1f}%"
+            + ("   REGRESSION" if regressed else ""))
+
+    return regressions
+
+"""Return the percent change from old to new."""
+def percent_change(old, new):
+    return ((new - old) / old) * 100 if old else 0.0
+
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Benchmark Alien Invasion.")
+    parser.add_argument("--scenarios", nargs="+", default=list(scenarios),
+        choices=list(scenarios))
+    parser.add_argument("--resolutions", nargs="+", default=["1280x800"],
+        help="screen sizes to test, like 1280x800 1920x1080")
+    parser.add_argument("--fleets", nargs="+", default=["normal"],
+        choices=list(fleet_spacings), help="fleet sizes to test")
+    parser.add_argument("--frames", type=int, default=600,
+        help="frames to time per benchmark")
+    parser.add_argument("--output", metavar="FILE",
+        help="save results as JSON to FILE")
+    parser.add_argument("--baseline", metavar="FILE",
+        help="compare results against a results file saved with --output")
+    parser.add_argument("--threshold", type=float, default=10.0,
+        help="percent slowdown against the baseline counted as a regression")
+    args = parser.parse_args()
+
+    results = {}
+
+    for resolution in args.resolutions:
+        width, height = (int(size) for size in resolution.split("x"))
+        for fleet in args.fleets:
+            for name in args.scenarios:
+
+                result = run_scenario(name,
+                    get_settings((width, height), fleet), args.frames)
+                result["fleet"] = fleet
+                results[get_result_key(result)] = result
+
+                frame_ms = result["frame_ms"]
+                print(f"{get_result_key(result):<40} "
+                    f"{result['fleet_size']:>4} aliens  "
+                    f"{result['ticks_per_second']:>10,.0f} ticks/s  "
+                    f"frame p50 {frame_ms['p50']:.2f} ms  "
+                    f"p95 {frame_ms['p95']:.2f} ms  "
+                    f"p99 {frame_ms['p99']:.2f} ms")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"environment": {"python": platform.python_version(),
+                "pygame": pygame.version.ver, "numpy": np.__version__,
+                "machine": platform.machine()}, "results": results},
+                file, indent=2)
+
+    if args.baseline:
+
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+
+        print()
+        regressions = compare_results(results, baseline, args.threshold)
+        if regressions:
+            sys.exit(1)
\ No newline at end of file
@@ -3,18 +3,74 @@
 # File: block.py contains all block behavior for the Alien Invasion game.
 
 import pygame
-from pygame.sprite import Sprite
 
-"""This class manages all block behavior for Alien Invasion."""
-class Block(Sprite):
+"""This class manages all block behavior for Alien Invasion.
 
-    """Initialize the block and get its rect coordinates."""
-    def __init__(self, size, color, x_position, y_position):
+A block is drawn from a single image, and a grid of cells (one byte per cell,
+1 while the cell is still standing) is used to check and apply damage."""
+class Block:
+
+    """Initialize the block's image, cell grid and rect coordinates."""
+    def __init__(self, shape, size, color, x_position, y_position):
+
+        self.size = size
+        self.rows = len(shape)
+        self.columns = max(len(row) for row in shape)
+
+        # Create transparent image and fill in one square per "x" in shape
+        self.image = pygame.Surface((self.columns * size, self.rows * size),
+            pygame.SRCALPHA)
+        self.cells = bytearray(self.rows * self.columns)
+
+        for row_index, row in enumerate(shape):
+            for column_index, column in enumerate(row):
+                if column == "x":
+                    self.cells[(row_index * self.columns) + column_index] = 1
+                    self.image.fill(color, (column_index * size,
+                        row_index * size, size, size))
+
+        # Convert image to the display's pixel format (if there is a display)
+        if pygame.display.get_surface():
+            self.image = self.image.convert_alpha()
 
-        super().__init__()
-        self.image = pygame.Surface((size, size))
-        self.image.fill(color)
         self.rect = self.image.get_rect(topleft = (x_position, y_position))
+        self.cell_count = sum(self.cells)
+
+    """Destroy every standing cell the rect overlaps, return how many fell."""
+    def erode(self, rect):
+
+        overlap = self.rect.clip(rect)
+        if not overlap:
+            return 0
+
+        # Find the range of cells under the overlapping region
+        first_column = (overlap.left - self.rect.left) // self.size
+        last_column = (overlap.right - 1 - self.rect.left) // self.size
+        first_row = (overlap.top - self.rect.top) // self.size
+        last_row = (overlap.bottom - 1 - self.rect.top) // self.size
+
+        destroyed = 0
+
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+
+                # Clear standing cells from the grid and the image
+                index = (row * self.columns) + column
+                if self.cells[index]:
+                    self.destroy_cell(index)
+                    destroyed += 1
+
+        return destroyed
+
+    """Clear a standing cell (by its index in cells) from the grid and the
+    image."""
+    def destroy_cell(self, index):
+
+        row, column = divmod(index, self.columns)
+        self.cells[index] = 0
+        self.image.fill((0, 0, 0, 0), (column * self.size, row * self.size,
+            self.size, self.size))
+        self.cell_count -= 1
 
 shape = [
     "       xxxx",
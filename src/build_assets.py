@@ -0,0 +1,106 @@
+# Author: Dakota Rubin
+# Date: October 18th, 2026
+# File: build_assets.py packs every Alien Invasion image into one texture atlas
+# and bundles it with the sounds and font into a single file.
+
+import argparse, json, os, struct
+import pygame
+
+from assets import bundle_path, bundle_magic
+
+# Folders whose images are packed into the atlas
+image_folders = ["../images/sprites", "../images/background", "../images/menu"]
+
+# Sounds and fonts stored in the bundle as they are
+bundled_files = ["../sounds/song.mp3", "../sounds/boom.wav",
+    "../sounds/bullet.wav", "../sounds/alien_bullet.wav",
+    "../sounds/blip.wav", "../sounds/shield_down.wav",
+    "../sounds/lost_life.wav", "../font/8_bit_madness.ttf"]
+
+# Empty pixels left around every image, so scaled or filtered drawing never
+# picks up a neighboring image's pixels
+padding = 1
+
+"""Pack images into rows (tallest first), return the atlas size and each
+image's (x, y, width, height) in the atlas, keyed by path."""
+def pack_images(images, atlas_width):
+
+    rects = {}
+    x, y, row_height = 0, 0, 0
+
+    for path in sorted(images, key=lambda path: -images[path].get_height()):
+
+        width, height = images[path].get_size()
+
+        # Start a new row once this row runs out of room
+        if x + width > atlas_width:
+            x, y = 0, y + row_height + padding
+            row_height = 0
+
+        rects[path] = (x, y, width, height)
+        x += width + padding
+        row_height = max(row_height, height)
+
+    return (atlas_width, y + row_height), rects
+
+"""Build the bundle file from every image, sound and font."""
+def build_bundle(path=bundle_path):
+
+    # Load every image, then pack them into one atlas
+    images = {}
+    for folder in image_folders:
+        for name in sorted(os.listdir(folder)):
+            if name.endswith(".png"):
+                images[f"{folder}/{name}"] = pygame.image.load(
+                    f"{folder}/{name}")
+
+    atlas_width = max(2048, max(image.get_width() for image in images.values()))
+    atlas_size, rects = pack_images(images, atlas_width)
+
+    atlas = pygame.Surface(atlas_size, pygame.SRCALPHA)
+    for image_path, (x, y, _, _) in rects.items():
+        atlas.blit(images[image_path], (x, y))
+
+    # The atlas is stored as raw RGBA pixels so loading it needs no decoding
+    data = [pygame.image.tobytes(atlas, "RGBA")]
+    index = {"atlas": {"offset": 0, "size": atlas_size}, "images": rects,
+        "files": {}}
+    offset = len(data[0])
+
+    # Store sounds and fonts as they are (skipping any that are missing)
+    for file_path in bundled_files:
+
+        if not os.path.exists(file_path):
+            print(f"Skipping missing file {file_path}")
+            continue
+
+        with open(file_path, "rb") as file:
+            data.append(file.read())
+        index["files"][file_path] = (offset, len(data[-1]))
+        offset += len(data[-1])
+
+    # Bundle layout: magic bytes, index length, JSON index, then data
+    index_bytes = json.dumps(index).encode()
+    with open(path, "wb") as file:
+        file.write(bundle_magic)
+        file.write(struct.pack("<I", len(index_bytes)))
+        file.write(index_bytes)
+        for chunk in data:
+            file.write(chunk)
+
+    print(f"Packed {len(rects)} images into a {atlas_size[0]}x{atlas_size[1]} "
+        f"atlas and bundled {len(index['files'])} files into {path} "
+        f"({os.path.getsize(path) / 1e6:.1f} MB)")
+
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Build the asset bundle.")
+    parser.add_argument("--output", default=bundle_path,
+        help=f"bundle file to write (default {bundle_path})")
+    args = parser.parse_args()
+
+    build_bundle(args.output)
\ No newline at end of file
@@ -3,36 +3,43 @@
 # File: bullet.py contains all bullet behavior for the Alien Invasion game.
 
 import pygame
-from pygame.sprite import Sprite
 
-"""This class manages all bullet behavior for Alien Invasion."""
-class Bullet(Sprite):
+"""This class manages all bullet behavior for Alien Invasion.
 
-    """Initialize bullet object at the ship's current position."""
+Bullets are kept in a Pool and reused, so they use __slots__ instead of
+being sprites."""
+class Bullet:
+
+    __slots__ = ("settings", "color", "rect", "y", "previous_position")
+
+    """Initialize an unused bullet object."""
     def __init__(self, game):
 
-        super().__init__()
-        self.screen = game.screen
         self.settings = game.settings
         self.color = self.settings.bullet_color
 
-        # Create bullet sprite at top-left of screen (0, 0)
+        # Create bullet rect at top-left of screen (0, 0)
         self.rect = pygame.Rect(0, 0, self.settings.bullet_width,
             self.settings.bullet_height)
+        self.y = 0.0
+        self.previous_position = (0, 0)
+
+    """Fire the bullet from the ship's current position."""
+    def fire(self, ship_rect):
 
         # Set bullet position to middle-top of ship
-        self.rect.midtop = game.ship.rect.midtop
+        self.rect.midtop = ship_rect.midtop
 
         # Store bullet position as float for more precise control
         self.y = float(self.rect.y)
+        self.previous_position = self.rect.topleft
 
     """Move the bullet up the screen."""
-    def update(self):
+    def update(self, dt):
 
-        # Update bullet position (decrease the y-coordinate)
-        self.y -= self.settings.bullet_speed
-        self.rect.y = self.y
+        # Remember last position so the bullet can be drawn between ticks
+        self.previous_position = self.rect.topleft
 
-    """Draw the bullet's new position to the screen."""
-    def draw_bullet(self):
-        pygame.draw.rect(self.screen, self.color, self.rect)
\ No newline at end of file
+        # Update bullet position (decrease the y-coordinate)
+        self.y -= self.settings.bullet_speed * dt
+        self.rect.y = self.y
\ No newline at end of file
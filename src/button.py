@@ -4,6 +4,8 @@
 
 import pygame.font
 
+from assets import get_font
+
 """This class manages all button behavior for Alien Invasion."""
 class Button:
 
@@ -17,7 +19,7 @@ class Button:
         self.width, self.height = 200, 50
         self.button_color = button_color
         self.text_color = (0, 0, 0)
-        self.font = pygame.font.Font("../font/8_bit_madness.ttf", 48)
+        self.font = get_font("../font/8_bit_madness.ttf", 48)
 
         # Build button rect, center button, space button along x-axis
         self.rect = pygame.Rect(0, 0, self.width, self.height)
@@ -0,0 +1,320 @@
+# Author: Dakota Rubin
+# Date: October 18th, 2026
+# File: env.py contains a Gym-style environment for training and evaluating
+# bots against the Alien Invasion game, and a runner that steps many games in
+# parallel processes.
+
+import argparse, os, time
+import multiprocessing
+from multiprocessing import shared_memory
+from random import Random
+
+# Use SDL's dummy drivers so games run without a window or audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from settings import Settings
+from alien_invasion import AlienInvasion
+from observations import LowResFrame, get_pixel_view, get_state
+from assets import clear_caches
+from explosion import frames as explosion_frames
+
+# Alien firing speed of each difficulty level (same as the menu's buttons)
+alien_firing_speeds = {"easy": 1200, "medium": 1000, "hard": 800}
+
+# Number of different actions (every combination of MOVE_LEFT, MOVE_RIGHT
+# and FIRE)
+action_count = 8
+
+"""Return the shape of an environment's observations: (height, width, 3)
+screen pixels, shrunk to observation_size (width, height) if given, without
+the color axis if grayscale."""
+def get_observation_shape(settings, observation_size=None, grayscale=False):
+
+    width, height = observation_size or (settings.screen_width,
+        settings.screen_height)
+    return (height, width) if grayscale else (height, width, 3)
+
+"""This class plays Alien Invasion one step at a time for a bot.
+
+Every step runs the simulation for frame_skip ticks with the bot's action
+(MOVE_LEFT, MOVE_RIGHT and FIRE flags combined using "|"), then draws the
+screen and returns it as the observation, along with the points scored
+during the step as the reward and whether the player has run out of ships.
+
+Observations are full size by default, or shrunk to observation_size (and
+optionally grayscale) for bots that don't need every pixel."""
+class AlienInvasionEnv:
+
+    """Create a game without audio to play rounds at a difficulty level."""
+    def __init__(self, mode="medium", frame_skip=4, settings=None, seed=None,
+            observation_size=None, grayscale=False):
+
+        self.game = AlienInvasion(audio=False, settings=settings)
+        self.game.finish_loading()
+        self.sim = self.game.sim
+
+        self.mode = mode
+        self.frame_skip = frame_skip
+
+        # Picks each round's seed, so a seeded environment plays the same
+        # rounds every run
+        self.seeds = Random(seed)
+
+        # Observations are screen pixels, shrunk if a size is given
+        self.observation_shape = get_observation_shape(self.game.settings,
+            observation_size, grayscale)
+        self.low_res_frame = None
+        if observation_size or grayscale:
+            self.low_res_frame = LowResFrame(observation_size
+                or self.game.renderer.screen.get_size(), grayscale)
+
+        # Score at the end of the previous step
+        self.score = 0
+
+    """Start a new round and return the first observation (written into out
+    if it's given)."""
+    def reset(self, seed=None, out=None):
+
+        if seed is None:
+            seed = self.seeds.getrandbits(32)
+
+        self.game.start_round(self.mode, alien_firing_speeds[self.mode], seed)
+        self.score = 0
+
+        return self.get_observation(out)
+
+    """Play one step with the given action, return the observation (written
+    into out if it's given), reward, whether the round is over and extra
+    information."""
+    def step(self, action, out=None):
+
+        self.sim.step(action, self.frame_skip)
+
+        stats = self.sim.stats
+        reward = stats.score - self.score
+        self.score = stats.score
+        done = stats.ships_left <= 0 or not self.sim.game_active
+
+        info = {"score": stats.score, "level": stats.level,
+            "ships_left": stats.ships_left, "ticks": self.sim.ticks}
+
+        return self.get_observation(out), reward, done, info
+
+    """Draw the screen and return it as an observation array, written into
+    out if it's given."""
+    def get_observation(self, out=None):
+
+        self.game.renderer.draw()
+        if out is None:
+            out = np.empty(self.observation_shape, np.uint8)
+
+        if self.low_res_frame:
+            out[...] = self.low_res_frame.render(self.game.renderer.screen)
+            return out
+
+        # Copy one color channel at a time, which NumPy does several times
+        # faster than copying each pixel's three bytes together (the view
+        # locks the screen, so it's deleted before anything else is drawn)
+        pixels = get_pixel_view(self.game.renderer.screen)
+        for channel in range(3):
+            out[:, :, channel] = pixels[:, :, channel]
+        del pixels
+
+        return out
+
+    """Return the entities and block cells of the round in progress (see
+    observations.get_state())."""
+    def get_state(self):
+        return get_state(self.sim)
+
+    """Close the game, dropping the shared asset caches so another
+    environment can be made in this process."""
+    def close(self):
+
+        clear_caches()
+        explosion_frames.clear()
+        pygame.quit()
+
+"""Play one environment in a worker process, writing its observations into
+the shared observation array and sending back rewards and round endings."""
+def run_worker(connection, memory_name, index, count, observation_shape,
+        env_args):
+
+    # Attach to the shared observations and pick out this worker's slot
+    memory = shared_memory.SharedMemory(name=memory_name)
+    observations = np.ndarray((count,) + observation_shape, np.uint8,
+        memory.buf)
+    observation = observations[index]
+
+    env = AlienInvasionEnv(**env_args)
+
+    while True:
+
+        command, action = connection.recv()
+
+        if command == "reset":
+            env.reset(out=observation)
+            connection.send(None)
+
+        elif command == "step":
+
+            _, reward, done, info = env.step(action, observation)
+
+            # Start the next round as soon as a round ends, so every
+            # environment always has a round in progress
+            if done:
+                env.reset(out=observation)
+            connection.send((reward, done, info))
+
+        elif command == "close":
+            break
+
+    # Views of the shared memory have to go before it can be closed
+    del observation, observations
+    memory.close()
+    env.close()
+    connection.close()
+
+"""This class steps many environments at once, one per worker process.
+
+Pygame only allows one window per process, so every environment gets its own
+process. Workers write observations straight into one shared memory block,
+so only actions, rewards and round endings are sent between processes."""
+class VectorEnv:
+
+    """Start a worker process for each environment."""
+    def __init__(self, count, mode="medium", frame_skip=4, settings=None,
+            seed=None, observation_size=None, grayscale=False):
+
+        settings = settings or Settings()
+        self.count = count
+        self.observation_shape = get_observation_shape(settings,
+            observation_size, grayscale)
+
+        # Shared observation array with one observation per environment
+        size = count * int(np.prod(self.observation_shape))
+        self.memory = shared_memory.SharedMemory(create=True, size=size)
+        self.observations = np.ndarray((count,) + self.observation_shape,
+            np.uint8, self.memory.buf)
+
+        # Start workers fresh instead of forking, since a forked process
+        # would share this process's pygame state
+        context = multiprocessing.get_context("spawn")
+        seeds = Random(seed)
+        self.connections = []
+        self.workers = []
+
+        for index in range(count):
+
+            env_args = {"mode": mode, "frame_skip": frame_skip,
+                "settings": settings, "seed": seeds.getrandbits(32),
+                "observation_size": observation_size, "grayscale": grayscale}
+            connection, worker_connection = context.Pipe()
+            worker = context.Process(target=run_worker, args=(
+                worker_connection, self.memory.name, index, count,
+                self.observation_shape, env_args), daemon=True)
+            worker.start()
+
+            self.connections.append(connection)
+            self.workers.append(worker)
+
+    """Start a new round in every environment, return the observations."""
+    def reset(self):
+
+        for connection in self.connections:
+            connection.send(("reset", None))
+        for connection in self.connections:
+            connection.recv()
+
+        return self.observations
+
+    """Play one step in every environment with its action, return the
+    observations, rewards, round endings and extra information.
+
+    Environments whose round ended start a new round straight away, so
+    their observation is the new round's first screen."""
+    def step(self, actions):
+
+        # Send every action before waiting, so the workers run in parallel
+        for connection, action in zip(self.connections, actions):
+            connection.send(("step", int(action)))
+        results = [connection.recv() for connection in self.connections]
+
+        rewards = np.array([result[0] for result in results])
+        dones = np.array([result[1] for result in results])
+        infos = [result[2] for result in results]
+
+        return self.observations, rewards, dones, infos
+
+    """Stop every worker and free the shared observations."""
+    def close(self):
+
+        for connection in self.connections:
+            connection.send(("close", None))
+        for worker in self.workers:
+            worker.join()
+
+        del self.observations
+        self.memory.close()
+        self.memory.unlink()
+
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Measure how many "
+        "environment steps per second random bots can play.")
+    parser.add_argument("--envs", type=int, default=os.cpu_count(),
+        help="number of environments to run in parallel (default: one per "
+        "CPU core)")
+    parser.add_argument("--steps", type=int, default=1000,
+        help="steps to play in every environment (default 1000)")
+    parser.add_argument("--mode", default="medium",
+        choices=list(alien_firing_speeds), help="difficulty level")
+    parser.add_argument("--frame-skip", type=int, default=4,
+        help="simulation ticks per step (default 4)")
+    parser.add_argument("--seed", type=int, help="seed for every round")
+    parser.add_argument("--size", help="shrink observations to WIDTHxHEIGHT "
+        "(e.g. 160x100)")
+    parser.add_argument("--grayscale", action="store_true",
+        help="make observations grayscale")
+    args = parser.parse_args()
+
+    observation_size = None
+    if args.size:
+        observation_size = tuple(int(size) for size in args.size.split("x"))
+
+    rng = np.random.default_rng(args.seed)
+    vector_env = VectorEnv(args.envs, args.mode, args.frame_skip,
+        seed=args.seed, observation_size=observation_size,
+        grayscale=args.grayscale)
+    vector_env.reset()
+
+    # Play random actions, counting finished rounds
+    rounds, scores = 0, []
+    start_time = time.perf_counter()
+    for _ in range(args.steps):
+
+        _, _, dones, infos = vector_env.step(
+            rng.integers(action_count, size=args.envs))
+        for done, info in zip(dones, infos):
+            if done:
+                rounds += 1
+                scores.append(info["score"])
+
+    elapsed = time.perf_counter() - start_time
+    vector_env.close()
+
+    total_steps = args.steps * args.envs
+    print(f"{total_steps:,} steps in {elapsed:.2f} s across {args.envs} "
+        f"environments ({total_steps / elapsed:,.0f} steps/s, "
+        f"{total_steps * args.frame_skip / elapsed:,.0f} ticks/s)")
+    if rounds:
+        print(f"{rounds} rounds finished, average score "
+            f"{sum(scores) / rounds:,.0f}")
\ No newline at end of file
@@ -3,29 +3,86 @@
 # File: explosion.py contains all explosion behavior for the Alien Invasion game.
 
 import pygame
-from pygame.sprite import Sprite
 
-"""This class manages all explosion behavior for Alien Invasion."""
-class Explosion(Sprite):
+from assets import load_image
 
-    """Initialize an explosion and set its starting position."""
-    def __init__(self, center):
+# Explosion sprite image, and how long (in ms) each explosion is shown
+explosion_image = "../images/sprites/explosion.png"
+display_time = 40
 
-        super().__init__()
+# Animation frames per explosion, and how much each explosion grows, spins
+# (in degrees) and fades out over its animation
+frame_count = 8
+start_scale, end_scale = 0.6, 1.2
+spin = 90
 
-        # Get explosion sprite dimensions
-        self.image = pygame.image.load("../images/sprites/explosion.png")
-        self.rect = self.image.get_rect()
-        self.rect.center = center
+# Animation frames made from the sprite image (made once, shared by all
+# explosions)
+frames = []
 
-        self.start_timer = pygame.time.get_ticks()
+"""Return the explosion animation frames, making them from the sprite image
+the first time.
 
-    """Remove explosion sprite after the given amount of time."""
-    def update(self):
+Every frame is scaled, rotated and faded once here, so starting or animating
+an explosion never transforms an image."""
+def load_frames():
 
-        # Display explosion sprite for 40 ms
-        current_time = pygame.time.get_ticks()
-        display_time = 40
+    if frames:
+        return frames
 
-        if current_time > self.start_timer + display_time:
-            self.kill()
\ No newline at end of file
+    image = load_image(explosion_image)
+    for index in range(frame_count):
+
+        # Grow and spin the explosion, fading it out faster towards the end
+        progress = index / (frame_count - 1)
+        scale = start_scale + ((end_scale - start_scale) * progress)
+        frame = pygame.transform.rotozoom(image, -spin * progress, scale)
+        alpha = round(255 * (1 - (progress ** 2)))
+        frame.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+
+        # Convert frame to the display's pixel format (if there is a display),
+        # and run-length encode it so drawing skips its transparent pixels
+        if pygame.display.get_surface():
+            frame = frame.convert_alpha()
+        frame.set_alpha(255, pygame.RLEACCEL)
+        frames.append(frame)
+
+    return frames
+
+"""This class manages all explosion behavior for Alien Invasion.
+
+Explosions are kept in a Pool and reused, so they use __slots__ instead of
+being sprites. The simulation ages every active explosion once per tick and
+picks the frame each one shows."""
+class Explosion:
+
+    __slots__ = ("image", "rect", "center", "age", "frame")
+
+    """Initialize an unused explosion.
+
+    Animation frames are only made once the explosion is first started, so
+    explosion pools can be created before gameplay images are loaded."""
+    def __init__(self):
+
+        self.image = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.center = (0, 0)
+
+        # Ticks since the explosion started, and the frame it's showing
+        self.age = 0
+        self.frame = 0
+
+    """Start the explosion at the given position."""
+    def start(self, center):
+
+        self.center = center
+        self.age = 0
+        self.show_frame(0)
+
+    """Show an animation frame, centered on the explosion's position."""
+    def show_frame(self, frame):
+
+        self.frame = frame
+        self.image = load_frames()[frame]
+        self.rect.size = self.image.get_size()
+        self.rect.center = self.center
\ No newline at end of file
@@ -0,0 +1,122 @@
+# Author: Dakota Rubin
+# Date: October 18th, 2026
+# File: fleet.py contains all alien fleet movement for the Alien Invasion game.
+
+import numpy as np
+import pygame
+
+"""This class stores alien fleet positions in arrays and moves the whole fleet.
+
+Every alien moves by the same amount, so the arrays hold each alien's
+starting position and the fleet's movement is stored as a single offset."""
+class Fleet:
+
+    """Initialize an empty fleet."""
+    def __init__(self, game):
+
+        self.settings = game.settings
+        self.screen_rect = game.screen_rect
+
+        # Counts every new fleet, so drawings of the fleet know when it's been
+        # replaced
+        self.version = 0
+
+        self.create([], (0, 0))
+
+    """Create a new fleet with aliens at the given (x, y) positions."""
+    def create(self, positions, alien_size):
+
+        self.width, self.height = alien_size
+
+        # Starting positions and alive flags, one entry per alien
+        self.x = np.array([x for x, _ in positions], dtype=float)
+        self.y = np.array([y for _, y in positions], dtype=float)
+        self.alive = np.ones(len(positions), dtype=bool)
+
+        # Alien sprites (for drawing), in the same order as the arrays
+        self.aliens = []
+
+        # Distance the fleet moved since it was created, now and last tick
+        self.offset_x, self.offset_y = 0.0, 0.0
+        self.previous_offset_x, self.previous_offset_y = 0.0, 0.0
+
+        self.version += 1
+        self.update_extents()
+
+    """Find the edges of the region the living aliens started in."""
+    def update_extents(self):
+
+        if self.alive.any():
+            alive_x, alive_y = self.x[self.alive], self.y[self.alive]
+            self.left = alive_x.min()
+            self.right = alive_x.max()
+            self.bottom = alive_y.max()
+        else:
+            self.left = self.right = self.bottom = 0.0
+
+    """Mark an alien as destroyed."""
+    def kill(self, index):
+
+        self.alive[index] = False
+        self.update_extents()
+
+    """Return an alien's current rect."""
+    def get_rect(self, index):
+
+        return pygame.Rect(int(self.x[index] + self.offset_x),
+            int(self.y[index] + self.offset_y), self.width, self.height)
+
+    """Return True if any alien hits the edge of the screen."""
+    def check_edges(self):
+
+        # Aliens snap to whole pixels the same way a sprite's rect does
+        left = int(self.left + self.offset_x)
+        right = int(self.right + self.offset_x) + self.width
+        return (right >= self.screen_rect.right) or (left <= 0)
+
+    """Return the bottom of the lowest alien."""
+    def get_bottom(self):
+        return int(self.bottom + self.offset_y) + self.height
+
+    """Drop the fleet down the screen."""
+    def drop(self):
+        self.offset_y += self.settings.fleet_drop_speed
+
+    """Move the fleet to the right or left."""
+    def update(self, dt):
+
+        # Remember last offset so the fleet can be drawn between ticks
+        self.previous_offset_x = self.offset_x
+        self.previous_offset_y = self.offset_y
+
+        self.offset_x += (self.settings.alien_speed
+            * self.settings.fleet_direction * dt)
+
+    """Return the offset to draw the fleet at, alpha (0 to 1) of the way
+    between the last two ticks."""
+    def get_draw_offset(self, alpha):
+
+        return (self.previous_offset_x
+            + ((self.offset_x - self.previous_offset_x) * alpha),
+            self.previous_offset_y
+            + ((self.offset_y - self.previous_offset_y) * alpha))
+
+    """Update living alien sprites' rects and return (alien, x, y) positions
+    to draw them at, alpha (0 to 1) of the way between the last two ticks."""
+    def get_draw_positions(self, alpha):
+
+        offset_x, offset_y = self.get_draw_offset(alpha)
+
+        indexes = np.flatnonzero(self.alive)
+        draw_x = (self.x[indexes] + offset_x).tolist()
+        draw_y = (self.y[indexes] + offset_y).tolist()
+        rect_x = (self.x[indexes] + self.offset_x).astype(int).tolist()
+        rect_y = (self.y[indexes] + self.offset_y).astype(int).tolist()
+
+        positions = []
+        for i, index in enumerate(indexes.tolist()):
+            alien = self.aliens[index]
+            alien.rect.topleft = (rect_x[i], rect_y[i])
+            positions.append((alien, draw_x[i], draw_y[i]))
+
+        return positions
\ No newline at end of file
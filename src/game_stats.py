@@ -23,4 +23,16 @@ class GameStats:
 
         self.ships_left = self.settings.ship_limit
         self.score = 0
-        self.level = 1
\ No newline at end of file
+        self.level = 1
+
+    """Overwrite existing high score with new higher score."""
+    def check_high_score(self):
+
+        if self.score > self.high_score:
+            self.high_score = self.score
+
+    """Write high score to "high_score.txt" file."""
+    def save_high_score(self):
+
+        with open("../user_data/high_score.txt", "w") as file:
+            file.write(f"{self.high_score}")
\ No newline at end of file
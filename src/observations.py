@@ -0,0 +1,122 @@
+# Author: Dakota Rubin
+# Date: October 18th, 2026
+# File: observations.py contains NumPy views of the Alien Invasion screen and
+# game state, for bots and analysis tools.
+
+import numpy as np
+import pygame
+
+# Kinds of entity in a state array
+SHIP, ALIEN, BULLET, ALIEN_BULLET = range(4)
+
+# One entity's kind and center position (5 bytes per entity)
+entity_dtype = np.dtype([("kind", np.uint8), ("x", np.int16),
+    ("y", np.int16)])
+
+"""Return a surface's pixels as a (height, width, 3) RGB array that shares the
+surface's memory, without copying them.
+
+The array locks the surface until it's deleted, and nothing can be drawn on
+a locked surface, so get a new view for each frame that's read and delete
+it straight away."""
+def get_pixel_view(surface):
+
+    # View the pixels in pygame's (width, height, RGB) order, then swap the
+    # first two axes so rows come first like in the other arrays
+    return np.asarray(surface.get_view("3")).transpose(1, 0, 2)
+
+"""This class shrinks a surface (and optionally turns it grayscale) into
+NumPy arrays that are reused every frame.
+
+The small surface is drawn straight into a NumPy array's memory, so its
+pixels never have to be copied out of pygame."""
+class LowResFrame:
+
+    """Create the arrays for frames of the given (width, height)."""
+    def __init__(self, size, grayscale=False):
+
+        width, height = size
+        self.size = size
+        self.grayscale = grayscale
+
+        # Small surface sharing the memory of a (height, width, BGRA) array,
+        # and an RGB view of that array
+        self.buffer = np.zeros((height, width, 4), np.uint8)
+        self.surface = pygame.image.frombuffer(self.buffer, size, "BGRA")
+        self.pixels = self.buffer[:, :, 2::-1]
+
+        # Brightness of each pixel, and space to add up its weighted colors
+        self.gray_pixels = np.empty((height, width), np.uint8)
+        self.brightness = np.empty((height, width), np.uint16)
+        self.weighted_color = np.empty((height, width), np.uint16)
+
+        # Shape of the arrays render() returns
+        self.shape = (height, width) if grayscale else (height, width, 3)
+
+    """Shrink a surface into the frame and return its (height, width, 3)
+    pixels, or (height, width) brightness if grayscale.
+
+    The returned array is overwritten by the next call, so copy it to keep
+    it."""
+    def render(self, surface):
+
+        # Average the pixels each small pixel covers, so thin bullets still
+        # show up
+        pygame.transform.smoothscale(surface, self.size, self.surface)
+        if not self.grayscale:
+            return self.pixels
+
+        # Add up red, green and blue weighted by how bright they look (out of
+        # 256), reusing the same arrays every frame
+        brightness, weighted_color = self.brightness, self.weighted_color
+        np.multiply(self.buffer[:, :, 2], 77, out=brightness, dtype=np.uint16)
+        np.multiply(self.buffer[:, :, 1], 150, out=weighted_color,
+            dtype=np.uint16)
+        brightness += weighted_color
+        np.multiply(self.buffer[:, :, 0], 29, out=weighted_color,
+            dtype=np.uint16)
+        brightness += weighted_color
+        np.right_shift(brightness, 8, out=self.gray_pixels, casting="unsafe")
+
+        return self.gray_pixels
+
+"""Return every ship, alien and bullet in a simulation as an array of
+entity_dtype (kind and center position), and every block's cells as a
+(blocks, rows, columns) array (1 while a cell is still standing)."""
+def get_state(sim):
+
+    fleet = sim.fleet
+    alive = fleet.alive
+    bullets, alien_bullets = sim.bullets, sim.alien_bullets
+
+    alien_count = int(alive.sum())
+    entities = np.empty(1 + alien_count + len(bullets) + len(alien_bullets),
+        entity_dtype)
+
+    # Ship comes first, followed by the aliens, bullets and alien bullets
+    entities["kind"][0] = SHIP
+    entities["x"][0], entities["y"][0] = sim.ship.rect.center
+
+    # Aliens snap to whole pixels the same way their rects do
+    aliens = entities[1:1 + alien_count]
+    aliens["kind"] = ALIEN
+    aliens["x"] = (fleet.x[alive] + fleet.offset_x).astype(int) + (
+        fleet.width // 2)
+    aliens["y"] = (fleet.y[alive] + fleet.offset_y).astype(int) + (
+        fleet.height // 2)
+
+    index = 1 + alien_count
+    for kind, pool in ((BULLET, bullets), (ALIEN_BULLET, alien_bullets)):
+        if len(pool):
+            entities[index:index + len(pool)] = [(kind,) + bullet.rect.center
+                for bullet in pool]
+            index += len(pool)
+
+    # Read each block's cells straight from its bytes
+    if sim.blocks:
+        cells = np.stack([np.frombuffer(block.cells, np.uint8).reshape(
+            block.rows, block.columns) for block in sim.blocks])
+    else:
+        cells = np.zeros((0, 0, 0), np.uint8)
+
+    return entities, cells
\ No newline at end of file
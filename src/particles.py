@@ -0,0 +1,187 @@
+# Author: Dakota Rubin
+# Date: October 18th, 2026
+# File: particles.py contains the debris particle system for the Alien
+# Invasion game.
+
+import numpy as np
+import pygame
+
+# Debris each kind of effect spawns: particle count, top speed (in pixels per
+# second), lifetime (in ms) and colors
+effects = {
+    "alien": (48, 240, 600, [(255, 255, 255), (120, 255, 120),
+        (255, 220, 80)]),
+    "block": (10, 120, 400, [(0, 255, 255), (0, 160, 200)]),
+    "ship": (240, 320, 1000, [(255, 255, 255), (255, 160, 40),
+        (255, 60, 30)]),
+}
+
+# Downward pull on debris (in pixels per second squared)
+gravity = 300
+
+# Number of steps each color fades through before a particle disappears
+fade_steps = 4
+
+"""This class moves and draws debris particles, stored in NumPy arrays.
+
+Living particles fill the start of every array, so each tick updates them
+all with a few array operations, and every particle is drawn with one write
+into the screen's pixels. The number of particles is capped at
+settings.particle_limit, and debris that doesn't fit is skipped."""
+class ParticleSystem:
+
+    """Create the particle arrays (seeded for repeatable debris if a seed is
+    given)."""
+    def __init__(self, settings, seed=None):
+
+        self.screen_rect = pygame.Rect(0, 0, settings.screen_width,
+            settings.screen_height)
+        self.dt = 1 / settings.ticks_per_second
+        self.random = np.random.default_rng(seed)
+
+        # Position and velocity (in pixels per second), ticks left to live,
+        # ticks lived for in total, and color (an index into the palette)
+        capacity = settings.particle_limit
+        self.x = np.zeros(capacity, np.float32)
+        self.y = np.zeros(capacity, np.float32)
+        self.velocity_x = np.zeros(capacity, np.float32)
+        self.velocity_y = np.zeros(capacity, np.float32)
+        self.life = np.zeros(capacity, np.int32)
+        self.lifetime = np.ones(capacity, np.int32)
+        self.color = np.zeros(capacity, np.intp)
+        self.count = 0
+
+        # Every effect color at each fade step, and where each effect's colors
+        # start in the palette
+        self.palette = []
+        self.first_colors = {}
+        for kind, (_, _, _, colors) in effects.items():
+            self.first_colors[kind] = len(self.palette)
+            for color in colors:
+                self.palette.extend(tuple(round(value * (step + 1)
+                    / fade_steps) for value in color)
+                    for step in range(fade_steps))
+
+        # Palette in a surface's pixel format, and the surface it's for
+        self.mapped_palette = None
+        self.palette_surface = None
+
+        # Pixel positions found by prepare() for draw() to write to
+        self.draw_x = np.zeros(0, np.intp)
+        self.draw_y = np.zeros(0, np.intp)
+        self.draw_color = np.zeros(0, np.intp)
+
+    """Spawn the debris for an effect of the given kind at (x, y)."""
+    def emit(self, kind, x, y):
+
+        count, speed, lifetime, colors = effects[kind]
+        count = min(count, len(self.x) - self.count)
+        if count <= 0:
+            return
+
+        # Fling debris in random directions at random speeds, and give it
+        # slightly different lifetimes so it doesn't vanish all at once
+        new = slice(self.count, self.count + count)
+        angles = self.random.uniform(0, 2 * np.pi, count)
+        speeds = self.random.uniform(0.2, 1, count) * speed
+        self.x[new] = x
+        self.y[new] = y
+        self.velocity_x[new] = np.cos(angles) * speeds
+        self.velocity_y[new] = np.sin(angles) * speeds
+        ticks = max(1, round(lifetime / 1000 / self.dt))
+        self.lifetime[new] = self.random.integers(ticks // 2, ticks + 1,
+            count)
+        self.life[new] = self.lifetime[new]
+        self.color[new] = self.first_colors[kind] + (self.random.integers(
+            len(colors), size=count) * fade_steps)
+
+        self.count += count
+
+    """Spawn debris for every (kind, x, y) effect event."""
+    def emit_events(self, events):
+
+        for kind, x, y in events:
+            self.emit(kind, x, y)
+
+    """Move every particle by a tick, removing particles that died or left the
+    screen."""
+    def update(self):
+
+        count = self.count
+        if not count:
+            return
+
+        x, y = self.x[:count], self.y[:count]
+        velocity_y = self.velocity_y[:count]
+        x += self.velocity_x[:count] * self.dt
+        y += velocity_y * self.dt
+        velocity_y += gravity * self.dt
+        life = self.life[:count]
+        life -= 1
+
+        # Move the living particles to the start of the arrays
+        alive = ((life > 0) & (x >= 0) & (x < self.screen_rect.width)
+            & (y >= 0) & (y < self.screen_rect.height))
+        if not alive.all():
+            keep = np.flatnonzero(alive)
+            self.count = len(keep)
+            for array in (self.x, self.y, self.velocity_x, self.velocity_y,
+                    self.life, self.lifetime, self.color):
+                array[:self.count] = array[keep]
+
+    """Find where to draw every particle, alpha (0 to 1) of the way between
+    the last two ticks, and return the rect they cover (or None if there
+    are no particles)."""
+    def prepare(self, alpha):
+
+        count = self.count
+        if not count:
+            self.draw_x = self.draw_y = self.draw_color = self.draw_x[:0]
+            return None
+
+        # Step back from the latest positions by the rest of the tick
+        back = (1 - alpha) * self.dt
+        draw_x = (self.x[:count] - (self.velocity_x[:count] * back)).astype(
+            np.intp)
+        draw_y = (self.y[:count] - (self.velocity_y[:count] * back)).astype(
+            np.intp)
+
+        # Pick each particle's fade step from how much of its life is left
+        fade = (self.life[:count] * fade_steps - 1) // self.lifetime[:count]
+        draw_color = self.color[:count] + fade
+
+        # Skip particles stepped back off-screen
+        on_screen = ((draw_x >= 0) & (draw_x < self.screen_rect.width)
+            & (draw_y >= 0) & (draw_y < self.screen_rect.height))
+        if not on_screen.all():
+            draw_x, draw_y = draw_x[on_screen], draw_y[on_screen]
+            draw_color = draw_color[on_screen]
+        self.draw_x, self.draw_y, self.draw_color = draw_x, draw_y, draw_color
+
+        if not len(draw_x):
+            return None
+        left, top = int(draw_x.min()), int(draw_y.min())
+        return pygame.Rect(left, top, int(draw_x.max()) - left + 1,
+            int(draw_y.max()) - top + 1)
+
+    """Write every particle found by prepare() into a surface's pixels."""
+    def draw(self, surface):
+
+        if not len(self.draw_x):
+            return
+
+        # Convert the palette to the surface's pixel format once
+        if surface is not self.palette_surface:
+            self.palette_surface = surface
+            self.mapped_palette = np.array([surface.map_rgb(color)
+                for color in self.palette], np.uint32)
+
+        # Write every particle at once (the pixel array locks the surface
+        # until it's deleted)
+        pixels = pygame.surfarray.pixels2d(surface)
+        pixels[self.draw_x, self.draw_y] = self.mapped_palette[self.draw_color]
+        del pixels
+
+    """Remove every particle."""
+    def clear(self):
+        self.count = 0
\ No newline at end of file
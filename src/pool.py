@@ -0,0 +1,47 @@
+# Author: Dakota Rubin
+# Date: October 18th, 2026
+# File: pool.py contains the object pool used by the Alien Invasion game.
+
+"""This class keeps a fixed number of reusable game objects, so short-lived
+objects like bullets are recycled instead of created and thrown away."""
+class Pool:
+
+    """Create every object the pool will ever hand out up front."""
+    def __init__(self, create_object, capacity):
+
+        self.free = [create_object() for _ in range(capacity)]
+        self.active = []
+
+    """Return an unused object (or None if they're all in use)."""
+    def acquire(self):
+
+        if not self.free:
+            return None
+
+        game_object = self.free.pop()
+        self.active.append(game_object)
+        return game_object
+
+    """Return an object to the pool so it can be reused."""
+    def release(self, game_object):
+
+        self.active.remove(game_object)
+        self.free.append(game_object)
+
+    """Return every active object to the pool."""
+    def empty(self):
+
+        self.free.extend(self.active)
+        self.active.clear()
+
+    """Return a list of active objects that's safe to release from."""
+    def copy(self):
+        return list(self.active)
+
+    """Loop over active objects."""
+    def __iter__(self):
+        return iter(self.active)
+
+    """Return the number of active objects."""
+    def __len__(self):
+        return len(self.active)
\ No newline at end of file
@@ -0,0 +1,110 @@
+# Author: Dakota Rubin
+# Date: October 18th, 2026
+# File: profiler.py contains the frame profiler for the Alien Invasion game.
+
+import json
+from collections import deque
+from time import perf_counter
+
+"""This class times each phase of a frame and keeps rolling percentiles.
+
+Phases are timed lap-style: mark(name) charges the time since the previous
+mark to name. While disabled, mark() does nothing, so it can be left in the
+game loop and the simulation for free."""
+class FrameProfiler:
+
+    """Initialize a profiler keeping history frames of timings, that saves a
+    trace of every phase to trace_path (if given)."""
+    def __init__(self, enabled=False, history=300, trace_path=None,
+            trace_limit=500000):
+
+        self.history = history
+        self.trace_path = trace_path
+
+        # Milliseconds spent in each phase over the latest frames, by name
+        self.phases = {}
+
+        # Seconds spent in each phase so far this frame, by name
+        self.frame = {}
+
+        # (name, start, duration) of every timed phase, for trace export
+        self.trace_events = deque(maxlen=trace_limit)
+
+        self.set_enabled(enabled)
+
+    """Turn profiling on or off."""
+    def set_enabled(self, enabled):
+
+        self.enabled = enabled
+        self.mark = self.record_mark if enabled else skip_mark
+        self.frame = {}
+        self.last_mark = perf_counter()
+
+    """Charge the time since the last mark to the named phase."""
+    def record_mark(self, name):
+
+        now = perf_counter()
+        elapsed = now - self.last_mark
+        self.frame[name] = self.frame.get(name, 0.0) + elapsed
+
+        if self.trace_path:
+            self.trace_events.append((name, self.last_mark, elapsed))
+
+        self.last_mark = now
+
+    """Store this frame's phase timings and start a new frame."""
+    def end_frame(self):
+
+        if not self.enabled:
+            return
+
+        frame = self.frame
+        phases = self.phases
+
+        # Phases that didn't run this frame took no time
+        for name in frame.keys() - phases.keys():
+            phases[name] = deque(maxlen=self.history)
+        for name, times in phases.items():
+            times.append(frame.get(name, 0.0) * 1000)
+
+        total = phases.setdefault("frame", deque(maxlen=self.history))
+        total.append(sum(frame.values()) * 1000)
+
+        self.frame = {}
+
+    """Return the given percentiles of a phase's time (in ms) per frame."""
+    def get_percentiles(self, name, percentiles=(50, 95, 99)):
+
+        times = sorted(self.phases.get(name, ()))
+        if not times:
+            return [0.0] * len(percentiles)
+
+        last = len(times) - 1
+        return [times[min(last, int(len(times) * percentile / 100))]
+            for percentile in percentiles]
+
+    """Return {phase: [p50, p95, p99]} for every phase, in ms."""
+    def get_summary(self):
+
+        return {name: self.get_percentiles(name)
+            for name in sorted(self.phases)}
+
+    """Save the recorded phases in Chrome's trace format (if tracing), which
+    can be opened in chrome://tracing or Perfetto."""
+    def save_trace(self):
+
+        if not self.trace_path:
+            return
+
+        # Trace events are in microseconds
+        trace_events = [{"name": name, "ph": "X", "pid": 0, "tid": 0,
+            "ts": start * 1e6, "dur": duration * 1e6}
+            for name, start, duration in self.trace_events]
+
+        with open(self.trace_path, "w") as file:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms",
+                "otherData": {"percentiles_ms": self.get_summary()}}, file)
+
+"""Stand-in for FrameProfiler.mark() while profiling is disabled."""
+def skip_mark(name):
+    pass
\ No newline at end of file
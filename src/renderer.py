@@ -0,0 +1,449 @@
+# Author: Dakota Rubin
+# Date: October 18th, 2026
+# File: renderer.py draws the Alien Invasion game window.
+
+import numpy as np
+import pygame
+
+from scoreboard import Scoreboard
+from button import Button
+from text_box import TextBox
+from assets import load_image, get_font
+from profiler import FrameProfiler
+
+"""This class draws a game simulation to the game window."""
+class Renderer:
+
+    """Create the game window and load everything needed to draw it."""
+    def __init__(self, settings):
+
+        self.settings = settings
+
+        # Create game window with dimensions from settings.py
+        # (SDL only honors vsync on scaled or OpenGL windows)
+        if self.settings.vsync:
+            self.screen = pygame.display.set_mode((self.settings.screen_width,
+                self.settings.screen_height), pygame.SCALED, vsync=1)
+        else:
+            self.screen = pygame.display.set_mode((
+                self.settings.screen_width, self.settings.screen_height))
+        self.screen_rect = self.screen.get_rect()
+        self.background = load_image("../images/background/background.png",
+            alpha=False)
+        pygame.display.set_caption("Alien Invasion")
+
+        # Create all menu buttons and text boxes
+        self.create_menu_ui()
+
+        # Profiler to time drawing with and show the overlay of (if enabled)
+        self.profiler = FrameProfiler()
+        self.profiler_image = None
+        self.profiler_rect = pygame.Rect(0, 0, 0, 0)
+        self.profiler_refresh_time = 0
+
+        # Images of each row of living aliens drawn together (with their
+        # top-left in the fleet and alien count), each alien's row, and the
+        # fleet, fleet version and living aliens they show
+        self.fleet_rows = None
+        self.alien_rows = {}
+        self.shown_fleet = None
+        self.shown_fleet_version = None
+        self.shown_aliens = None
+
+        # Debris particles to draw over the game (if any), and the rect they
+        # covered last frame
+        self.particles = None
+        self.particle_rect = None
+
+        # First frame always redraws the whole screen
+        self.full_redraw = True
+
+    """Attach a game simulation to draw and create its scoreboard."""
+    def attach(self, simulation):
+
+        self.simulation = simulation
+
+        # Store game stats and scorekeeping info
+        self.stats = simulation.stats
+        self.scoreboard = Scoreboard(self)
+
+    """Create menu buttons and text boxes."""
+    def create_menu_ui(self):
+
+        # Calculate center button coordinates
+        center_button_x = (self.settings.screen_width / 2) - 100
+        center_button_y = (self.settings.screen_height / 2) - 25
+
+        # Create title text box with given attributes
+        self.title_text_box = TextBox(self, "Alien Invasion", (0, 0, 255),
+            (255, 255, 255), 480, 100,
+            get_font("../font/8_bit_madness.ttf", 72),
+            center_button_x - 140, center_button_y - 120)
+
+        # Create play buttons with given text, colors and coordinates
+        self.easy_mode_button = Button(self, "Easy", (0, 255, 0),
+            center_button_x - 210, center_button_y)
+        self.medium_mode_button = Button(self, "Medium", (255, 255, 0),
+            center_button_x, center_button_y)
+        self.hard_mode_button = Button(self, "Hard", (255, 0, 0),
+            center_button_x + 210, center_button_y)
+
+        # Load menu controls image
+        self.controls_image = load_image("../images/menu/controls.png")
+        self.controls_rect = self.controls_image.get_rect(topleft=(240, 445))
+
+        # Store every menu region, to know when it needs redrawing
+        self.menu_rects = [self.title_text_box.rect,
+            self.easy_mode_button.rect, self.medium_mode_button.rect,
+            self.hard_mode_button.rect, self.controls_rect]
+
+    """Draw the latest game state to the screen.
+
+    Moving sprites are drawn alpha (0 to 1) of the way between their
+    positions at the previous tick and the latest tick."""
+    def draw(self, alpha=1.0):
+
+        # Redraw the whole screen when the menu opens or closes, otherwise
+        # only update the parts of the screen that changed (if enabled)
+        if (self.settings.dirty_rendering and not self.full_redraw
+                and self.simulation.game_active == self.shown_game_active):
+            self.draw_dirty(alpha)
+        else:
+            self.draw_full(alpha)
+
+    """Redraw every game element and flip to new screen."""
+    def draw_full(self, alpha):
+
+        simulation = self.simulation
+        self.screen.blit(self.background, (0, 0))
+
+        # Re-draw blocks with updated shapes
+        for block in simulation.blocks:
+            self.screen.blit(block.image, block.rect)
+
+        # Draw moving game elements and particles, remembering where they
+        # were drawn
+        moving_sprites = self.get_moving_sprites(alpha)
+        self.draw_moving_sprites(moving_sprites)
+        self.drawn_rects = self.clip_rects(moving_sprites)
+        self.draw_particles(alpha)
+        self.scoreboard.show_score()
+
+        # Draw profiler overlay (if enabled)
+        if self.profiler.enabled:
+            self.check_profiler_overlay()
+            self.screen.blit(self.profiler_image, self.profiler_rect)
+
+        # Draw title box, play buttons and controls image if game state inactive
+        if not simulation.game_active:
+            self.draw_menu()
+
+        self.profiler.mark("render")
+        pygame.display.flip()
+        self.profiler.mark("flip")
+
+        # Remember what's on screen for the next dirty rect update
+        self.full_redraw = False
+        self.shown_game_active = simulation.game_active
+        self.shown_block_cells = [block.cell_count
+            for block in simulation.blocks]
+
+    """Redraw only the screen regions that changed since the last frame."""
+    def draw_dirty(self, alpha):
+
+        simulation = self.simulation
+
+        # Find where moving game elements were drawn last frame and where
+        # they'll be drawn this frame
+        moving_sprites = self.get_moving_sprites(alpha)
+        new_rects = self.clip_rects(moving_sprites)
+        changed_rects = self.drawn_rects + new_rects
+
+        # Particles are erased and redrawn like one more moving sprite
+        shown_particle_rect = self.particle_rect
+        particle_rect = self.prepare_particles(alpha)
+        if shown_particle_rect:
+            changed_rects.append(shown_particle_rect)
+        if particle_rect:
+            changed_rects.append(particle_rect)
+
+        # Scoreboard and menu images are blended onto the background, so
+        # erase them fully before drawing them again
+        scoreboard_rects = self.scoreboard.get_rects()
+        redraw_scoreboard = (self.scoreboard.check_stats()
+            or touches(scoreboard_rects, changed_rects))
+        if redraw_scoreboard:
+            scoreboard_rects.extend(self.scoreboard.get_rects())
+        else:
+            scoreboard_rects = []
+        profiler_rects = []
+        if self.profiler.enabled:
+            shown_profiler_rect = self.profiler_rect
+            if (self.check_profiler_overlay()
+                    or shown_profiler_rect.collidelist(changed_rects) != -1):
+                profiler_rects = [shown_profiler_rect, self.profiler_rect]
+        menu_rects = []
+        if not simulation.game_active and touches(self.menu_rects,
+                changed_rects):
+            menu_rects = self.menu_rects
+
+        # Erase moving game elements and particles drawn last frame and
+        # outdated overlays
+        restored_rects = (self.drawn_rects + scoreboard_rects + profiler_rects
+            + menu_rects)
+        if shown_particle_rect:
+            restored_rects.append(shown_particle_rect)
+        for rect in restored_rects:
+            self.restore_background(rect)
+
+        # Redraw blocks that lost cells, or just draw blocks over the erased
+        # regions they overlap
+        dirty_rects = restored_rects + new_rects
+        if particle_rect:
+            dirty_rects.append(particle_rect)
+        for index, block in enumerate(simulation.blocks):
+            if block.cell_count != self.shown_block_cells[index]:
+                self.restore_background(block.rect)
+                self.screen.blit(block.image, block.rect)
+                dirty_rects.append(block.rect)
+                self.shown_block_cells[index] = block.cell_count
+            elif block.rect.collidelist(restored_rects) != -1:
+                self.screen.blit(block.image, block.rect)
+
+        # Draw moving game elements and particles at their new positions,
+        # then overlays
+        self.draw_moving_sprites(moving_sprites)
+        if particle_rect:
+            self.particles.draw(self.screen)
+        self.drawn_rects = new_rects
+        if redraw_scoreboard:
+            self.scoreboard.show_score()
+        if profiler_rects:
+            self.screen.blit(self.profiler_image, self.profiler_rect)
+        if menu_rects:
+            self.draw_menu()
+
+        self.profiler.mark("render")
+        pygame.display.update(dirty_rects)
+        self.profiler.mark("flip")
+
+    """Return (image, rect) pairs for bullets, ship, aliens and explosions.
+
+    Bullets are plain rectangles, so their color is used as their image."""
+    def get_moving_sprites(self, alpha):
+
+        simulation = self.simulation
+        moving_sprites = []
+
+        # Sprites only move while playing, so their previous positions go
+        # stale in pauses and menus (draw them where they stopped, so they
+        # don't shake between positions)
+        if simulation.state != "playing":
+            alpha = 1.0
+
+        # Active bullets and alien bullets with updated positions
+        for bullet in simulation.bullets:
+            moving_sprites.append((bullet.color,
+                pygame.Rect(interpolate(bullet, alpha), bullet.rect.size)))
+        for alien_bullet in simulation.alien_bullets:
+            moving_sprites.append((alien_bullet.color, pygame.Rect(
+                interpolate(alien_bullet, alpha), alien_bullet.rect.size)))
+
+        # Player ship if it hasn't been destroyed
+        if simulation.alien_at_bottom or simulation.state != "life_lost":
+            for ship in simulation.ship_group.sprites():
+                moving_sprites.append((ship.image,
+                    pygame.Rect(interpolate(ship, alpha), ship.rect.size)))
+
+        # Alien fleet moves as one, so each row of aliens is drawn as one
+        # image at the fleet's offset (or alien by alien if it can't be)
+        fleet = simulation.fleet
+        self.check_fleet_images(fleet)
+        if self.fleet_rows is not None:
+            offset_x, offset_y = fleet.get_draw_offset(alpha)
+            for image, left, top, alien_count in self.fleet_rows:
+                if alien_count:
+                    moving_sprites.append((image, pygame.Rect(
+                        (left + offset_x, top + offset_y), image.get_size())))
+        else:
+            for alien, x, y in fleet.get_draw_positions(alpha):
+                moving_sprites.append((alien.image,
+                    pygame.Rect((x, y), alien.rect.size)))
+
+        # Explosions
+        for explosion in simulation.explosions:
+            moving_sprites.append((explosion.image, explosion.rect))
+
+        return moving_sprites
+
+    """Keep the fleet images up to date, erasing aliens destroyed since they
+    were drawn and redrawing them for a new fleet."""
+    def check_fleet_images(self, fleet):
+
+        alive = fleet.alive
+        if (fleet is self.shown_fleet
+                and fleet.version == self.shown_fleet_version):
+
+            # Usually nothing changed, or a few aliens were destroyed
+            if np.array_equal(alive, self.shown_aliens):
+                return
+            if not (alive & ~self.shown_aliens).any():
+                self.erase_aliens(fleet, self.shown_aliens & ~alive)
+                return
+
+        self.draw_fleet_images(fleet)
+
+    """Draw each row of living aliens into its own image."""
+    def draw_fleet_images(self, fleet):
+
+        self.shown_fleet = fleet
+        self.shown_fleet_version = fleet.version
+        self.shown_aliens = fleet.alive.copy()
+        self.fleet_rows = None
+
+        # Aliens only snap to the same pixels as the images if they start on
+        # whole pixels (fleet spacing can leave them between pixels)
+        indexes = np.flatnonzero(fleet.alive)
+        alien_x, alien_y = fleet.x[indexes], fleet.y[indexes]
+        if (alien_x % 1).any() or (alien_y % 1).any():
+            return
+
+        self.fleet_rows = []
+        self.alien_rows = {}
+        for row_y in np.unique(alien_y).tolist():
+
+            # Create a transparent image covering the row's living aliens
+            row_indexes = indexes[alien_y == row_y]
+            row_x = fleet.x[row_indexes]
+            left = int(row_x.min())
+            image = pygame.Surface((int(row_x.max()) - left + fleet.width,
+                fleet.height), pygame.SRCALPHA).convert_alpha()
+
+            # Copy each alien's pixels in (aliens never overlap, so taking the
+            # brightest color and alpha copies them without blending)
+            for index, x in zip(row_indexes.tolist(), (row_x - left).tolist()):
+                image.blit(fleet.aliens[index].image, (x, 0),
+                    special_flags=pygame.BLEND_RGBA_MAX)
+                self.alien_rows[index] = len(self.fleet_rows)
+
+            # Run-length encode the row, so drawing it skips straight over the
+            # gaps between aliens
+            image.set_alpha(255, pygame.RLEACCEL)
+
+            # Store the image, its top-left in the fleet and its alien count
+            self.fleet_rows.append([image, left, int(row_y), len(row_indexes)])
+
+    """Clear destroyed aliens (a bool array over the fleet) out of the fleet
+    images."""
+    def erase_aliens(self, fleet, destroyed):
+
+        self.shown_aliens &= ~destroyed
+        if self.fleet_rows is None:
+            return
+
+        # Only the destroyed aliens' rows get encoded again
+        for index in np.flatnonzero(destroyed).tolist():
+            row = self.fleet_rows[self.alien_rows[index]]
+            image, left, _, _ = row
+            image.fill((0, 0, 0, 0), (int(fleet.x[index]) - left, 0,
+                fleet.width, fleet.height))
+            row[3] -= 1
+
+    """Draw (image, rect) pairs from get_moving_sprites()."""
+    def draw_moving_sprites(self, moving_sprites):
+
+        # Fill only the on-screen part of bullets, since fill() doesn't
+        # shrink rects that stick out past the top of the screen
+        for image, rect in moving_sprites:
+            if isinstance(image, tuple):
+                self.screen.fill(image, rect.clip(self.screen_rect))
+            else:
+                self.screen.blit(image, rect)
+
+    """Draw title box, play buttons and controls image."""
+    def draw_menu(self):
+
+        self.title_text_box.draw_text_box()
+        self.easy_mode_button.draw_button()
+        self.medium_mode_button.draw_button()
+        self.hard_mode_button.draw_button()
+        self.screen.blit(self.controls_image, self.controls_rect)
+
+    """Re-render the profiler overlay if it's due for a refresh.
+
+    Returns True if the overlay was re-rendered."""
+    def check_profiler_overlay(self):
+
+        # Rendering text is slow, so only refresh a few times per second
+        now = pygame.time.get_ticks()
+        if self.profiler_image and now < self.profiler_refresh_time:
+            return False
+        self.profiler_refresh_time = now + 250
+
+        # One line per phase: name, then p50, p95 and p99 times in ms
+        font = get_font("../font/8_bit_madness.ttf", 24)
+        lines = [("phase (ms)", "p50", "p95", "p99")]
+        for name, percentiles in self.profiler.get_summary().items():
+            lines.append((name,) + tuple(f"{time:.2f}"
+                for time in percentiles))
+
+        # Draw each column of text right-aligned after the phase names
+        line_height = font.get_linesize()
+        self.profiler_image = pygame.Surface((420,
+            (len(lines) * line_height) + 10))
+        for row, line in enumerate(lines):
+            y = 5 + (row * line_height)
+            for column, text in enumerate(line):
+                image = font.render(text, True, (255, 255, 255))
+                if column == 0:
+                    self.profiler_image.blit(image, (10, y))
+                else:
+                    self.profiler_image.blit(image,
+                        image.get_rect(topright=(250 + (column * 55), y)))
+
+        # Position overlay at the top-right of the screen below the level
+        self.profiler_rect = self.profiler_image.get_rect(
+            topright=(self.scoreboard.level_rect.right,
+            self.scoreboard.level_rect.bottom + 20))
+
+        return True
+
+    """Find where to draw the particles (if there are any), and return the
+    rect they cover (or None)."""
+    def prepare_particles(self, alpha):
+
+        self.particle_rect = None
+        if self.particles:
+            self.particle_rect = self.particles.prepare(alpha)
+        return self.particle_rect
+
+    """Draw the particles (if there are any) at their positions alpha (0 to
+    1) of the way between the last two ticks."""
+    def draw_particles(self, alpha):
+
+        if self.prepare_particles(alpha):
+            self.particles.draw(self.screen)
+
+    """Return the on-screen part of each rect from get_moving_sprites()."""
+    def clip_rects(self, moving_sprites):
+        return [rect.clip(self.screen_rect) for _, rect in moving_sprites]
+
+    """Copy the background image over the given screen region."""
+    def restore_background(self, rect):
+        self.screen.blit(self.background, rect, rect)
+
+"""Return the position between a sprite's previous and latest tick positions."""
+def interpolate(sprite, alpha):
+
+    previous_x, previous_y = sprite.previous_position
+    return (previous_x + ((sprite.rect.x - previous_x) * alpha),
+        previous_y + ((sprite.rect.y - previous_y) * alpha))
+
+"""Return True if any of the given rects overlap any of the other rects."""
+def touches(rects, other_rects):
+
+    for rect in rects:
+        if rect.collidelist(other_rects) != -1:
+            return True
+
+    return False
\ No newline at end of file
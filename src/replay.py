@@ -0,0 +1,138 @@
+# Author: Dakota Rubin
+# Date: October 18th, 2026
+# File: replay.py records and replays Alien Invasion rounds tick by tick.
+
+import argparse, json, time, zlib
+
+from settings import Settings
+from simulation import Simulation
+
+"""This class records the input fed to the simulation every tick of each
+round.
+
+A recording holds every round played, one after another. Each round is a
+one-line JSON header (round settings, seed, the stats the round ended with
+and the length of its input) followed by one zlib-compressed byte of input
+per tick."""
+class Recorder:
+
+    """Initialize a recorder that saves rounds to the given file, replacing
+    any recording already in it."""
+    def __init__(self, path):
+
+        self.path = path
+        self.header = None
+        self.actions = bytearray()
+
+        # Start with an empty file, so rounds can be added to the end of it
+        open(path, "wb").close()
+
+    """Start recording a new round, played with the given stress scales."""
+    def start(self, mode, alien_firing_speed, seed, stress_scales=None):
+
+        self.header = {"version": 2, "mode": mode,
+            "alien_firing_speed": alien_firing_speed, "seed": seed,
+            "stress": stress_scales or {}}
+        self.actions = bytearray()
+
+    """Record the input for a single tick."""
+    def record(self, actions):
+        self.actions.append(actions)
+
+    """Add the recorded round and the stats it ended with to the end of the
+    file."""
+    def save(self, stats):
+
+        if self.header is None:
+            return
+
+        actions = zlib.compress(bytes(self.actions), 9)
+        header = dict(self.header, ticks=len(self.actions), score=stats.score,
+            level=stats.level, ships_left=stats.ships_left,
+            length=len(actions))
+
+        with open(self.path, "ab") as file:
+            file.write(json.dumps(header).encode() + b"\n")
+            file.write(actions)
+
+        # Each round is only saved once
+        self.header = None
+
+"""Load a recording, return the header and per-tick input bytes of every
+round in it."""
+def load_replay(path):
+
+    rounds = []
+
+    with open(path, "rb") as file:
+        for header_line in iter(file.readline, b""):
+
+            # Version 1 recordings hold one round, with no input length
+            header = json.loads(header_line)
+            compressed = file.read(header.get("length", -1))
+            rounds.append((header, zlib.decompress(compressed)))
+
+    return rounds
+
+"""Return settings matching the ones a recording was made with."""
+def get_replay_settings(header):
+
+    settings = Settings()
+    settings.apply_stress(header.get("stress", {}))
+    return settings
+
+"""Replay a recording on a simulation as fast as possible."""
+def play_replay(simulation, header, actions):
+
+    simulation.start_round(header["mode"], header["alien_firing_speed"],
+        header["seed"])
+
+    for tick_actions in actions:
+        simulation.step(tick_actions)
+
+"""Return True if a simulation ended a replay with the recorded stats."""
+def check_replay(simulation, header):
+
+    stats = simulation.stats
+    return ((stats.score, stats.level, stats.ships_left)
+        == (header["score"], header["level"], header["ships_left"]))
+
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Replay recorded rounds.")
+    parser.add_argument("path", help="recording made with --record")
+    parser.add_argument("--headless", action="store_true",
+        help="replay without a window, as fast as possible")
+    parser.add_argument("--speed", type=float, default=1.0,
+        help="playback speed when replaying in a window")
+    args = parser.parse_args()
+
+    rounds = load_replay(args.path)
+    if not rounds:
+        parser.error(f"{args.path} has no recorded rounds")
+
+    if args.headless:
+
+        for number, (header, actions) in enumerate(rounds, 1):
+
+            simulation = Simulation(get_replay_settings(header))
+            start_time = time.perf_counter()
+            play_replay(simulation, header, actions)
+            elapsed_time = time.perf_counter() - start_time
+
+            print(f"Round {number}: replayed {len(actions):,} ticks in "
+                f"{elapsed_time:.3f} s ({len(actions) / elapsed_time:,.0f} "
+                "ticks/s)")
+            print("Final stats match recording:",
+                check_replay(simulation, header))
+
+    else:
+
+        # Rounds in a recording are all played with the same settings
+        from alien_invasion import AlienInvasion
+        game = AlienInvasion(settings=get_replay_settings(rounds[0][0]))
+        game.watch_replay(rounds, args.speed)
\ No newline at end of file
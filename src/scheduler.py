@@ -0,0 +1,49 @@
+# Author: Dakota Rubin
+# Date: October 18th, 2026
+# File: scheduler.py contains the tick-based event scheduler for the Alien
+# Invasion game.
+
+import heapq
+
+"""This class calls functions once the simulation reaches a given tick.
+
+Events due on the same tick run in the order they were scheduled, so the
+game plays out the same every time, and events scheduled while events run
+still run this tick if they're already due."""
+class Scheduler:
+
+    """Initialize a scheduler with no events."""
+    def __init__(self):
+
+        # Heap of [tick, order scheduled, function, arguments] lists
+        self.events = []
+        self.scheduled_count = 0
+
+    """Call a function with the given arguments at a tick, return the event
+    (to cancel it with)."""
+    def schedule(self, tick, function, *args):
+
+        event = [tick, self.scheduled_count, function, args]
+        self.scheduled_count += 1
+        heapq.heappush(self.events, event)
+        return event
+
+    """Stop a scheduled event from running."""
+    def cancel(self, event):
+
+        # Cancelled events stay in the heap until they're due, then get
+        # skipped, since removing them from the middle of a heap is slow
+        event[2] = None
+
+    """Run every event due by the given tick."""
+    def run(self, tick):
+
+        events = self.events
+        while events and events[0][0] <= tick:
+            _, _, function, args = heapq.heappop(events)
+            if function:
+                function(*args)
+
+    """Remove every scheduled event."""
+    def clear(self):
+        self.events.clear()
\ No newline at end of file
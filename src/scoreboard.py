@@ -2,9 +2,9 @@
 # Date: August 6th, 2023
 # File: scoreboard.py contains all scoring info for the Alien Invasion game.
 
-import pygame.font
 from pygame.sprite import Group
 from ship import Ship
+from assets import get_font
 
 """This class contains all scorekeeping for Alien Invasion."""
 class Scoreboard:
@@ -21,7 +21,7 @@ class Scoreboard:
 
         # Font settings for scorekeeping information
         self.text_color = (255, 255, 255)
-        self.font = pygame.font.Font("../font/8_bit_madness.ttf", 48)
+        self.font = get_font("../font/8_bit_madness.ttf", 48)
 
         # Load all scoring system info to the screen
         self.prep_images()
@@ -29,6 +29,10 @@ class Scoreboard:
     """Prepare score, high score, level and ship images for display."""
     def prep_images(self):
 
+        # Remember which stats the images were rendered from
+        self.shown_stats = (self.stats.score, self.stats.high_score,
+            self.stats.level, self.stats.ships_left)
+
         self.prep_score()
         self.prep_high_score()
         self.prep_level()
@@ -62,14 +66,6 @@ class Scoreboard:
         self.high_score_rect.centerx = self.screen_rect.centerx
         self.high_score_rect.top = self.score_rect.top
 
-    """Check for new high score."""
-    def check_high_score(self):
-
-        # Overwrite existing high score with new higher score
-        if self.stats.score > self.stats.high_score:
-            self.stats.high_score = self.stats.score
-            self.prep_high_score()
-
     """Render level image."""
     def prep_level(self):
 
@@ -105,9 +101,39 @@ class Scoreboard:
             ship.rect.y = 10
             self.ships.add(ship)
 
+    """Re-render any images whose stats changed since they were last shown.
+
+    Returns True if any image was re-rendered."""
+    def check_stats(self):
+
+        shown_stats = self.shown_stats
+        score, high_score, level, ships_left = shown_stats
+
+        if self.stats.score != score:
+            self.prep_score()
+        if self.stats.high_score != high_score:
+            self.prep_high_score()
+        if self.stats.level != level:
+            self.prep_level()
+        if self.stats.ships_left != ships_left:
+            self.prep_ships()
+
+        self.shown_stats = (self.stats.score, self.stats.high_score,
+            self.stats.level, self.stats.ships_left)
+
+        return self.shown_stats != shown_stats
+
+    """Return the screen regions covered by the scoreboard images."""
+    def get_rects(self):
+
+        return ([self.score_rect, self.high_score_rect, self.level_rect,
+            self.lives_rect] + [ship.rect for ship in self.ships.sprites()])
+
     """Draw score, high score, level and remaining lives to the screen."""
     def show_score(self):
 
+        self.check_stats()
+
         self.screen.blit(self.score_image, self.score_rect)
         self.screen.blit(self.high_score_image, self.high_score_rect)
         self.screen.blit(self.level_image, self.level_rect)
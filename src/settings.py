@@ -2,6 +2,12 @@
 # Date: August 3rd, 2023
 # File: settings.py contains all settings for the Alien Invasion game.
 
+import math
+
+# Settings apply_stress() can multiply
+stress_names = ("fleet_columns", "fleet_rows", "fire_rate", "bullets",
+    "shields", "resolution")
+
 """This class stores all settings for Alien Invasion."""
 class Settings:
 
@@ -12,6 +18,28 @@ class Settings:
         self.screen_width = 1280
         self.screen_height = 800
 
+        # Simulation settings (game rules are updated 60 times per second)
+        self.ticks_per_second = 60
+
+        # Audio settings (mixer buffer size in samples, smaller buffers play
+        # sounds sooner after they're triggered)
+        self.audio_buffer = 512
+
+        # Mixer channels reserved for each sound category, which also caps
+        # how many sounds can play at once
+        self.audio_channels = {"player": 2, "alien": 2, "impact": 2,
+            "explosion": 3, "event": 1}
+
+        # Rendering settings (max_fps of 0 means uncapped frame rate)
+        self.max_fps = 120
+        self.vsync = False
+
+        # Only redraw screen regions that changed since the last frame
+        self.dirty_rendering = True
+
+        # Longest frame (in seconds) the simulation will catch up on at once
+        self.max_frame_time = 0.25
+
         # Initial game difficulty
         self.mode = "medium"
 
@@ -24,16 +52,48 @@ class Settings:
         self.bullet_color = (0, 255, 0)
         self.alien_bullet_color = (255, 0, 0)
         self.bullet_limit = 7
+        self.alien_bullet_limit = 16
+
+        # Explosion settings (most explosions on-screen at a time)
+        self.explosion_limit = 32
 
-        # Alien settings
+        # Particle settings (most debris particles on-screen at a time)
+        self.particle_limit = 50000
+
+        # Collision grid cell size (in pixels)
+        self.collision_cell_size = 64
+
+        # Check sprite pixels (not just rects) for alien and ship collisions,
+        # so transparent corners don't count as hits
+        self.pixel_collisions = True
+
+        # Alien settings (fleet drops this many pixels at each screen edge)
         self.fleet_drop_speed = 10
 
+        # Distance between neighboring aliens' top-left corners, in alien
+        # widths (columns) and alien heights (rows)
+        self.fleet_column_spacing = 2.0
+        self.fleet_row_spacing = 1.5
+
+        # Alien bullets fired every alien_firing_speed ms
+        self.alien_fire_rate = 1.0
+
+        # Block settings (blocks that don't fit in one row are stacked)
+        self.block_count = 4
+
+        # Multipliers applied by apply_stress(), by name
+        self.stress_scales = {}
+
         # Gameplay speed growth rate
         self.speedup_scale = 1.1
 
         # Alien point value growth rate
         self.score_scale = 1.5
 
+        # Time (in ms) the game pauses after losing a life, and between levels
+        self.life_lost_time = 500
+        self.level_transition_time = 0
+
         self.initialize_dynamic_settings(self.mode)
 
     """Initialize game settings that change over time."""
@@ -45,18 +105,52 @@ class Settings:
         # Scoring settings
         self.alien_points = 50
 
+        # Speeds are in pixels per second
         if mode == "easy":
-            self.ship_speed = 4.0
-            self.bullet_speed = 6.0
-            self.alien_speed = 1.0
+            self.ship_speed = 240.0
+            self.bullet_speed = 360.0
+            self.alien_speed = 60.0
         elif mode == "medium":
-            self.ship_speed = 5.0
-            self.bullet_speed = 7.0
-            self.alien_speed = 1.25
+            self.ship_speed = 300.0
+            self.bullet_speed = 420.0
+            self.alien_speed = 75.0
         elif mode == "hard":
-            self.ship_speed = 6.0
-            self.bullet_speed = 8.0
-            self.alien_speed = 1.5
+            self.ship_speed = 360.0
+            self.bullet_speed = 480.0
+            self.alien_speed = 90.0
+
+    """Multiply fleet rows and columns, alien fire rate, bullet limit, block
+    count and screen size by the factors in scales, to stress test the game.
+
+    Aliens can't overlap, so the fleet stops growing once aliens touch."""
+    def apply_stress(self, scales):
+
+        for name, factor in scales.items():
+            if name not in stress_names:
+                raise ValueError(f"Unknown stress setting: {name}")
+            if not 0 < factor < math.inf:
+                raise ValueError(f"Stress factor for {name} must be positive, "
+                    f"not {factor}")
+        self.stress_scales = dict(scales)
+
+        self.fleet_column_spacing = max(1.0,
+            self.fleet_column_spacing / scales.get("fleet_columns", 1))
+        self.fleet_row_spacing = max(1.0,
+            self.fleet_row_spacing / scales.get("fleet_rows", 1))
+
+        # Allow enough alien bullets on-screen for the faster fire rate
+        fire_rate = scales.get("fire_rate", 1)
+        self.alien_fire_rate *= fire_rate
+        self.alien_bullet_limit = math.ceil(self.alien_bullet_limit * fire_rate)
+
+        self.bullet_limit = math.ceil(self.bullet_limit
+            * scales.get("bullets", 1))
+        self.block_count = max(1, round(self.block_count
+            * scales.get("shields", 1)))
+
+        resolution = scales.get("resolution", 1)
+        self.screen_width = round(self.screen_width * resolution)
+        self.screen_height = round(self.screen_height * resolution)
 
     """Increase game element speed and point value growth rate."""
     def increase_speed(self):
@@ -0,0 +1,771 @@
+# Author: Dakota Rubin
+# Date: October 18th, 2026
+# File: simulation.py contains the game rules for Alien Invasion, without any
+# window, sound or keyboard handling, so the game can be stepped headless.
+
+import math, pygame
+from random import Random
+
+from settings import Settings
+from game_stats import GameStats
+from ship import Ship
+from bullet import Bullet
+from alien import Alien
+from fleet import Fleet
+from alien_bullet import AlienBullet
+from explosion import Explosion, display_time, frame_count
+from spatial_hash import SpatialHash
+from pool import Pool
+import block
+from assets import image_size
+from profiler import FrameProfiler
+from scheduler import Scheduler
+
+# Player input flags, combined with "|" into a single input value per tick
+MOVE_LEFT = 1
+MOVE_RIGHT = 2
+FIRE = 4
+
+"""This class manages game objects and rules for Alien Invasion."""
+class Simulation:
+
+    """Initialize game state and create game objects."""
+    def __init__(self, settings=None):
+
+        # Store game settings and the playing field's dimensions
+        self.settings = settings or Settings()
+        self.screen_rect = pygame.Rect(0, 0, self.settings.screen_width,
+            self.settings.screen_height)
+
+        # Store game stats
+        self.stats = GameStats(self)
+
+        # Create the random number generator used for every game decision,
+        # reseeded every round so rounds can be replayed exactly
+        self.seed = 0
+        self.random = Random(self.seed)
+
+        # Create a sprite group to contain the player ship
+        self.ship = Ship(self)
+        self.ship_group = pygame.sprite.Group()
+
+        # Create pools of reusable bullets and alien bullets
+        self.bullets = Pool(lambda: Bullet(self), self.settings.bullet_limit)
+        self.alien_bullets = Pool(lambda: AlienBullet(self),
+            self.settings.alien_bullet_limit)
+
+        # Create collision grids so collision checks only look at nearby
+        # blocks and aliens (aliens are stored at their starting positions,
+        # since the whole fleet moves together)
+        self.block_grid = SpatialHash(self.settings.collision_cell_size)
+        self.alien_grid = SpatialHash(self.settings.collision_cell_size)
+
+        # Create a list to contain all blocks
+        self.shape = block.shape
+        self.block_size = 8
+        self.blocks = []
+        self.create_multiple_blocks(0, self.settings.screen_height - 120)
+
+        # Create a sprite group to contain active aliens, and a fleet to
+        # store and move their positions
+        self.aliens = pygame.sprite.Group()
+        self.fleet = Fleet(self)
+
+        # Create a cache of solid masks (by size) for pixel collisions
+        self.solid_masks = {}
+
+        # Create a pool of reusable explosions
+        self.explosions = Pool(Explosion, self.settings.explosion_limit)
+
+        # Ticks since the round started
+        # Movement uses the fixed tick length in seconds (dt), and timers
+        # use the tick length in ms
+        self.ticks = 0
+        self.dt = 1 / self.settings.ticks_per_second
+        self.tick_length = self.dt * 1000
+
+        # Create scheduler for timed game events (alien fire, auto-fire and
+        # timed game states)
+        self.scheduler = Scheduler()
+
+        # Game starts on the menu
+        # States are "menu", "playing", "life_lost", "level_transition" and
+        # "game_over", and timed states end with a scheduled event
+        self.state = "menu"
+        self.state_timer = None
+
+        # Create variable to track whether fire button is being held
+        self.holding_fire = False
+
+        # Create variable to update tick of latest fired bullet
+        self.latest_fired_bullet = 0
+
+        # Create variables to track delay between auto-fired bullets (ms), and
+        # the scheduled event for the next auto-fired bullet
+        self.firing_delay = 200
+        self.auto_fire_event = None
+
+        # Create variable to track ticks between alien bullets
+        self.alien_firing_interval = 0
+
+        # Ticks each explosion is shown for, and the animation frame shown
+        # at each age (in ticks)
+        self.explosion_ticks = math.ceil(display_time / self.tick_length)
+        self.explosion_frames = [(age * frame_count) // self.explosion_ticks
+            for age in range(self.explosion_ticks)]
+
+        # Create variable to keep rendering the player ship when an alien
+        # reaches the bottom of the screen
+        self.alien_at_bottom = False
+
+        # Names of sounds triggered during the latest step, for audio playback
+        self.sound_events = []
+
+        # (kind, x, y) of every hit during the latest step, for debris effects
+        self.effect_events = []
+
+        # Profiler to time each phase of a tick with (disabled by default)
+        self.profiler = FrameProfiler()
+
+    """Advance the game by the given number of ticks with the given input."""
+    def step(self, actions=0, ticks=1):
+
+        self.sound_events = []
+        self.effect_events = []
+
+        for _ in range(ticks):
+            self.tick(actions)
+
+    """Return True while a round is in progress (including pauses)."""
+    @property
+    def game_active(self):
+        return self.state not in ("menu", "game_over")
+
+    """Switch to a new game state, lasting the given time (ms) if it's timed."""
+    def set_state(self, state, duration=None):
+
+        self.state = state
+
+        # Replace the previous state's timer with this state's (if timed)
+        if self.state_timer:
+            self.scheduler.cancel(self.state_timer)
+            self.state_timer = None
+        if duration is not None:
+            self.state_timer = self.scheduler.schedule(
+                self.ticks + self.get_ticks(duration), self.end_state)
+
+    """Return the number of ticks closest to a time in ms."""
+    def get_ticks(self, time):
+        return round(time / self.tick_length)
+
+    """End the lost life pause or level transition once its time is up."""
+    def end_state(self):
+
+        self.state_timer = None
+
+        # Reset the ship and alien fleet once the lost life pause is over
+        if self.state == "life_lost":
+            self.end_pause()
+            self.set_state("playing")
+
+        # Create the next level's fleet once the level transition is over
+        elif self.state == "level_transition":
+            self.start_new_level()
+            self.set_state("playing")
+
+    """Advance the game by a single tick."""
+    def tick(self, actions):
+
+        self.ticks += 1
+
+        # Update movement flags from player input
+        self.ship.moving_left = bool(actions & MOVE_LEFT)
+        self.ship.moving_right = bool(actions & MOVE_RIGHT)
+
+        # Track fire presses, and stop auto-firing once fire is released
+        fire_pressed = bool(actions & FIRE) and not self.holding_fire
+        self.holding_fire = bool(actions & FIRE)
+        if not self.holding_fire and self.auto_fire_event:
+            self.scheduler.cancel(self.auto_fire_event)
+            self.auto_fire_event = None
+
+        # Run timed game events due this tick, then animate explosions
+        self.scheduler.run(self.ticks)
+        self.update_explosions()
+
+        # Fire immediately on a new press, then at a steady rate when held
+        if fire_pressed:
+            if self.state == "playing":
+                self.fire_bullet()
+            self.schedule_auto_fire()
+
+        # If player has ships remaining and the game isn't paused
+        if self.state == "playing":
+
+            # Update game element positions
+            self.profiler.mark("input")
+            self.ship.update(self.dt)
+            self.profiler.mark("ship")
+            self.update_bullets()
+            self.update_aliens()
+            self.profiler.mark("aliens")
+
+    """Start new round of Alien Invasion.
+
+    Aliens fire every alien_firing_speed ms, and rounds started with the same
+    seed and fed the same input every tick play out exactly the same (a new
+    seed is picked if none is given)."""
+    def start_round(self, mode, alien_firing_speed, seed=None):
+
+        # Reset clock, scheduled events, random number generator and input
+        # tracking
+        self.ticks = 0
+        self.scheduler.clear()
+        self.state_timer = None
+        self.auto_fire_event = None
+        self.seed = seed if seed is not None else Random().getrandbits(32)
+        self.random.seed(self.seed)
+        self.holding_fire = False
+        self.latest_fired_bullet = 0
+
+        # Reset game statistics and change game state to active
+        self.stats.reset_stats()
+        self.set_state("playing")
+        self.alien_at_bottom = False
+
+        # Load dynamic settings for easy, medium or hard difficulty
+        # Alien bullets are fired on a fixed number of ticks, divided by the
+        # alien fire rate
+        self.settings.initialize_dynamic_settings(mode)
+        self.alien_firing_interval = (max(1,
+            self.get_ticks(alien_firing_speed))
+            / self.settings.alien_fire_rate)
+        self.schedule_alien_fire(self.alien_firing_interval)
+
+        # Remove all remaining bullets, aliens, alien bullets, blocks and
+        # explosions
+        self.explosions.empty()
+        self.bullets.empty()
+        self.aliens.empty()
+        self.alien_grid.clear()
+        self.alien_bullets.empty()
+        self.blocks.clear()
+        self.block_grid.clear()
+
+        # Create new alien fleet, new blocks and center player ship
+        self.create_fleet()
+        self.create_multiple_blocks(0, self.settings.screen_height - 120)
+        self.ship_group.add(self.ship)
+        self.ship.center_ship()
+
+    """Remove all remaining bullets, create new game objects and increase speed."""
+    def start_new_level(self):
+
+        self.bullets.empty()
+        self.alien_bullets.empty()
+        self.create_fleet()
+        self.ship_group.add(self.ship)
+        self.settings.increase_speed()
+
+        # Increment level
+        self.stats.level += 1
+
+    """Reset the player ship and alien fleet after the lost life pause.
+
+    If the fleet was destroyed on the same tick the ship was hit, the level
+    was still cleared, so the next level starts instead."""
+    def end_pause(self):
+
+        self.alien_at_bottom = False
+        level_cleared = not self.aliens
+
+        # Remove all active bullets and alien bullets
+        self.bullets.empty()
+        self.alien_bullets.empty()
+
+        # Create new player ship and alien fleet (or the next level's fleet)
+        self.ship.center_ship()
+        self.aliens.empty()
+        self.alien_grid.clear()
+        if level_cleared:
+            self.start_new_level()
+        else:
+            self.create_fleet()
+
+# ------------------------------------------------------------------------------
+# HELPER FUNCTIONS -------------------------------------------------------------
+# ------------------------------------------------------------------------------
+
+    """Create new block between player and alien fleet."""
+    def create_block(self, x_start, y_start, x_offset):
+
+        block_object = block.Block(self.shape, self.block_size, (0, 255, 255),
+            x_start + x_offset, y_start)
+        self.blocks.append(block_object)
+        self.block_grid.update(block_object, block_object.rect)
+
+    """Create new blocks between player and alien fleet."""
+    def create_multiple_blocks(self, x_start, y_start):
+
+        block_width = max(len(row) for row in self.shape) * self.block_size
+        row_height = (len(self.shape) + 3) * self.block_size
+
+        # Fit as many blocks in a row as there's room for, keeping 112 pixels
+        # from the screen edges and half a block between blocks, and stack
+        # any other blocks in rows above (but only in the bottom half of the
+        # screen, leaving the top half for the alien fleet)
+        room = self.settings.screen_width - 224 + (block_width // 2)
+        row_limit = max(1, room // (block_width + (block_width // 2)))
+        max_rows = max(1, ((y_start - (self.settings.screen_height // 2))
+            // row_height) + 1)
+        block_count = min(self.settings.block_count, row_limit * max_rows)
+        row_count = -(-block_count // row_limit)
+        row_length = -(-block_count // row_count)
+
+        for i in range(block_count):
+
+            row, column = divmod(i, row_length)
+            blocks_in_row = min(row_length, block_count - (row * row_length))
+
+            # Spread blocks evenly across the row (center a lone block)
+            if blocks_in_row > 1:
+                spacing = ((self.settings.screen_width - 224 - block_width)
+                    / (blocks_in_row - 1))
+                x_offset = 112 + round(column * spacing)
+            else:
+                x_offset = (self.settings.screen_width - block_width) // 2
+
+            self.create_block(x_start, y_start - (row * row_height), x_offset)
+
+        # Store the region covering every block
+        self.block_area = self.blocks[0].rect.unionall(
+            [block_object.rect for block_object in self.blocks])
+
+    """Fire a bullet from the bullet pool (if allowed)."""
+    def fire_bullet(self):
+
+        # Allow player a maximum of bullet_limit bullets on-screen at a time
+        new_bullet = self.bullets.acquire()
+        if new_bullet:
+
+            new_bullet.fire(self.ship.rect)
+
+            # Update tick of latest fired bullet
+            self.latest_fired_bullet = self.ticks
+
+            # Play bullet sound when firing bullet
+            self.sound_events.append("bullet")
+
+    """Schedule the next auto-fired bullet, firing_delay after the latest
+    fired bullet (or next tick if that's already passed)."""
+    def schedule_auto_fire(self):
+
+        if self.auto_fire_event:
+            self.scheduler.cancel(self.auto_fire_event)
+
+        tick = max(self.ticks + 1,
+            self.latest_fired_bullet + self.get_ticks(self.firing_delay))
+        self.auto_fire_event = self.scheduler.schedule(tick,
+            self.auto_fire_bullet)
+
+    """Auto-fire new bullet while fire is held."""
+    def auto_fire_bullet(self):
+
+        self.auto_fire_event = None
+
+        # Wait until the game resumes if it's paused
+        if self.state == "playing":
+            self.fire_bullet()
+
+        # Try again next tick if no bullet was available
+        self.schedule_auto_fire()
+
+    """Schedule aliens to fire once the given (possibly fractional) tick is
+    reached."""
+    def schedule_alien_fire(self, tick):
+        self.scheduler.schedule(math.ceil(tick), self.fire_alien_bullets, tick)
+
+    """Fire the alien bullet due at the given tick, then schedule the next.
+
+    Aliens firing faster than the tick rate fire several bullets in one tick,
+    and bullets due while the game is paused are fired once it resumes."""
+    def fire_alien_bullets(self, tick):
+
+        if self.state != "playing":
+            self.scheduler.schedule(self.ticks + 1, self.fire_alien_bullets,
+                tick)
+            return
+
+        self.fire_alien_bullet()
+        self.schedule_alien_fire(tick + self.alien_firing_interval)
+
+    """Fire a bullet from a random alien ship."""
+    def fire_alien_bullet(self):
+
+        # Check to make sure at least one alien ship exists
+        if self.aliens.sprites() and self.game_active:
+
+            # Skip this shot if every alien bullet is already on-screen
+            random_alien = self.random.choice(self.aliens.sprites())
+            alien_bullet = self.alien_bullets.acquire()
+            if not alien_bullet:
+                return
+
+            alien_bullet.fire(self.fleet.get_rect(random_alien.index))
+
+            # Play alien bullet sound when bullet spawns
+            self.sound_events.append("alien_bullet")
+
+    """Update bullet positions and despawn bullets that go off-screen."""
+    def update_bullets(self):
+
+        # Update bullet and alien bullet positions
+        for bullet in self.bullets:
+            bullet.update(self.dt)
+        for alien_bullet in self.alien_bullets:
+            alien_bullet.update(self.dt)
+
+        # For loop needs list length to be constant, so loop over copy of list
+        for bullet in self.bullets.copy():
+            if bullet.rect.bottom <= 0:
+                self.bullets.release(bullet)
+
+        # Repeat procedure for alien bullets
+        for alien_bullet in self.alien_bullets.copy():
+            if alien_bullet.rect.top >= self.settings.screen_height:
+                self.alien_bullets.release(alien_bullet)
+
+        # Check collisions between bullets and all game objects, timing
+        # each check separately
+        mark = self.profiler.mark
+        mark("bullets")
+        self.check_bullet_block_collisions()
+        mark("bullet_block")
+        self.check_alien_bullet_block_collisions()
+        mark("alien_bullet_block")
+        self.check_bullet_alien_collisions()
+        mark("bullet_alien")
+        self.check_alien_bullet_ship_collisions()
+        mark("alien_bullet_ship")
+
+    """Start an explosion at the given position (if one is available)."""
+    def create_explosion(self, center):
+
+        explosion = self.explosions.acquire()
+        if explosion:
+            explosion.start(center)
+
+    """Age every explosion by a tick, moving each to the animation frame for
+    its age and returning finished explosions to the explosion pool.
+
+    Finished explosions stay on-screen (on their last frame) while the game
+    is paused."""
+    def update_explosions(self):
+
+        explosion_frames = self.explosion_frames
+        finished = []
+
+        for explosion in self.explosions:
+
+            age = explosion.age + 1
+            explosion.age = age
+            if age < self.explosion_ticks:
+                if explosion_frames[age] != explosion.frame:
+                    explosion.show_frame(explosion_frames[age])
+            else:
+                finished.append(explosion)
+
+        if self.state == "playing":
+            for explosion in finished:
+                self.explosions.release(explosion)
+
+    """Respond to bullet-block collisions."""
+    def check_bullet_block_collisions(self):
+
+        # Check for collisions between bullets and blocks
+        # Remove colliding bullets and block cells
+        collisions = False
+        for bullet in self.bullets.copy():
+            if self.erode_blocks(bullet.rect):
+                self.effect_events.append(("block",) + bullet.rect.center)
+                self.bullets.release(bullet)
+                collisions = True
+
+        # If block(s) destroyed, play blip sound
+        if collisions:
+            self.sound_events.append("blip")
+
+    """Respond to alien bullet-block collisions."""
+    def check_alien_bullet_block_collisions(self):
+
+        # Check for collisions between alien bullets and blocks
+        # Remove colliding alien bullets and block cells
+        collisions = False
+        for alien_bullet in self.alien_bullets.copy():
+            if self.erode_blocks(alien_bullet.rect):
+                self.effect_events.append(("block",)
+                    + alien_bullet.rect.center)
+                self.alien_bullets.release(alien_bullet)
+                collisions = True
+
+        # If block(s) destroyed, play blip sound
+        if collisions:
+            self.sound_events.append("blip")
+
+    """Destroy block cells overlapped by a rect, return how many fell."""
+    def erode_blocks(self, rect):
+
+        # Most rects are nowhere near the row of blocks
+        if not self.block_area.colliderect(rect):
+            return 0
+
+        destroyed = 0
+        for block_object in self.block_grid.query(rect):
+            destroyed += block_object.erode(rect)
+
+        return destroyed
+
+    """Respond to bullet-alien collisions."""
+    def check_bullet_alien_collisions(self):
+
+        # Check for collisions between bullets/aliens, remove colliding sprites
+        collisions = {}
+        for bullet in self.bullets.copy():
+
+            aliens = self.get_colliding_aliens(bullet.rect)
+            if aliens:
+
+                self.bullets.release(bullet)
+                for alien in aliens:
+                    self.remove_alien(alien)
+                collisions[bullet] = aliens
+
+        # If alien(s) destroyed, increment points, update high score and
+        # create explosion(s)
+        if collisions:
+
+            for aliens in collisions.values():
+
+                # Increment score for every alien hit by single bullet
+                self.stats.score += self.settings.alien_points * len(aliens)
+
+                for alien in aliens:
+
+                    # Replace alien sprite with explosion and debris
+                    center = self.fleet.get_rect(alien.index).center
+                    self.create_explosion(center)
+                    self.effect_events.append(("alien",) + center)
+
+            # Play boom sound for alien hit
+            self.sound_events.append("boom")
+
+            self.stats.check_high_score()
+
+        # Start the next level once the fleet is destroyed
+        if not self.aliens and self.state == "playing":
+            self.set_state("level_transition",
+                self.settings.level_transition_time)
+
+    """Respond to alien bullet-ship collisions."""
+    def check_alien_bullet_ship_collisions(self):
+
+        # Check for collisions between alien bullets and player ship
+        if any(self.check_ship_hit(alien_bullet.rect)
+                for alien_bullet in self.alien_bullets):
+
+            # Replace player ship sprite with explosion and debris
+            self.ship_group.empty()
+            self.create_explosion(self.ship.rect.center)
+            self.effect_events.append(("ship",) + self.ship.rect.center)
+
+            self.sound_events.append("boom")
+            self.ship_hit()
+
+    """Return True if a bullet's rect hits the player ship."""
+    def check_ship_hit(self, rect):
+
+        ship = self.ship
+        if not ship.rect.colliderect(rect):
+            return False
+
+        # Compare pixels only once the rects overlap
+        return (not self.settings.pixel_collisions
+            or bool(ship.mask.overlap(self.get_solid_mask(rect.size),
+            (rect.x - ship.rect.x, rect.y - ship.rect.y))))
+
+    """Return a mask of the given size with every pixel set, for bullets."""
+    def get_solid_mask(self, size):
+
+        if size not in self.solid_masks:
+            self.solid_masks[size] = pygame.mask.Mask(size, fill=True)
+
+        return self.solid_masks[size]
+
+    """Respond when an alien hits the player ship."""
+    def ship_hit(self):
+
+        self.sound_events.append("lost_life")
+
+        # Decrement number of ships remaining
+        self.stats.ships_left -= 1
+
+        if self.stats.ships_left > 0:
+
+            # Add new player ship for rendering
+            self.ship_group.empty()
+            self.ship_group.add(self.ship)
+
+            # Pause the game after losing a life
+            self.set_state("life_lost", self.settings.life_lost_time)
+
+        # Game over
+        else:
+            self.set_state("game_over")
+
+    """Check if alien fleet at edge-of-screen, then update alien positions."""
+    def update_aliens(self):
+
+        self.check_fleet_edges()
+        self.fleet.update(self.dt)
+
+        # Check for aliens colliding with blocks once the fleet reaches them
+        if self.fleet.get_bottom() > self.block_area.top:
+            for alien in self.aliens:
+
+                # Destroy blocks and play shield down sound
+                if self.erode_blocks(self.fleet.get_rect(alien.index)):
+                    self.sound_events.append("shield_down")
+
+        # Check for aliens colliding with the player ship
+        if self.get_colliding_aliens(self.ship.rect, self.ship.mask):
+
+            # Replace player ship sprite with explosion and debris
+            self.ship_group.empty()
+            self.create_explosion(self.ship.rect.center)
+            self.effect_events.append(("ship",) + self.ship.rect.center)
+
+            # Play boom sound for ship collision
+            self.sound_events.append("boom")
+
+            self.ship_hit()
+
+        # Check for aliens hitting the bottom of the screen
+        self.check_aliens_bottom()
+
+    """Create a fleet of aliens."""
+    def create_fleet(self):
+
+        # Create space around aliens equal to one alien size
+        alien_width, alien_height = image_size("../images/sprites/alien1.png")
+        positions = []
+
+        # The x-coordinate and y-coordinate of the next alien to spawn
+        current_x, current_y = alien_width, alien_height + 72
+
+        # Keep generating aliens in rows and columns until running out of room
+        while current_y < self.settings.screen_height - (alien_height * 7):
+            while current_x < (self.settings.screen_width - (alien_width * 2)):
+
+                positions.append((current_x, current_y))
+                current_x += alien_width * self.settings.fleet_column_spacing
+
+            # Finished spawning a row of aliens
+            # Reset x-coordinate and increment y-coordinate
+            current_x = alien_width
+            current_y += alien_height * self.settings.fleet_row_spacing
+
+        # A screen without room for a single alien would start a new level
+        # every tick, so stop instead
+        if not positions:
+            raise ValueError(f"{self.settings.screen_width}x"
+                f"{self.settings.screen_height} screen has no room for a row "
+                "of aliens")
+
+        # Store alien positions in the fleet and create alien sprites
+        self.fleet.create(positions, (alien_width, alien_height))
+        for index, (x_position, y_position) in enumerate(positions):
+            self.create_alien(index, x_position, y_position)
+
+    """Create alien at the given fleet index and add to row."""
+    def create_alien(self, index, x_position, y_position):
+
+        new_alien = Alien(self)
+        new_alien.index = index
+        new_alien.rect.x = x_position
+        new_alien.rect.y = y_position
+        self.aliens.add(new_alien)
+        self.fleet.aliens.append(new_alien)
+        self.alien_grid.update(new_alien, new_alien.rect)
+
+    """Return every alien overlapping a rect (and its mask, if given)."""
+    def get_colliding_aliens(self, rect, mask=None):
+
+        # Look up aliens around the rect's position relative to the fleet,
+        # one pixel wider on each side to allow for rounding
+        fleet_rect = rect.move(-int(self.fleet.offset_x),
+            -int(self.fleet.offset_y)).inflate(2, 2)
+
+        colliding_aliens = []
+        for alien in self.alien_grid.query(fleet_rect):
+
+            alien_rect = self.fleet.get_rect(alien.index)
+            if not alien_rect.colliderect(rect):
+                continue
+
+            # Compare pixels only once the rects overlap (rects without a
+            # mask are treated as solid)
+            if self.settings.pixel_collisions and not alien.mask.overlap(
+                    mask or self.get_solid_mask(rect.size),
+                    (rect.x - alien_rect.x, rect.y - alien_rect.y)):
+                continue
+
+            colliding_aliens.append(alien)
+
+        return colliding_aliens
+
+    """Remove an alien from the fleet and the collision grid."""
+    def remove_alien(self, alien):
+
+        alien.kill()
+        self.alien_grid.remove(alien)
+        self.fleet.kill(alien.index)
+
+    """Respond properly if an alien reaches left or right edge of screen."""
+    def check_fleet_edges(self):
+
+        if self.aliens and self.fleet.check_edges():
+            self.change_fleet_direction()
+
+    """Drop fleet down the screen and change fleet direction."""
+    def change_fleet_direction(self):
+
+        self.fleet.drop()
+        self.settings.fleet_direction *= -1
+
+    """Check if any aliens reach the bottom of the screen."""
+    def check_aliens_bottom(self):
+
+        if self.aliens and (self.fleet.get_bottom()
+                >= self.settings.screen_height):
+            self.alien_reaches_bottom()
+
+    """Respond when an alien reaches the bottom of the screen."""
+    def alien_reaches_bottom(self):
+
+        # Keep rendering player ship sprite since it wasn't destroyed
+        self.alien_at_bottom = True
+
+        # Play lost life sound when an alien reaches the bottom the of screen
+        self.sound_events.append("lost_life")
+
+        # Decrement number of ships remaining
+        self.stats.ships_left -= 1
+
+        if self.stats.ships_left > 0:
+
+            # Pause the game after losing a life
+            self.set_state("life_lost", self.settings.life_lost_time)
+
+        # Game over
+        else:
+            self.set_state("game_over")
\ No newline at end of file
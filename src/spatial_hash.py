@@ -0,0 +1,86 @@
+# Author: Dakota Rubin
+# Date: October 18th, 2026
+# File: spatial_hash.py contains the collision grid for the Alien Invasion game.
+
+"""This class sorts game objects into a uniform grid of square cells, so
+collision checks only look at objects in the cells a rect overlaps."""
+class SpatialHash:
+
+    """Initialize an empty grid with the given cell size (in pixels)."""
+    def __init__(self, cell_size):
+
+        self.cell_size = cell_size
+
+        # Objects in each cell, keyed by (column, row)
+        self.cells = {}
+
+        # Range of cells each object is registered in, keyed by object
+        self.object_cells = {}
+
+    """Return the first and last column and row a rect overlaps."""
+    def get_cell_range(self, rect):
+
+        cell_size = self.cell_size
+        return (rect.left // cell_size, (rect.right - 1) // cell_size,
+            rect.top // cell_size, (rect.bottom - 1) // cell_size)
+
+    """Register an object at its rect, or move it if it's already registered."""
+    def update(self, game_object, rect):
+
+        cell_range = self.get_cell_range(rect)
+        old_cell_range = self.object_cells.get(game_object)
+
+        # Objects usually stay inside the same cells between ticks
+        if cell_range == old_cell_range:
+            return
+
+        if old_cell_range:
+            self.remove(game_object)
+
+        first_column, last_column, first_row, last_row = cell_range
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                self.cells.setdefault((column, row), []).append(game_object)
+        self.object_cells[game_object] = cell_range
+
+    """Remove an object from the grid (if it's registered)."""
+    def remove(self, game_object):
+
+        cell_range = self.object_cells.pop(game_object, None)
+        if not cell_range:
+            return
+
+        first_column, last_column, first_row, last_row = cell_range
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                cell = self.cells[(column, row)]
+                cell.remove(game_object)
+                if not cell:
+                    del self.cells[(column, row)]
+
+    """Remove every object from the grid."""
+    def clear(self):
+
+        self.cells.clear()
+        self.object_cells.clear()
+
+    """Return every object registered in the cells a rect overlaps.
+
+    The returned list may belong to the grid, so don't modify it."""
+    def query(self, rect):
+
+        first_column, last_column, first_row, last_row = (
+            self.get_cell_range(rect))
+
+        # Most rects fit in a single cell, so skip removing duplicates
+        if first_column == last_column and first_row == last_row:
+            return self.cells.get((first_column, first_row), [])
+
+        # Use a dict to drop duplicates while keeping a stable order
+        nearby_objects = {}
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                for game_object in self.cells.get((column, row), ()):
+                    nearby_objects[game_object] = None
+
+        return list(nearby_objects)
\ No newline at end of file
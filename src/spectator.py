@@ -0,0 +1,590 @@
+# Author: Dakota Rubin
+# Date: October 18th, 2026
+# File: spectator.py streams the Alien Invasion game state to spectators over
+# a socket, and contains the spectator client that draws it.
+
+import argparse, json, os, select, socket, struct, zlib
+from time import perf_counter
+
+import numpy as np
+import pygame
+
+from alien import alien_images
+from assets import load_image
+from settings import Settings
+from simulation import Simulation
+
+# Address spectators connect to by default ("host:port" for TCP, or a file
+# path for a UNIX socket)
+default_address = "localhost:5050"
+
+# Message kinds: settings to lay out the game with, a full snapshot, and the
+# changes since the previous snapshot
+HELLO, KEYFRAME, DELTA = range(3)
+
+# Every message starts with its kind and payload length
+message_header = struct.Struct("<BI")
+
+# Game states, numbered in snapshots by their position here
+states = ("menu", "playing", "life_lost", "level_transition", "game_over")
+
+# Position stored for unused bullet and explosion slots
+unused = -32768
+
+# Most bytes a spectator can fall behind by before it's disconnected
+max_pending = 1 << 20
+
+"""Open a socket at an address, listening on it (for the server) or
+connected to it (for a client)."""
+def open_socket(address, listen=False):
+
+    # "host:port" addresses use TCP, anything else is a UNIX socket path
+    if ":" in address:
+        host, port = address.rsplit(":", 1)
+        family, address = socket.AF_INET, (host, int(port))
+    else:
+        family = socket.AF_UNIX
+
+    connection = socket.socket(family, socket.SOCK_STREAM)
+
+    if listen:
+        if family == socket.AF_UNIX and os.path.exists(address):
+            os.remove(address)
+        else:
+            connection.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        connection.bind(address)
+        connection.listen()
+    else:
+        connection.connect(address)
+
+    # Send each tick as soon as it's ready instead of batching small sends
+    if family == socket.AF_INET:
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    return connection
+
+"""Create a simulation laid out like a round (with a full fleet), for reading
+layout sizes and for spectators to draw snapshots with."""
+def create_mirror(settings):
+
+    mirror = Simulation(settings)
+    mirror.create_fleet()
+    return mirror
+
+"""Return the snapshot layout for games with the given settings.
+
+Every field has a fixed size and position, so the bytes of unchanged fields
+stay the same from tick to tick and XOR to zero in deltas."""
+def get_snapshot_dtype(settings):
+
+    mirror = create_mirror(settings)
+    cell_count = sum(len(block_object.cells) for block_object in mirror.blocks)
+
+    return np.dtype([("tick", "<u4"), ("state", "u1"), ("flags", "u1"),
+        ("score", "<i8"), ("high_score", "<i8"), ("level", "<u2"),
+        ("ships_left", "<i2"), ("ship_x", "<i2"),
+        ("fleet_offset", "<f8", 2),
+        ("aliens", "u1", -(-len(mirror.fleet.x) // 8)),
+        ("alien_sprites", "u1", len(mirror.fleet.x)),
+        ("bullets", "<i2", (settings.bullet_limit, 2)),
+        ("alien_bullets", "<i2", (settings.alien_bullet_limit, 2)),
+        ("explosions", "<i2", (settings.explosion_limit, 2)),
+        ("explosion_frames", "u1", settings.explosion_limit),
+        ("cells", "u1", -(-cell_count // 8))])
+
+"""Write a simulation's state into a snapshot (a one-element array of
+get_snapshot_dtype())."""
+def encode_snapshot(sim, snapshot):
+
+    snapshot["tick"] = sim.ticks
+    snapshot["state"] = states.index(sim.state)
+
+    # Flags for a ship that's still shown and an alien at the bottom
+    snapshot["flags"] = bool(sim.ship_group) | (sim.alien_at_bottom << 1)
+
+    stats = sim.stats
+    snapshot["score"] = stats.score
+    snapshot["high_score"] = stats.high_score
+    snapshot["level"] = stats.level
+    snapshot["ships_left"] = stats.ships_left
+    snapshot["ship_x"] = sim.ship.rect.x
+
+    # Store the fleet's offset and one bit per living alien (there are no
+    # aliens before the first round)
+    fleet = sim.fleet
+    snapshot["fleet_offset"] = (fleet.offset_x, fleet.offset_y)
+    alive = np.zeros(snapshot["aliens"].shape[1] * 8, bool)
+    alive[:len(fleet.alive)] = fleet.alive
+    snapshot["aliens"] = np.packbits(alive)
+
+    # Store which sprite each alien was given (by its index in alien_images)
+    sprite_indexes = {load_image(path): index
+        for index, path in enumerate(alien_images)}
+    sprites = snapshot["alien_sprites"][0]
+    sprites[:] = 0
+    sprites[:len(fleet.aliens)] = [sprite_indexes[alien.image]
+        for alien in fleet.aliens]
+
+    # Store bullets by their top-left corners, and explosions by their
+    # centers and animation frames
+    for field, objects in (("bullets", sim.bullets),
+            ("alien_bullets", sim.alien_bullets)):
+        positions = snapshot[field][0]
+        positions[:] = unused
+        for index, game_object in enumerate(objects):
+            positions[index] = game_object.rect.topleft
+
+    positions = snapshot["explosions"][0]
+    positions[:] = unused
+    explosion_frames = snapshot["explosion_frames"][0]
+    explosion_frames[:] = 0
+    for index, explosion in enumerate(sim.explosions):
+        positions[index] = explosion.center
+        explosion_frames[index] = explosion.frame
+
+    # Store one bit per block cell, read straight from the blocks' bytes
+    snapshot["cells"] = np.packbits(np.concatenate([np.frombuffer(
+        block_object.cells, np.uint8) for block_object in sim.blocks]))
+
+"""Update a mirror simulation (from create_mirror()) to match a snapshot, so
+the renderer can draw it."""
+def apply_snapshot(sim, snapshot):
+
+    sim.ticks = int(snapshot["tick"][0])
+    sim.state = states[snapshot["state"][0]]
+    flags = int(snapshot["flags"][0])
+    sim.alien_at_bottom = bool(flags & 2)
+    if flags & 1:
+        sim.ship_group.add(sim.ship)
+    else:
+        sim.ship_group.empty()
+
+    stats = sim.stats
+    stats.score = int(snapshot["score"][0])
+    stats.high_score = int(snapshot["high_score"][0])
+    stats.level = int(snapshot["level"][0])
+    stats.ships_left = int(snapshot["ships_left"][0])
+
+    # Move the ship and fleet, remembering where they were so they're drawn
+    # at their new positions
+    ship = sim.ship
+    ship.previous_position = ship.rect.topleft
+    ship.rect.x = int(snapshot["ship_x"][0])
+    ship.x = float(ship.rect.x)
+
+    fleet = sim.fleet
+    fleet.previous_offset_x, fleet.previous_offset_y = (fleet.offset_x,
+        fleet.offset_y)
+    fleet.offset_x, fleet.offset_y = snapshot["fleet_offset"][0].tolist()
+
+    fleet.alive[:] = np.unpackbits(snapshot["aliens"][0])[:len(fleet.alive)]
+
+    # Aliens only get different sprites in a new fleet, so count it as one
+    # for the renderer to redraw
+    new_fleet = False
+    for alien, index in zip(fleet.aliens,
+            snapshot["alien_sprites"][0].tolist()):
+        image = load_image(alien_images[index])
+        if alien.image is not image:
+            alien.image = image
+            new_fleet = True
+    if new_fleet:
+        fleet.version += 1
+
+    # Place bullets and explosions from their pools
+    for field, pool in (("bullets", sim.bullets),
+            ("alien_bullets", sim.alien_bullets)):
+        pool.empty()
+        for x_position, y_position in snapshot[field][0].tolist():
+            if x_position != unused:
+                game_object = pool.acquire()
+                game_object.rect.topleft = (x_position, y_position)
+                game_object.previous_position = game_object.rect.topleft
+
+    sim.explosions.empty()
+    for center, frame in zip(snapshot["explosions"][0].tolist(),
+            snapshot["explosion_frames"][0].tolist()):
+        if center[0] != unused:
+            explosion = sim.explosions.acquire()
+            explosion.center = tuple(center)
+            explosion.show_frame(frame)
+
+    apply_cells(sim, np.unpackbits(snapshot["cells"][0]))
+
+"""Update a mirror simulation's blocks to match the standing cells (one byte
+per cell)."""
+def apply_cells(sim, cells):
+
+    # Rebuild the blocks if any cell is standing again (a new round started)
+    start = 0
+    for block_object in sim.blocks:
+        end = start + len(block_object.cells)
+        if (cells[start:end] > np.frombuffer(block_object.cells,
+                np.uint8)).any():
+            sim.blocks.clear()
+            sim.block_grid.clear()
+            sim.create_multiple_blocks(0, sim.settings.screen_height - 120)
+            break
+        start = end
+
+    # Destroy every cell that fell since the last snapshot
+    start = 0
+    for block_object in sim.blocks:
+        end = start + len(block_object.cells)
+        fallen = np.frombuffer(block_object.cells, np.uint8) > cells[start:end]
+        for index in np.flatnonzero(fallen).tolist():
+            block_object.destroy_cell(index)
+        start = end
+
+"""This class streams a game's state to every connected spectator.
+
+Every tick, the state is written into a fixed-layout snapshot, and each
+spectator is sent the snapshot XORed with the previous one (so unchanged
+bytes become zeros) and compressed. New spectators are sent the settings to
+lay out the game with, then a full snapshot. Sockets never block, so a slow
+spectator can't slow the game down."""
+class SpectatorServer:
+
+    """Start listening for spectators at an address."""
+    def __init__(self, sim, address=default_address):
+
+        self.sim = sim
+        self.address = address
+        self.listener = open_socket(address, listen=True)
+        self.listener.setblocking(False)
+
+        # Latest and previous snapshots
+        dtype = get_snapshot_dtype(sim.settings)
+        self.snapshot = np.zeros(1, dtype)
+        self.previous_snapshot = np.zeros(1, dtype)
+
+        # Settings spectators need to lay out the game like this one
+        self.hello = self.pack(HELLO, json.dumps(
+            {"stress": sim.settings.stress_scales}).encode())
+
+        # Bytes waiting to be sent, keyed by spectator socket, and spectators
+        # still waiting for a full snapshot
+        self.clients = {}
+        self.new_clients = set()
+
+        # Totals for the bandwidth and timing report
+        self.ticks_sent = 0
+        self.bytes_sent = 0
+        self.encode_time = 0.0
+
+    """Return a message with a header."""
+    @staticmethod
+    def pack(kind, payload):
+        return message_header.pack(kind, len(payload)) + payload
+
+    """Accept new spectators, then send every spectator the latest tick."""
+    def send_tick(self):
+
+        self.accept_clients()
+        if not self.clients:
+            return
+
+        # Encode the snapshot and the changes since the previous one
+        start_time = perf_counter()
+        encode_snapshot(self.sim, self.snapshot)
+        current = self.snapshot.view(np.uint8)
+        delta = self.pack(DELTA, zlib.compress(np.bitwise_xor(current,
+            self.previous_snapshot.view(np.uint8)).tobytes(), 1))
+        keyframe = None
+        if self.new_clients:
+            keyframe = self.pack(KEYFRAME, zlib.compress(current.tobytes(), 1))
+        self.previous_snapshot[:] = self.snapshot
+        self.encode_time += perf_counter() - start_time
+
+        self.ticks_sent += 1
+        for client in list(self.clients):
+
+            if client in self.new_clients:
+                self.new_clients.discard(client)
+                self.clients[client] += keyframe
+            else:
+                self.clients[client] += delta
+            self.flush(client)
+
+    """Accept every spectator waiting to connect."""
+    def accept_clients(self):
+
+        while True:
+
+            try:
+                client, _ = self.listener.accept()
+            except BlockingIOError:
+                return
+
+            client.setblocking(False)
+            self.clients[client] = bytearray(self.hello)
+            self.new_clients.add(client)
+
+    """Send as much of a spectator's waiting bytes as its socket takes,
+    disconnecting it if it falls too far behind or hangs up."""
+    def flush(self, client):
+
+        pending = self.clients[client]
+        try:
+            sent = client.send(pending)
+        except BlockingIOError:
+            sent = 0
+        except OSError:
+            self.disconnect(client)
+            return
+
+        del pending[:sent]
+        self.bytes_sent += sent
+        if len(pending) > max_pending:
+            self.disconnect(client)
+
+    """Close a spectator's connection."""
+    def disconnect(self, client):
+
+        del self.clients[client]
+        self.new_clients.discard(client)
+        client.close()
+
+    """Return the average bytes sent per tick per spectator and the
+    average ms spent encoding each tick."""
+    def get_report(self):
+
+        return {"snapshot_bytes": self.snapshot.nbytes,
+            "bytes_per_tick": self.bytes_sent / max(1, self.ticks_sent),
+            "encode_ms": self.encode_time * 1000 / max(1, self.ticks_sent)}
+
+    """Disconnect every spectator and stop listening."""
+    def close(self):
+
+        for client in list(self.clients):
+            self.disconnect(client)
+        self.listener.close()
+        if ":" not in self.address and os.path.exists(self.address):
+            os.remove(self.address)
+
+"""This class receives a game's state from a SpectatorServer.
+
+The server first sends the settings its game is laid out with, so settings
+and snapshot stay None until receive() has read them."""
+class SpectatorClient:
+
+    """Connect to a server."""
+    def __init__(self, address=default_address):
+
+        self.connection = open_socket(address)
+        self.connected = True
+        self.received = bytearray()
+
+        # Server's settings and latest snapshot (once they've arrived)
+        self.settings = None
+        self.snapshot = None
+        self.has_snapshot = False
+
+        # Totals for the bandwidth and timing report
+        self.ticks_received = 0
+        self.bytes_received = 0
+        self.decode_time = 0.0
+
+    """Read every message that has arrived (waiting up to timeout seconds
+    for one), return True if the snapshot changed."""
+    def receive(self, timeout=0.0):
+
+        changed = False
+        while self.connected and select.select([self.connection], [], [],
+                timeout)[0]:
+
+            data = self.connection.recv(65536)
+            if not data:
+                self.connected = False
+                break
+            self.received += data
+            self.bytes_received += len(data)
+            timeout = 0.0
+
+            # Apply every whole tick in order, since each delta builds on the
+            # snapshot before it
+            start_time = perf_counter()
+            while (message := self.take_message()):
+
+                kind, payload = message
+                if kind == HELLO:
+                    self.read_settings(payload)
+                    continue
+
+                data = np.frombuffer(zlib.decompress(payload), np.uint8)
+                current = self.snapshot.view(np.uint8)
+                if kind == KEYFRAME:
+                    current[:] = data
+                    self.has_snapshot = True
+                elif kind == DELTA and self.has_snapshot:
+                    current ^= data
+
+                self.ticks_received += 1
+                changed = self.has_snapshot
+
+            self.decode_time += perf_counter() - start_time
+
+        return changed
+
+# ------------------------------------------------------------------------------
+# HELPER FUNCTIONS -------------------------------------------------------------
+# ------------------------------------------------------------------------------
+
+    """Remove a whole message from the received bytes and return its kind
+    and payload (or None if a whole message hasn't arrived yet)."""
+    def take_message(self):
+
+        if len(self.received) < message_header.size:
+            return None
+
+        kind, length = message_header.unpack_from(self.received)
+        end = message_header.size + length
+        if len(self.received) < end:
+            return None
+
+        payload = bytes(self.received[message_header.size:end])
+        del self.received[:end]
+        return kind, payload
+
+    """Lay out the game with the server's settings."""
+    def read_settings(self, payload):
+
+        self.settings = Settings()
+        stress_scales = json.loads(payload)["stress"]
+        if stress_scales:
+            self.settings.apply_stress(stress_scales)
+
+        self.snapshot = np.zeros(1, get_snapshot_dtype(self.settings))
+        self.has_snapshot = False
+
+    """Return the average bytes received per tick and the average ms spent
+    decoding each tick."""
+    def get_report(self):
+
+        return {"bytes_per_tick": self.bytes_received
+            / max(1, self.ticks_received),
+            "decode_ms": self.decode_time * 1000 / max(1, self.ticks_received)}
+
+    """Close the connection."""
+    def close(self):
+        self.connection.close()
+
+"""Open a window and draw a game streamed from a server until the window is
+closed or the server stops."""
+def watch(address):
+
+    # Import the renderer here, so the benchmark doesn't need a window
+    from renderer import Renderer
+
+    # Wait for the server's settings before opening the window
+    client = SpectatorClient(address)
+    while client.connected and not client.settings:
+        client.receive(timeout=0.1)
+    if not client.settings:
+        raise ConnectionError("Server closed the connection")
+
+    pygame.init()
+    renderer = Renderer(client.settings)
+    pygame.display.set_caption("Alien Invasion (spectating)")
+    mirror = create_mirror(client.settings)
+    renderer.attach(mirror)
+    clock = pygame.time.Clock()
+
+    while client.connected:
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN
+                    and event.key in (pygame.K_q, pygame.K_ESCAPE)):
+                client.connected = False
+
+        # Draw the latest tick whenever one arrives
+        if client.receive(timeout=0.005):
+            apply_snapshot(mirror, client.snapshot)
+            renderer.draw()
+        clock.tick(renderer.settings.max_fps)
+
+    print_report("Spectator", client.get_report(), client.ticks_received)
+    client.close()
+    pygame.quit()
+
+"""Print a bandwidth and timing report."""
+def print_report(name, report, ticks):
+
+    ticks_per_second = Settings().ticks_per_second
+    print(f"{name}: {ticks:,} ticks, {report['bytes_per_tick']:.1f} bytes per "
+        f"tick ({report['bytes_per_tick'] * ticks_per_second / 1000:.2f} "
+        f"kB/s at {ticks_per_second} ticks/s)", end="")
+    for key in ("encode_ms", "decode_ms"):
+        if key in report:
+            print(f", {report[key] * 1000:.1f} us to {key[:6]} each tick",
+                end="")
+    print()
+
+"""Stream a headless game played with random input to a spectator in this
+process, checking every snapshot arrives intact, and report bandwidth and
+timing."""
+def run_benchmark(address, ticks, seed):
+
+    from random import Random
+    from simulation import MOVE_LEFT, MOVE_RIGHT, FIRE
+
+    sim = Simulation()
+    server = SpectatorServer(sim, address)
+    client = SpectatorClient(address)
+    server.send_tick()
+    client.receive(timeout=1.0)
+    mirror = create_mirror(client.settings)
+    apply_time = 0.0
+
+    sim.start_round("hard", 800, seed)
+    rng = Random(seed)
+    actions = 0
+    for tick in range(ticks):
+
+        if tick % 30 == 0:
+            actions = rng.choice((MOVE_LEFT, MOVE_RIGHT, 0)) | FIRE
+        sim.step(actions)
+
+        # Start a new round whenever the game ends
+        if not sim.game_active:
+            sim.start_round("hard", 800, rng.getrandbits(32))
+
+        server.send_tick()
+        client.receive(timeout=1.0)
+        if client.snapshot.tobytes() != server.snapshot.tobytes():
+            raise AssertionError(f"Snapshot {tick} arrived changed")
+
+        start_time = perf_counter()
+        apply_snapshot(mirror, client.snapshot)
+        apply_time += perf_counter() - start_time
+
+    print_report("Server", server.get_report(), server.ticks_sent)
+    print_report("Spectator", client.get_report(), client.ticks_received)
+    print(f"Snapshots are {server.snapshot.nbytes} bytes before delta "
+        f"compression, and took {apply_time * 1e6 / ticks:.1f} us to apply "
+        "to the spectator's sprites each tick")
+
+    client.close()
+    server.close()
+
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Watch a game of Alien "
+        "Invasion streamed with alien_invasion.py --serve.")
+    parser.add_argument("address", nargs="?", default=default_address,
+        help=f"host:port or UNIX socket path (default {default_address})")
+    parser.add_argument("--benchmark", type=int, metavar="TICKS",
+        help="stream a headless game to this process for TICKS ticks and "
+        "report bandwidth and timing instead")
+    parser.add_argument("--seed", type=int, default=1,
+        help="seed for the benchmark's game (default 1)")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark(args.address, args.benchmark, args.seed)
+    else:
+        watch(args.address)
\ No newline at end of file
@@ -0,0 +1,152 @@
+# Author: Dakota Rubin
+# Date: October 18th, 2026
+# File: stress.py scales up Alien Invasion's fleet, projectiles and blocks to
+# find where the game can no longer hold 60 frames per second.
+
+import argparse, json, math
+
+from settings import Settings, stress_names
+
+# Levels a sweep multiplies settings by, until the frame budget is exceeded
+sweep_levels = (1, 1.5, 2, 3, 4, 6, 8, 12, 16, 24, 32)
+
+"""Combine fixed stress scales with a sweep level for the swept settings.
+
+Resolution grows with the square root of the level, so the screen's area
+(rather than its width) grows as fast as everything else."""
+def get_scales(scales, swept_names, level):
+
+    scales = dict(scales)
+    for name in swept_names:
+        factor = math.sqrt(level) if name == "resolution" else level
+        scales[name] = scales.get(name, 1) * factor
+
+    return scales
+
+"""Raise the sweep level until frame time crosses the budget (in ms), return
+the results for every level that was run."""
+def run_sweep(scales, swept_names, frames, budget):
+
+    # Import the benchmark last, since it sets up SDL's dummy drivers
+    from benchmark import run_scenario
+
+    results = []
+
+    for level in sweep_levels:
+
+        settings = Settings()
+        settings.apply_stress(get_scales(scales, swept_names, level))
+        result = run_scenario("max_bullets", settings, frames)
+        result["level"] = level
+        results.append(result)
+
+        entities = result["entities"]
+        print(f"level {level:>4}  {result['resolution'][0]}x"
+            f"{result['resolution'][1]}  {result['fleet_size']:>4} aliens  "
+            f"{entities['bullets']:>6.1f} bullets  "
+            f"{entities['alien_bullets']:>6.1f} alien bullets  "
+            f"{result['blocks']:>3} blocks  "
+            f"frame p95 {result['frame_ms']['p95']:.2f} ms")
+
+        if result["frame_ms"]["p95"] > budget:
+            break
+
+    return results
+
+"""Print the entity counts on both sides of the frame budget."""
+def report_breaking_point(results, budget):
+
+    print()
+
+    over_budget = results[-1]
+    if over_budget["frame_ms"]["p95"] <= budget:
+        print(f"Frame time stayed under {budget} ms up to level "
+            f"{over_budget['level']}.")
+        return
+
+    print(f"Frame time crossed {budget} ms at level {over_budget['level']}:")
+    print_entities(over_budget)
+
+    if len(results) > 1:
+        print(f"Last level under {budget} ms was level "
+            f"{results[-2]['level']}:")
+        print_entities(results[-2])
+
+"""Print the game objects a stress result ran with."""
+def print_entities(result):
+
+    entities = result["entities"]
+    width, height = result["resolution"]
+    print(f"    {width}x{height} screen, {result['fleet_size']} aliens "
+        f"({entities['aliens']} alive on average), "
+        f"{entities['bullets']} bullets, "
+        f"{entities['alien_bullets']} alien bullets, "
+        f"{entities['explosions']} explosions, {result['blocks']} blocks "
+        f"({entities['block_cells']} cells), "
+        f"frame p95 {result['frame_ms']['p95']} ms")
+
+"""Parse a NAME=FACTOR command line argument."""
+def parse_scale(text):
+
+    name, _, factor = text.partition("=")
+    if name not in stress_names:
+        raise argparse.ArgumentTypeError(f"unknown stress setting: {name}")
+
+    try:
+        factor = float(factor)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid factor for {name}: "
+            f"{factor}")
+    if not 0 < factor < math.inf:
+        raise argparse.ArgumentTypeError(f"factor for {name} must be "
+            f"positive, not {factor}")
+
+    return name, factor
+
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Stress test Alien Invasion.")
+    parser.add_argument("--config", metavar="FILE",
+        help="JSON file of fixed stress scales, like {\"shields\": 2}")
+    parser.add_argument("--scale", nargs="+", type=parse_scale, default=[],
+        metavar="NAME=FACTOR", help="fixed stress scales (override --config)")
+    parser.add_argument("--sweep", nargs="*", choices=stress_names,
+        default=["fleet_columns", "fleet_rows", "fire_rate", "bullets",
+        "shields"], help="settings to raise level by level")
+    parser.add_argument("--frames", type=int, default=300,
+        help="frames to time per level")
+    parser.add_argument("--budget", type=float, default=16.6,
+        help="frame time budget (ms)")
+    parser.add_argument("--play", action="store_true",
+        help="play the game with the fixed stress scales instead")
+    args = parser.parse_args()
+
+    scales = {}
+    if args.config:
+        with open(args.config) as file:
+            scales.update(json.load(file))
+    scales.update(args.scale)
+
+    # Scales the game can't run with (like a screen too small for the fleet)
+    # stop with an error instead of running on
+    try:
+
+        if args.play:
+
+            from alien_invasion import AlienInvasion
+            settings = Settings()
+            settings.apply_stress(scales)
+            game = AlienInvasion(settings=settings)
+            game.run_game()
+
+        else:
+
+            results = run_sweep(scales, args.sweep, args.frames, args.budget)
+            report_breaking_point(results, args.budget)
+
+    except ValueError as error:
+        parser.error(str(error))
\ No newline at end of file
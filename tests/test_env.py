@@ -0,0 +1,37 @@
+# Author: Dakota Rubin
+# Date: October 18th, 2026
+# File: test_env.py checks the Alien Invasion bot environment.
+
+import os, sys
+
+# Use SDL's dummy drivers, and run from src so asset paths resolve
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+source_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+    "..", "src")
+sys.path.insert(0, source_folder)
+os.chdir(source_folder)
+
+import numpy as np
+
+from env import AlienInvasionEnv
+
+"""Play a few steps of a seeded round in a new environment, close it and
+return the last observation."""
+def play_and_close():
+
+    env = AlienInvasionEnv(seed=1)
+    env.reset()
+    for action in range(8):
+        observation, _, _, _ = env.step(action)
+    env.close()
+
+    return observation
+
+"""An environment can be closed and another one made in the same process,
+and it plays the same seeded round."""
+def test_env_recreated_after_close():
+
+    first_observation = play_and_close()
+    second_observation = play_and_close()
+    assert np.array_equal(first_observation, second_observation)
\ No newline at end of file
@@ -0,0 +1,53 @@
+# Author: Dakota Rubin
+# Date: October 18th, 2026
+# File: test_replay.py checks recording and replaying Alien Invasion rounds.
+
+import os, sys
+
+# Use SDL's dummy drivers, and run from src so asset paths resolve
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+source_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+    "..", "src")
+sys.path.insert(0, source_folder)
+os.chdir(source_folder)
+
+from settings import Settings
+from simulation import Simulation, MOVE_LEFT, MOVE_RIGHT, FIRE
+from replay import (Recorder, load_replay, get_replay_settings, play_replay,
+    check_replay)
+
+"""Record a round played with the given seed until the game is over, moving
+back and forth and firing."""
+def record_round(recorder, seed):
+
+    sim = Simulation(Settings())
+    sim.start_round("hard", 800, seed)
+    recorder.start("hard", 800, seed)
+
+    tick = 0
+    while sim.game_active:
+        actions = FIRE | (MOVE_RIGHT if tick % 120 < 60 else MOVE_LEFT)
+        sim.step(actions)
+        recorder.record(actions)
+        tick += 1
+
+    recorder.save(sim.stats)
+
+"""Every round recorded to a file is kept, and each one replays to the stats
+it ended with."""
+def test_every_round_recorded(tmp_path):
+
+    path = tmp_path / "rounds.replay"
+    recorder = Recorder(path)
+    for seed in (1, 2):
+        record_round(recorder, seed)
+
+    rounds = load_replay(path)
+    assert [header["seed"] for header, _ in rounds] == [1, 2]
+
+    for header, actions in rounds:
+        assert len(actions) == header["ticks"]
+        sim = Simulation(get_replay_settings(header))
+        play_replay(sim, header, actions)
+        assert check_replay(sim, header)
\ No newline at end of file
@@ -0,0 +1,102 @@
+# Author: Dakota Rubin
+# Date: October 18th, 2026
+# File: test_simulation.py checks the Alien Invasion game rules headlessly.
+
+import os, sys
+
+import pytest
+
+# Use SDL's dummy drivers, and run from src so asset paths resolve
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+source_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+    "..", "src")
+sys.path.insert(0, source_folder)
+os.chdir(source_folder)
+
+from settings import Settings
+from simulation import Simulation
+from batch import BatchSimulation, PLAYING, LIFE_LOST
+
+"""Return a simulation on level 1 with only the last alien left, a bullet
+about to hit it and an alien bullet about to hit the ship."""
+def create_last_alien_sim():
+
+    settings = Settings()
+    settings.pixel_collisions = False
+    sim = Simulation(settings)
+    sim.start_round("medium", 1000, seed=1)
+
+    last_alien = sim.fleet.aliens[-1]
+    for alien in sim.fleet.aliens[:-1]:
+        sim.remove_alien(alien)
+
+    bullet = sim.bullets.acquire()
+    bullet.fire(sim.fleet.get_rect(last_alien.index))
+    alien_bullet = sim.alien_bullets.acquire()
+    alien_bullet.fire(sim.ship.rect.move(0, -sim.ship.rect.height))
+
+    return sim
+
+"""Destroying the last alien on the same tick the ship is hit still goes up
+a level once the lost life pause is over."""
+def test_level_cleared_on_ship_hit_tick():
+
+    sim = create_last_alien_sim()
+    alien_speed = sim.settings.alien_speed
+
+    sim.step()
+    assert sim.state == "life_lost"
+    assert not sim.aliens
+    assert sim.stats.ships_left == sim.settings.ship_limit - 1
+
+    sim.step(ticks=sim.get_ticks(sim.settings.life_lost_time))
+    assert sim.state == "playing"
+    assert sim.stats.level == 2
+    assert sim.settings.alien_speed > alien_speed
+    assert len(sim.aliens) == len(sim.fleet.aliens)
+
+"""The batch engine goes up a level in the same case."""
+def test_batch_level_cleared_on_ship_hit_tick():
+
+    batch = BatchSimulation(1, seed=1)
+    batch.start_round("medium", 1000)
+    alien_speed = batch.alien_speed[0]
+
+    # Leave only the last alien, with a bullet inside it, and an alien
+    # bullet inside the ship
+    last_alien = batch.fleet_size - 1
+    batch.alive[0] = False
+    batch.alive[0, last_alien] = True
+    batch.alien_count[0] = 1
+    batch.update_extents(batch.alive.any(axis=1))
+
+    batch.bullet_active[0, 0] = True
+    batch.bullet_x[0, 0] = int(batch.alien_x[last_alien]) + (
+        batch.alien_width // 2)
+    batch.bullet_y[0, 0] = batch.alien_y[last_alien] + batch.alien_height
+    batch.alien_bullet_active[0, 0] = True
+    batch.alien_bullet_x[0, 0] = batch.ship_left[0] + (batch.ship_width // 2)
+    batch.alien_bullet_y[0, 0] = batch.ship_y - batch.bullet_height
+
+    batch.step()
+    assert batch.state[0] == LIFE_LOST
+    assert batch.alien_count[0] == 0
+
+    batch.step(ticks=batch.life_lost_ticks)
+    assert batch.state[0] == PLAYING
+    assert batch.level[0] == 2
+    assert batch.alien_speed[0] > alien_speed
+    assert batch.alien_count[0] == batch.fleet_size
+
+"""Stress scales that aren't positive, or leave no room for a row of aliens,
+are rejected instead of starting a round."""
+def test_bad_stress_scales_rejected():
+
+    with pytest.raises(ValueError):
+        Settings().apply_stress({"bullets": 0})
+
+    settings = Settings()
+    settings.apply_stress({"resolution": 0.5})
+    with pytest.raises(ValueError):
+        Simulation(settings).start_round("medium", 1000, seed=1)
\ No newline at end of file